@@ -0,0 +1,95 @@
+"""Model decoding benchmark.
+
+Decodes a synthetic list response with many items, once into
+``ResourceListResponse`` dataclasses and once into the lazily decoded
+``ResourceListView``, and reports wall time and peak traced memory for each.
+
+Usage:
+
+    python benchmarks/bench_decode.py [--items 100000] [--json]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from davybot_market_cli import _json
+from davybot_market_cli.models import ResourceListResponse, ResourceListView
+
+
+def make_listing(count: int) -> bytes:
+    """Build a list response body with ``count`` resources."""
+    items = [
+        {
+            "id": f"res-{i:06d}",
+            "name": f"resource-{i}",
+            "type": ("skill", "agent", "mcp", "knowledge")[i % 4],
+            "description": "Synthetic resource used for decoding benchmarks",
+            "author": f"author-{i % 97}",
+            "version": f"1.{i % 10}.{i % 7}",
+            "tags": ["bench", f"tag-{i % 13}", f"tag-{i % 31}"],
+            "metadata": {"license": "MIT"},
+            "downloads": i * 3,
+            "rating": (i % 50) / 10,
+            "created_at": "2025-01-22T10:00:00Z",
+            "updated_at": "2025-02-01T08:30:00Z",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"items": items, "total": count, "page": 1, "page_size": count}).encode()
+
+
+def decode_eager(raw: bytes) -> float:
+    """Decode into dataclasses and rank by rating."""
+    response = ResourceListResponse.from_dict(json.loads(raw))
+    return sum(item.rating for item in response.items)
+
+
+def decode_lazy(raw: bytes) -> float:
+    """Decode into lazy views and rank by rating."""
+    response = ResourceListView.from_json(raw)
+    return sum(item.rating for item in response.items)
+
+
+def measure(fn: Callable[[bytes], Any], raw: bytes) -> dict[str, float]:
+    """Time one decoder and record its peak traced allocation."""
+    start = time.perf_counter()
+    fn(raw)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(seconds, 4), "peak_mib": round(peak / 2**20, 2)}
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="Items in the listing")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    raw = make_listing(args.items)
+    results = {
+        "items": args.items,
+        "body_mib": round(len(raw) / 2**20, 2),
+        "decoder": "orjson" if _json.orjson is not None else "json",
+        "eager": measure(decode_eager, raw),
+        "lazy": measure(decode_lazy, raw),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{results['items']} items, {results['body_mib']} MiB body, {results['decoder']}")
+    for name in ("eager", "lazy"):
+        stats = results[name]
+        print(f"  {name:6} {stats['seconds']:8.3f} s  peak {stats['peak_mib']:8.2f} MiB")  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Import-time benchmark for the CLI and SDK.
+
+Measures the wall-clock latency of fresh interpreter processes running
+``davy --version``, ``davy --help`` and ``import davybot_market_cli``, and
+reports which heavy dependencies each one loaded.
+
+Usage:
+
+    python benchmarks/bench_import.py [--runs 20] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("httpx", "pydantic", "rich", "questionary")
+
+CASES = {
+    "davy --version": "from davybot_market_cli.cli import cli; cli(['--version'])",
+    "davy --help": "from davybot_market_cli.cli import cli; cli(['--help'])",
+    "import davybot_market_cli": "import davybot_market_cli",
+}
+
+_PROBE = (
+    "import sys\n"
+    "try:\n"
+    "    exec({code!r})\n"
+    "except SystemExit:\n"
+    "    pass\n"
+    "print('\\n' + ','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)\n"
+)
+
+
+def measure(code: str, runs: int) -> dict[str, object]:
+    """Time a snippet in fresh interpreters.
+
+    Args:
+        code: Python source to run
+        runs: Number of processes to start
+
+    Returns:
+        Latency statistics in milliseconds and the heavy modules loaded
+    """
+    script = _PROBE.format(code=code, heavy=HEAVY_MODULES)
+    samples = []
+    loaded = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        loaded = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+    baseline = [sys.executable, "-c", "pass"]
+    start = time.perf_counter()
+    subprocess.run(baseline, check=True)
+    interpreter_ms = (time.perf_counter() - start) * 1000
+    return {
+        "min_ms": round(min(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "interpreter_ms": round(interpreter_ms, 2),
+        "heavy_modules": [m for m in loaded.split(",") if m],
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Processes per case")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = {name: measure(code, args.runs) for name, code in CASES.items()}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, stats in results.items():
+        heavy = ", ".join(stats["heavy_modules"]) or "none"  # type: ignore[arg-type]
+        print(
+            f"{name:28} min {stats['min_ms']:7.1f} ms  median {stats['median_ms']:7.1f} ms"
+            f"  (bare interpreter {stats['interpreter_ms']:.1f} ms; heavy modules: {heavy})"
+        )
+
+
+if __name__ == "__main__":
+    main()
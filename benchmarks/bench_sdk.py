@@ -0,0 +1,237 @@
+"""SDK micro-benchmark suite with stored baselines.
+
+Every case runs in-process against an ``httpx.MockTransport``, so results do
+not depend on a network or a market deployment. Each case is repeated and the
+fastest repetition is kept, which makes the numbers stable enough to compare
+against ``benchmarks/baselines.json``.
+
+Cases:
+
+    request_overhead   client call + routing + error handling + JSON decoding
+    parse_response     _parse_json_response on a 1000-item listing
+    decode_models      ResourceListResponse.from_dict on the same listing
+    decode_views       ResourceListView.from_json on the same listing
+    parse_uri          parse_resource_uri on a mix of URI forms
+    download_stream    streaming a large archive to disk via client.download
+    publish_pack       collect_files + create_resource request encoding
+
+Usage:
+
+    python benchmarks/bench_sdk.py                   # compare with baselines
+    python benchmarks/bench_sdk.py --save-baseline   # record new baselines
+    python benchmarks/bench_sdk.py --quick --json    # small inputs, JSON output
+
+Exits with status 1 when a case is slower than its baseline by more than
+``--threshold``. Baselines are host-specific: record them on the machine that
+runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.models import ResourceListResponse, ResourceListView
+from davybot_market_cli.utils import collect_files, parse_resource_uri
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+
+def make_listing(count: int) -> bytes:
+    """Build a list response body with ``count`` resources."""
+    items = [
+        {
+            "id": f"res-{i:06d}",
+            "name": f"resource-{i}",
+            "type": ("skill", "agent", "mcp", "knowledge")[i % 4],
+            "description": "Synthetic resource used for benchmarks",
+            "author": f"author-{i % 97}",
+            "version": f"1.{i % 10}.{i % 7}",
+            "tags": ["bench", f"tag-{i % 13}"],
+            "metadata": {"license": "MIT"},
+            "downloads": i * 3,
+            "rating": (i % 50) / 10,
+            "created_at": "2025-01-22T10:00:00Z",
+            "updated_at": "2025-02-01T08:30:00Z",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"items": items, "total": count, "page": 1, "page_size": count}).encode()
+
+
+def mock_market(listing: bytes, archive: bytes) -> httpx.MockTransport:
+    """Serve fixed bodies: archives for downloads, echo sizes for publishes."""
+    resource = json.dumps({"id": "s1", "name": "web-scraper", "version": "1.0.0"}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/download"):
+            return httpx.Response(200, content=archive)
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "new", "bytes": len(request.content)})
+        if path.endswith("/skills"):
+            return httpx.Response(200, content=listing)
+        return httpx.Response(200, content=resource)
+
+    return httpx.MockTransport(handler)
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> float:
+    """Run ``fn`` ``repeat`` times and return the fastest run in seconds.
+
+    Garbage collection is paused while timing, as ``timeit`` does.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run_suite(quick: bool = False, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Run every case.
+
+    Args:
+        quick: Use small inputs (for smoke tests)
+        repeat: Repetitions per case
+
+    Returns:
+        Dict of case name to {'seconds': fastest run, 'per_op_us' or 'mib_per_s': rate}
+    """
+    calls = 200 if quick else 2000
+    items = 100 if quick else 1000
+    archive_mib = 4 if quick else 64
+    publish_files = 20 if quick else 200
+
+    listing = make_listing(items)
+    archive = bytes(range(256)) * (archive_mib * 4096)
+    transport = mock_market(listing, archive)
+    listing_response = httpx.Response(200, content=listing)
+    uris = ["skill://web-scraper", "agent:data-analyst", "abc123-def456", "mcp://a/b"] * (calls * 2)
+    results: dict[str, dict[str, float]] = {}
+
+    def per_op(name: str, fn: Callable[[], Any], ops: int) -> None:
+        seconds = timed(fn, repeat)
+        results[name] = {"seconds": seconds, "per_op_us": seconds / ops * 1e6}
+
+    def throughput(name: str, fn: Callable[[], Any], size: int) -> None:
+        seconds = timed(fn, repeat)
+        results[name] = {"seconds": seconds, "mib_per_s": size / 2**20 / seconds}
+
+    with DavybotMarketClient(base_url="http://bench/api/v1", transport=transport) as client:
+        per_op("request_overhead", lambda: [client.get_skill("s1") for _ in range(calls)], calls)
+        per_op(
+            "parse_response",
+            lambda: [client._parse_json_response(listing_response) for _ in range(10)],
+            10 * items,
+        )
+        per_op(
+            "decode_models",
+            lambda: [ResourceListResponse.from_dict(json.loads(listing)) for _ in range(10)],
+            10 * items,
+        )
+        per_op(
+            "decode_views",
+            lambda: [list(ResourceListView.from_json(listing).items) for _ in range(10)],
+            10 * items,
+        )
+        per_op("parse_uri", lambda: [parse_resource_uri(uri) for uri in uris], len(uris))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "archive.zip"
+            throughput(
+                "download_stream",
+                lambda: client.download("skill", "s1", target),
+                len(archive),
+            )
+
+            tree = Path(tmp) / "resource"
+            for i in range(publish_files):
+                path = tree / f"dir-{i % 10}" / f"file-{i}.md"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(f"# File {i}\n" + "lorem ipsum dolor sit amet\n" * 150)
+            tree_size = sum(p.stat().st_size for p in tree.rglob("*") if p.is_file())
+            throughput(
+                "publish_pack",
+                lambda: client.create_skill("bench", collect_files(tree), tags=["bench"]),
+                tree_size,
+            )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]], baselines: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    """List cases that got slower than their baseline by more than ``threshold``."""
+    return [
+        name
+        for name, stats in results.items()
+        if name in baselines and stats["seconds"] > baselines[name]["seconds"] * (1 + threshold)
+    ]
+
+
+def main() -> None:
+    """Run the suite, compare with baselines and report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Use small inputs")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per case")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as baseline")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_suite(quick=args.quick, repeat=args.repeat)
+    baselines: dict[str, dict[str, float]] = {}
+    if args.baseline.exists() and not args.quick:
+        baselines = json.loads(args.baseline.read_text())
+    regressions = compare(results, baselines, args.threshold)
+
+    if args.save_baseline:
+        rounded = {
+            name: {key: round(value, 6) for key, value in stats.items()}
+            for name, stats in results.items()
+        }
+        args.baseline.write_text(json.dumps(rounded, indent=2) + "\n")
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, indent=2))
+    else:
+        for name, stats in results.items():
+            rate = (
+                f"{stats['per_op_us']:10.2f} us/op"
+                if "per_op_us" in stats
+                else f"{stats['mib_per_s']:10.1f} MiB/s"
+            )
+            change = ""
+            if name in baselines:
+                ratio = stats["seconds"] / baselines[name]["seconds"] - 1
+                change = f"  {ratio:+7.1%} vs baseline"
+                if name in regressions:
+                    change += "  REGRESSION"
+            print(f"  {name:18} {stats['seconds'] * 1000:9.2f} ms  {rate}{change}")
+        if args.save_baseline:
+            print(f"Saved baselines to {args.baseline}")
+
+    if regressions and not args.save_baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Catalog snapshot benchmark.
+
+Writes a synthetic catalog once as JSON and once as a binary snapshot, then
+compares loading and querying each in a fresh process: parsing the JSON
+listing versus memory-mapping the snapshot. Reports wall time and the
+resident memory the load added.
+
+Usage:
+
+    python benchmarks/bench_snapshot.py [--items 100000] [--json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from davybot_market_cli.snapshot import write_snapshot
+
+# Resident memory is read from /proc (Linux): ru_maxrss is inherited from the
+# parent process, which holds the whole synthetic catalog.
+PROBE = """
+import json, os, sys, time
+def rss_kib():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+before = rss_kib()
+start = time.perf_counter()
+if sys.argv[1] == "json":
+    with open(sys.argv[2], "rb") as f:
+        items = json.load(f)["items"]
+    top = max((i for i in items if i["type"] == "skill"), key=lambda i: i["downloads"])["name"]
+else:
+    from davybot_market_cli.snapshot import CatalogSnapshot
+    snapshot = CatalogSnapshot.open(sys.argv[2])
+    top = snapshot.query(resource_type="skill", sort_by="downloads", limit=1)[0].name
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "rss_kib": rss_kib() - before, "top": top}))
+"""
+
+
+def make_items(count: int) -> list[dict[str, object]]:
+    """Build ``count`` synthetic resources."""
+    return [
+        {
+            "id": f"res-{i:06d}",
+            "name": f"resource-{i}",
+            "type": ("skill", "agent", "mcp", "knowledge")[i % 4],
+            "author": f"author-{i % 97}",
+            "version": f"1.{i % 10}.{i % 7}",
+            "tags": ["bench", f"tag-{i % 13}", f"tag-{i % 31}"],
+            "downloads": (i * 7919) % 100_003,
+            "rating": (i % 50) / 10,
+        }
+        for i in range(count)
+    ]
+
+
+def probe(kind: str, path: Path) -> dict[str, object]:
+    """Load and query one file in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, kind, str(path)], capture_output=True, text=True, check=True
+    )
+    stats: dict[str, object] = json.loads(result.stdout)
+    return stats
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="Resources in the catalog")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    with tempfile.TemporaryDirectory() as tmp:
+        listing = Path(tmp) / "catalog.json"
+        listing.write_text(json.dumps({"items": items}))
+        snapshot = write_snapshot(items, Path(tmp) / "catalog.snap")
+        results = {
+            "items": args.items,
+            "json": {"mib": round(listing.stat().st_size / 2**20, 2), **probe("json", listing)},
+            "snapshot": {
+                "mib": round(snapshot.stat().st_size / 2**20, 2),
+                **probe("snapshot", snapshot),
+            },
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{results['items']} resources, top skill by downloads")
+    for name in ("json", "snapshot"):
+        stats = results[name]
+        print(
+            f"  {name:9} {stats['mib']:7.2f} MiB file  {stats['seconds'] * 1000:9.2f} ms"  # type: ignore[index]
+            f"  +{stats['rss_kib'] / 1024:7.2f} MiB RSS"  # type: ignore[index]
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,129 @@
 """DavyBot Market - CLI and SDK for AI Agent Resources."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-# SDK Client
-from .client import DavybotMarketClient
+# Public names are imported from their submodule on first access, so that
+# ``import davybot_market_cli`` (and every CLI invocation) does not pay for
+# httpx or pydantic until they are actually used.
+_LAZY_IMPORTS: dict[str, str] = {
+    # SDK Client
+    "DavybotMarketClient": ".client",
+    # Data Models
+    "Resource": ".models",
+    "Skill": ".models",
+    "Agent": ".models",
+    "McpServer": ".models",
+    "KnowledgeBase": ".models",
+    "Rating": ".models",
+    "AverageRating": ".models",
+    "Review": ".models",
+    "SearchResult": ".models",
+    "ResourceListResponse": ".models",
+    "ResourceView": ".models",
+    "SearchResultView": ".models",
+    "ResourceListView": ".models",
+    # Exceptions
+    "DavybotMarketError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "APIError": ".exceptions",
+    "ConnectionError": ".exceptions",
+    "DownloadError": ".exceptions",
+    "InstallError": ".exceptions",
+    "ResolutionError": ".exceptions",
+    "SnapshotError": ".exceptions",
+    "CassetteError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    # Shared Types
+    "AnalyticsEvent": ".types",
+    "SystemMetrics": ".types",
+    "AnalyticsSettings": ".types",
+    "AnalyticsSummary": ".types",
+    "FeedbackType": ".types",
+    "FeedbackStatus": ".types",
+    "Feedback": ".types",
+    "FeedbackResponse": ".types",
+    "FeedbackListResponse": ".types",
+    "SyncConfiguration": ".types",
+    "SyncStatus": ".types",
+    "SyncConflict": ".types",
+}
+
+if TYPE_CHECKING:
+    # SDK Client
+    from .client import DavybotMarketClient
+
+    # Data Models
+    from .models import (
+        Resource,
+        Skill,
+        Agent,
+        McpServer,
+        KnowledgeBase,
+        Rating,
+        AverageRating,
+        Review,
+        SearchResult,
+        ResourceListResponse,
+        ResourceView,
+        SearchResultView,
+        ResourceListView,
+    )
+
+    # Exceptions
+    from .exceptions import (
+        DavybotMarketError,
+        AuthenticationError,
+        NotFoundError,
+        ValidationError,
+        APIError,
+        ConnectionError,
+        DownloadError,
+        InstallError,
+        ResolutionError,
+        SnapshotError,
+        CassetteError,
+        RateLimitError,
+    )
+
+    # Shared Types
+    from .types import (
+        # Analytics
+        AnalyticsEvent,
+        SystemMetrics,
+        AnalyticsSettings,
+        AnalyticsSummary,
+        # Feedback
+        FeedbackType,
+        FeedbackStatus,
+        Feedback,
+        FeedbackResponse,
+        FeedbackListResponse,
+        # Sync
+        SyncConfiguration,
+        SyncStatus,
+        SyncConflict,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Data Models
-from .models import (
-    Resource,
-    Skill,
-    Agent,
-    McpServer,
-    KnowledgeBase,
-    Rating,
-    AverageRating,
-    Review,
-    SearchResult,
-    ResourceListResponse,
-)
 
-# Exceptions
-from .exceptions import (
-    DavybotMarketError,
-    AuthenticationError,
-    NotFoundError,
-    ValidationError,
-    APIError,
-    ConnectionError,
-    DownloadError,
-)
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
 
-# Shared Types
-from .types import (
-    # Analytics
-    AnalyticsEvent,
-    SystemMetrics,
-    AnalyticsSettings,
-    AnalyticsSummary,
-    # Feedback
-    FeedbackType,
-    FeedbackStatus,
-    Feedback,
-    FeedbackResponse,
-    FeedbackListResponse,
-    # Sync
-    SyncConfiguration,
-    SyncStatus,
-    SyncConflict,
-)
 
 __all__ = [
     # SDK Client
@@ -63,6 +139,9 @@ __all__ = [
     "Review",
     "SearchResult",
     "ResourceListResponse",
+    "ResourceView",
+    "SearchResultView",
+    "ResourceListView",
     # Exceptions
     "DavybotMarketError",
     "AuthenticationError",
@@ -71,6 +150,11 @@ __all__ = [
     "APIError",
     "ConnectionError",
     "DownloadError",
+    "InstallError",
+    "ResolutionError",
+    "SnapshotError",
+    "CassetteError",
+    "RateLimitError",
     # Shared Types - Analytics
     "AnalyticsEvent",
     "SystemMetrics",
@@ -0,0 +1,44 @@
+"""JSON decoding with an optional fast path.
+
+``orjson`` is used when installed (``pip install davybot-market-cli[fast]``);
+otherwise the standard library decoder is used. Both accept bytes directly, so
+response bodies never need to be decoded to ``str`` first.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return bytes(orjson.dumps(value))
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,226 @@
+"""Incremental decoding of the item array in a JSON response.
+
+:class:`ArrayItemParser` is fed the body chunk by chunk and returns each
+element of the top-level ``items``/``results`` array (or of a top-level array)
+as soon as it has fully arrived. Only the text of the element being received
+is buffered, so peak memory is about one item rather than the whole page. The
+other top-level fields (``total``, ``page``, ...) are collected into
+:attr:`ArrayItemParser.fields` once the body is complete.
+
+Up to the array, the scanner only tracks strings and nesting depth. Elements
+are decoded by the C scanner behind :meth:`json.JSONDecoder.raw_decode`.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+DEFAULT_KEYS = ("items", "results")
+
+# Characters that change the scanner state outside strings
+_STRUCTURE = re.compile(r'["{}\[\],]')
+# Characters that may end a string
+_STRING = re.compile(r'["\\]')
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = ",]" + _WHITESPACE
+
+_PREFIX, _ARRAY, _SUFFIX = range(3)
+
+
+def _skip_space(text: str, pos: int) -> int:
+    """Index of the first non-whitespace character at or after ``pos``."""
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+class ArrayItemParser:
+    """Push parser yielding the elements of a response's item array.
+
+    Attributes:
+        fields: Top-level fields other than the streamed array (after :meth:`close`)
+    """
+
+    def __init__(self, keys: Iterable[str] = DEFAULT_KEYS):
+        """Initialize the parser.
+
+        Args:
+            keys: Names of the top-level array to stream
+        """
+        self.keys = set(keys)
+        self.fields: dict[str, Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._text = ""
+        self._pos = 0
+        self._phase = _PREFIX
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key = ""
+        # "" for a bare array, None until an array is found
+        self._streamed_key: str | None = None
+        # Buffer length below which a failed element decode is not retried
+        self._retry_at = 0
+        # Document text outside the streamed array, for the other fields
+        self._outside: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add body bytes.
+
+        Args:
+            chunk: Next bytes of the body
+
+        Returns:
+            Elements completed by this chunk
+        """
+        self._text += self._decoder.decode(chunk)
+        items: list[Any] = []
+        if self._phase == _PREFIX:
+            self._scan_prefix()
+        if self._phase == _ARRAY:
+            self._scan_array(items, final=False)
+        if self._phase == _SUFFIX:
+            self._outside.append(self._text)
+            self._text = ""
+        return items
+
+    def close(self) -> list[Any]:
+        """Finish parsing and decode the remaining top-level fields.
+
+        Returns:
+            Elements still pending at the end of the body
+
+        Raises:
+            ValueError: If the body is incomplete or malformed
+        """
+        self._text += self._decoder.decode(b"", final=True)
+        items: list[Any] = []
+        if self._phase == _PREFIX:
+            self._scan_prefix()
+        if self._phase == _ARRAY:
+            self._scan_array(items, final=True)
+        if self._phase == _ARRAY or self._in_string:
+            raise ValueError("Truncated JSON document")
+        document = "".join(self._outside) + self._text
+        self._outside, self._text = [], ""
+        if self._streamed_key == "":
+            if document.strip(_WHITESPACE) != "[]":
+                raise ValueError("Unexpected data after JSON array")
+            return items
+        parsed = json.loads(document)
+        if isinstance(parsed, dict):
+            self.fields = {k: v for k, v in parsed.items() if k != self._streamed_key}
+        return items
+
+    def _scan_prefix(self) -> None:
+        """Scan up to the opening bracket of the streamed array."""
+        text = self._text
+        if self._depth == 0 and not self._in_string:
+            start = _skip_space(text, self._pos)
+            if start < len(text) and text[start] == "[":
+                # A bare array is streamed itself
+                self._enter_array("", start + 1)
+                return
+        while True:
+            if self._in_string:
+                match = _STRING.search(text, self._pos)
+                if match is None:
+                    self._pos = len(text)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(text):
+                        # The escaped character has not arrived yet
+                        self._pos = match.start()
+                        break
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 1:
+                    self._last_key = text[self._string_start + 1 : match.start()]
+                continue
+
+            match = _STRUCTURE.search(text, self._pos)
+            if match is None:
+                self._pos = len(text)
+                break
+            char = match.group()
+            self._pos = match.end()
+            if char == '"':
+                self._in_string = True
+                self._string_start = match.start()
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._depth == 2 and self._last_key in self.keys:
+                    self._enter_array(self._last_key, self._pos)
+                    return
+            elif char in "}]":
+                self._depth -= 1
+
+        # Keep only an unfinished string, which may be the key of the array
+        keep = self._string_start if self._in_string else self._pos
+        self._outside.append(text[:keep])
+        self._text = text[keep:]
+        self._pos -= keep
+        self._string_start -= keep
+
+    def _enter_array(self, key: str, start: int) -> None:
+        """Switch to streaming the array whose first element starts at ``start``."""
+        self._streamed_key = key
+        self._phase = _ARRAY
+        self._outside.append(self._text[:start])
+        self._text = self._text[start:]
+        self._pos = 0
+        self._retry_at = 0
+
+    def _scan_array(self, items: list[Any], final: bool) -> None:
+        """Decode every complete element in the buffer."""
+        text = self._text
+        if not final and len(text) < self._retry_at:
+            return
+        pos = _skip_space(text, 0)
+        while pos < len(text):
+            char = text[pos]
+            if char == "]":
+                self._phase = _SUFFIX
+                break
+            if char == ",":
+                pos = _skip_space(text, pos + 1)
+                continue
+            try:
+                value, end = self._json.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # A number or literal is complete only once a delimiter follows it
+            if not isinstance(value, (dict, list, str)) and (
+                end == len(text) or text[end] not in _DELIMITERS
+            ):
+                if final:
+                    raise ValueError("Malformed JSON array element")
+                break
+            items.append(value)
+            pos = _skip_space(text, end)
+        self._text = text[pos:]
+        # Retry a partial element once the buffer has doubled, to stay linear
+        self._retry_at = 2 * len(self._text)
+
+
+def iter_items(chunks: Iterable[bytes], parser: ArrayItemParser | None = None) -> Iterator[Any]:
+    """Yield the elements of a response's item array as its bytes arrive.
+
+    Args:
+        chunks: Body chunks, e.g. ``response.iter_bytes()``
+        parser: Parser to use, so callers can read its ``fields`` afterwards
+
+    Yields:
+        Decoded elements, in order
+    """
+    parser = parser or ArrayItemParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
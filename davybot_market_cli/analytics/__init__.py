@@ -0,0 +1,17 @@
+"""Client-side analytics: sampling, batched delivery and streaming aggregation of events."""
+
+from .aggregate import AnalyticsAggregator, HyperLogLog, SpaceSaving
+from .emitter import AnalyticsEmitter, default_spill_path, encode_event
+from .sampling import SampledEmitter, SamplingPolicy, SamplingRule
+
+__all__ = [
+    "AnalyticsAggregator",
+    "AnalyticsEmitter",
+    "HyperLogLog",
+    "SampledEmitter",
+    "SamplingPolicy",
+    "SamplingRule",
+    "SpaceSaving",
+    "default_spill_path",
+    "encode_event",
+]
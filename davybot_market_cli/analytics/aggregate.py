@@ -0,0 +1,315 @@
+"""Streaming aggregation of analytics events into an AnalyticsSummary.
+
+:class:`AnalyticsAggregator` folds events in one at a time and keeps only
+fixed-size state:
+
+- unique sessions are estimated with a :class:`HyperLogLog` sketch
+  (16 KiB, about 0.8% standard error at the default precision);
+- the most frequent event types are tracked with a :class:`SpaceSaving`
+  heavy-hitters sketch;
+- session durations are taken from the first and last event of each session,
+  keeping at most ``max_open_sessions`` sessions open and folding the least
+  recently active into a running mean. The spans of up to
+  ``max_closed_sessions`` folded sessions are kept too, so a session that
+  becomes active again extends its duration instead of counting as a new,
+  shorter session; beyond that bound the mean undercounts long sessions.
+
+Events thinned out by :mod:`~davybot_market_cli.analytics.sampling` are
+weighted back up: a ``rollup`` event counts as the events it summarizes, a
+sampled event as ``1 / sampleRate`` events, and an event also covered by a
+roll-up (``rolledUp``) only for its session.
+
+Aggregators (and both sketches) built by separate workers combine with
+``merge``; they pickle, so they can be returned from worker processes::
+
+    totals = AnalyticsAggregator()
+    for partial in pool.map(aggregate_file, paths):
+        totals.merge(partial)
+    summary = totals.summary()
+"""
+
+import hashlib
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..types.analytics import AnalyticsEvent, AnalyticsSummary
+
+DEFAULT_PRECISION = 14
+DEFAULT_HEAVY_HITTERS = 64
+DEFAULT_OPEN_SESSIONS = 10_000
+DEFAULT_CLOSED_SESSIONS = 100_000
+ERROR_EVENT_TYPES = frozenset({"error"})
+ROLLUP_EVENT_TYPE = "rollup"
+
+_MASK64 = (1 << 64) - 1
+_INVERSE_POWERS = [2.0**-i for i in range(66)]
+
+
+def hash64(value: str) -> int:
+    """Stable 64-bit hash of a string (identical across processes)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class HyperLogLog:
+    """HyperLogLog cardinality sketch with ``2 ** precision`` registers."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        """Initialize an empty sketch.
+
+        Args:
+            precision: Register index bits (4-18); error is about 1.04 / sqrt(2 ** precision)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        """Add a value."""
+        self.add_hash(hash64(value))
+
+    def add_hash(self, hashed: int) -> None:
+        """Add a value by its :func:`hash64`."""
+        p = self.precision
+        index = hashed >> (64 - p)
+        rest = (hashed << p) & _MASK64
+        rank = 64 - rest.bit_length() + 1 if rest else 64 - p + 1
+        self.registers[index] = max(self.registers[index], rank)
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(_INVERSE_POWERS[r] for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Add every value counted by ``other``."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitters sketch tracking at most ``capacity`` keys.
+
+    Counts are upper bounds; a key's count overestimates its true frequency
+    by at most the smallest tracked count at the time it was admitted.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HEAVY_HITTERS):
+        """Initialize an empty sketch.
+
+        Args:
+            capacity: Maximum keys tracked
+        """
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Count ``key``."""
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+        elif len(counts) < self.capacity:
+            counts[key] = count
+        else:
+            victim = min(counts, key=counts.__getitem__)
+            counts[key] = counts.pop(victim) + count
+
+    def top(self, n: int | None = None) -> dict[str, int]:
+        """The ``n`` most frequent keys with their counts, most frequent first."""
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return dict(ranked[:n] if n is not None else ranked)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Combine with a sketch built from other events."""
+        # A key missing from a full sketch may have occurred up to its minimum count
+        own_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+        merged = {
+            key: self.counts.get(key, own_floor) + other.counts.get(key, other_floor)
+            for key in self.counts.keys() | other.counts.keys()
+        }
+        self.counts = self.top_of(merged, self.capacity)
+
+    @staticmethod
+    def top_of(counts: dict[str, int], n: int) -> dict[str, int]:
+        """Keep the ``n`` largest counts."""
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:n])
+
+
+def _weight(event_type: str, data: dict[str, Any] | None) -> tuple[str, int]:
+    """The event type an event counts towards and how many events it stands for."""
+    if not data:
+        return event_type, 1
+    if event_type == ROLLUP_EVENT_TYPE and "eventType" in data:
+        return data["eventType"], int(data.get("count", 1))
+    if data.get("rolledUp"):
+        return event_type, 0
+    rate = data.get("sampleRate")
+    if rate:
+        return event_type, round(1 / rate)
+    return event_type, 1
+
+
+def _timestamp(value: str) -> float | None:
+    """Seconds since the epoch for an ISO 8601 timestamp, or None if malformed."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+class AnalyticsAggregator:
+    """Bounded-memory, mergeable aggregation of analytics events.
+
+    Attributes:
+        total: Events added
+        errors: Error events added
+    """
+
+    def __init__(
+        self,
+        precision: int = DEFAULT_PRECISION,
+        heavy_hitters: int = DEFAULT_HEAVY_HITTERS,
+        max_open_sessions: int = DEFAULT_OPEN_SESSIONS,
+        max_closed_sessions: int = DEFAULT_CLOSED_SESSIONS,
+        error_types: Iterable[str] = ERROR_EVENT_TYPES,
+    ):
+        """Initialize an empty aggregator.
+
+        Args:
+            precision: HyperLogLog precision for unique sessions
+            heavy_hitters: Event types tracked for topEvents
+            max_open_sessions: Sessions whose first/last timestamps are kept
+            max_closed_sessions: Folded sessions whose timestamps are kept, so they
+                can be reopened
+            error_types: Event types counted as errors
+        """
+        self.sessions = HyperLogLog(precision)
+        self.events = SpaceSaving(heavy_hitters)
+        self.max_open_sessions = max_open_sessions
+        self.max_closed_sessions = max_closed_sessions
+        self.error_types = frozenset(error_types)
+        self.total = 0
+        self.errors = 0
+        # session -> (first, last) timestamps, least recently active first
+        self._open: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        # Sessions folded into the running mean, least recently closed first
+        self._closed: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._closed_duration = 0.0
+        self._closed_sessions = 0
+
+    def add(self, event: "AnalyticsEvent | dict[str, Any]") -> None:
+        """Fold one event into the aggregate."""
+        if isinstance(event, dict):
+            event_type, session, stamp = event["eventType"], event["sessionId"], event["timestamp"]
+            data = event.get("data")
+        else:
+            event_type, session, stamp = event.eventType, event.sessionId, event.timestamp
+            data = event.data
+        rollup = event_type == ROLLUP_EVENT_TYPE
+        event_type, weight = _weight(event_type, data)
+        if weight:
+            self.total += weight
+            self.events.add(event_type, weight)
+            if event_type in self.error_types:
+                self.errors += weight
+
+        # A roll-up is stamped with its window start, not when the session was active
+        when = None if rollup else _timestamp(stamp)
+        span = self._open.get(session) or self._reopen(session)
+        if span is None:
+            self.sessions.add(session)
+            if when is None:
+                return
+            span = (when, when)
+        elif when is not None:
+            span = (min(span[0], when), max(span[1], when))
+        self._open[session] = span
+        self._open.move_to_end(session)
+        if len(self._open) > self.max_open_sessions:
+            self._close_oldest()
+
+    def add_many(self, events: Iterable["AnalyticsEvent | dict[str, Any]"]) -> None:
+        """Fold several events into the aggregate."""
+        for event in events:
+            self.add(event)
+
+    def _close_oldest(self) -> None:
+        session, span = self._open.popitem(last=False)
+        self._close(session, span)
+
+    def _close(self, session: str, span: tuple[float, float]) -> None:
+        """Fold a session into the running mean, remembering its span."""
+        self._closed_duration += span[1] - span[0]
+        self._closed_sessions += 1
+        self._closed[session] = span
+        if len(self._closed) > self.max_closed_sessions:
+            self._closed.popitem(last=False)
+
+    def _reopen(self, session: str) -> tuple[float, float] | None:
+        """Take a closed session back out of the running mean, returning its span."""
+        span = self._closed.pop(session, None)
+        if span is not None:
+            self._closed_duration -= span[1] - span[0]
+            self._closed_sessions -= 1
+        return span
+
+    def merge(self, other: "AnalyticsAggregator") -> None:
+        """Combine with an aggregator built from other events."""
+        self.total += other.total
+        self.errors += other.errors
+        self.sessions.merge(other.sessions)
+        self.events.merge(other.events)
+        # Sessions other has forgotten are added as they are; remembered ones are
+        # combined with the same session seen here
+        self._closed_duration += other._closed_duration - sum(
+            last - first for first, last in other._closed.values()
+        )
+        self._closed_sessions += other._closed_sessions - len(other._closed)
+        for session, (first, last) in other._closed.items():
+            span = self._open.get(session)
+            if span is not None:
+                self._open[session] = (min(span[0], first), max(span[1], last))
+                continue
+            span = self._reopen(session)
+            self._close(
+                session, (min(span[0], first), max(span[1], last)) if span else (first, last)
+            )
+        for session, (first, last) in other._open.items():
+            span = self._open.get(session) or self._reopen(session)
+            self._open[session] = (
+                (min(span[0], first), max(span[1], last)) if span else (first, last)
+            )
+        while len(self._open) > self.max_open_sessions:
+            self._close_oldest()
+
+    def summary(self, top: int = 10) -> "AnalyticsSummary":
+        """Build the summary of everything added so far.
+
+        Args:
+            top: Number of event types reported in topEvents
+
+        Returns:
+            AnalyticsSummary
+        """
+        from ..types.analytics import AnalyticsSummary
+
+        durations = self._closed_duration + sum(last - first for first, last in self._open.values())
+        sessions = self._closed_sessions + len(self._open)
+        return AnalyticsSummary(
+            totalEvents=self.total,
+            uniqueSessions=self.sessions.count() if self.total else 0,
+            topEvents=self.events.top(top),
+            errorRate=self.errors / self.total if self.total else 0.0,
+            avgSessionDuration=durations / sessions if sessions else None,
+        )
@@ -0,0 +1,306 @@
+"""Batched, compressed delivery of analytics events.
+
+:class:`AnalyticsEmitter` never blocks the caller: :meth:`~AnalyticsEmitter.emit`
+puts the event on a bounded queue and returns, dropping the event if the queue
+is full. A background thread sends queued events in gzip-compressed batches,
+once ``batch_size`` events are waiting or ``flush_interval`` seconds have
+passed. While the backend is unreachable, batches are appended to a local
+spill file and sent after the next successful batch::
+
+    with AnalyticsEmitter(client) as emitter:
+        emitter.emit(AnalyticsEvent(eventType="install", timestamp=now, sessionId=sid))
+
+``emit`` is safe to call from any thread and from async code.
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from ..exceptions import DavybotMarketError
+
+if TYPE_CHECKING:
+    from ..client import DavybotMarketClient
+    from ..types.analytics import AnalyticsEvent
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_MAX_SPILL_BYTES = 16 * 2**20
+# Wait between delivery attempts while the backend is down, doubling up to the maximum
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+logger = logging.getLogger(__name__)
+
+Sender = Callable[[Sequence[dict[str, Any]]], Any]
+
+
+def default_spill_path() -> Path:
+    """Default spill file, in the cache directory."""
+    from ..utils import get_cache_dir
+
+    return get_cache_dir() / "analytics" / "spill.jsonl.gz"
+
+
+def encode_event(event: "AnalyticsEvent | dict[str, Any]") -> dict[str, Any]:
+    """Convert an event to the JSON object sent to the API."""
+    if isinstance(event, dict):
+        return event
+    return event.model_dump(exclude_none=True)
+
+
+class AnalyticsEmitter:
+    """Buffer analytics events and send them in the background.
+
+    Attributes:
+        stats: Counters: emitted, sent, batches, dropped, spilled, failures
+    """
+
+    def __init__(
+        self,
+        client: "DavybotMarketClient | None" = None,
+        send: Sender | None = None,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        spill_path: Path | None = None,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+    ):
+        """Initialize the emitter (the background thread starts on first use).
+
+        Args:
+            client: Open market client; batches go to its ``send_analytics_events``
+            send: Callable that delivers a batch, used instead of ``client``
+            max_queue: Events buffered before new ones are dropped
+            batch_size: Events per request
+            flush_interval: Maximum seconds an event waits before being sent
+            spill_path: Append-only file for batches that could not be sent
+                (default: :func:`default_spill_path`)
+            max_spill_bytes: Spill file size above which failed batches are dropped
+        """
+        if send is None:
+            if client is None:
+                raise ValueError("AnalyticsEmitter needs a client or a send callable")
+            send = client.send_analytics_events
+        self._send = send
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path or default_spill_path()
+        self.max_spill_bytes = max_spill_bytes
+        self.stats = {
+            "emitted": 0,
+            "sent": 0,
+            "batches": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "failures": 0,
+        }
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flushed = threading.Condition(self._lock)
+        self._flushes_requested = 0
+        self._flushes_done = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._retry_at = 0.0
+        self._retry_delay = RETRY_DELAY
+
+    def __enter__(self) -> Self:
+        """Start the background thread."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Send what is buffered and stop."""
+        self.close()
+
+    def start(self) -> None:
+        """Start the background thread if it is not running."""
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="davybot-analytics", daemon=True
+                )
+                self._thread.start()
+
+    def emit(self, event: "AnalyticsEvent | dict[str, Any]") -> bool:
+        """Queue an event without blocking.
+
+        Args:
+            event: AnalyticsEvent or its encoded dict
+
+        Returns:
+            False if the event was dropped because the queue is full or the
+            emitter is closed
+
+        Raises:
+            TypeError: If the event data cannot be encoded as JSON
+            ValueError: If the event data cannot be encoded as JSON
+        """
+        encoded = encode_event(event)
+        # Bad data fails here, in the caller's thread, rather than in the sender
+        json.dumps(encoded, separators=(",", ":"))
+        if self._thread is None:
+            self.start()
+        with self._lock:
+            self.stats["emitted"] += 1
+            if self._closed:
+                self.stats["dropped"] += 1
+                return False
+            try:
+                self._queue.put_nowait(encoded)
+            except queue.Full:
+                self.stats["dropped"] += 1
+                return False
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_requested.set()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything queued so far and wait for it.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the flush finished in time
+        """
+        self.start()
+        with self._lock:
+            if self._closed:
+                return True
+            self._flushes_requested += 1
+            target = self._flushes_requested
+            self._flush_requested.set()
+            return self._flushed.wait_for(lambda: self._flushes_done >= target, timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Flush buffered events and stop the background thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the final flush
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._flush_requested.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """Collect batches and deliver them until closed."""
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            # Flushes requested before this point cover events queued before draining
+            with self._lock:
+                closing = self._closed
+                requested = self._flushes_requested
+            self._drain()
+            with self._lock:
+                self._flushes_done = max(self._flushes_done, requested)
+                self._flushed.notify_all()
+            if closing:
+                return
+
+    def _drain(self) -> None:
+        """Send every queued event, batch by batch."""
+        while True:
+            batch: list[dict[str, Any]] = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._deliver(batch)
+
+    def _deliver(self, batch: list[dict[str, Any]]) -> None:
+        """Send one batch, spilling it if the backend is unavailable."""
+        if time.monotonic() < self._retry_at:
+            self._spill(batch)
+            return
+        try:
+            self._send(batch)
+        except (DavybotMarketError, httpx.HTTPError, OSError):
+            with self._lock:
+                self.stats["failures"] += 1
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, MAX_RETRY_DELAY)
+            self._spill(batch)
+            return
+        except Exception:
+            # Not an outage (e.g. a closed client): retrying the batch would fail again
+            logger.exception("Dropping a batch of %d analytics events", len(batch))
+            with self._lock:
+                self.stats["failures"] += 1
+                self.stats["dropped"] += len(batch)
+            return
+        with self._lock:
+            self.stats["sent"] += len(batch)
+            self.stats["batches"] += 1
+        self._retry_delay = RETRY_DELAY
+        self._retry_at = 0.0
+        self._resend_spill()
+
+    def _spill(self, batch: list[dict[str, Any]]) -> None:
+        """Append a batch to the spill file, or drop it if the file is full."""
+        try:
+            size = self.spill_path.stat().st_size if self.spill_path.exists() else 0
+            if size >= self.max_spill_bytes:
+                raise OSError("spill file is full")
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # Each append is a separate gzip member; readers see one stream
+            with gzip.open(self.spill_path, "at", encoding="utf-8") as f:
+                f.writelines(json.dumps(event, separators=(",", ":")) + "\n" for event in batch)
+        except OSError:
+            with self._lock:
+                self.stats["dropped"] += len(batch)
+            return
+        with self._lock:
+            self.stats["spilled"] += len(batch)
+
+    def _resend_spill(self) -> None:
+        """Send spilled events after the backend has come back."""
+        if not self.spill_path.exists():
+            return
+        # Take the file over so concurrent spills start a new one
+        sending = self.spill_path.with_name(self.spill_path.name + ".sending")
+        try:
+            os.replace(self.spill_path, sending)
+            with gzip.open(sending, "rt", encoding="utf-8") as f:
+                events = [json.loads(line) for line in f if line.strip()]
+        except (OSError, EOFError, ValueError):
+            sending.unlink(missing_ok=True)
+            return
+        sending.unlink(missing_ok=True)
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            try:
+                self._send(batch)
+            except Exception:
+                # Spilled events were valid when queued, so keep them whatever the error
+                logger.exception("Could not resend spilled analytics events")
+                with self._lock:
+                    self.stats["failures"] += 1
+                self._retry_at = time.monotonic() + self._retry_delay
+                for rest in range(start, len(events), self.batch_size):
+                    self._spill(events[rest : rest + self.batch_size])
+                return
+            with self._lock:
+                self.stats["sent"] += len(batch)
+                self.stats["batches"] += 1
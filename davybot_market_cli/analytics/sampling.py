@@ -0,0 +1,307 @@
+"""Sampling and local roll-ups for high-volume analytics events.
+
+A :class:`SamplingPolicy` maps each ``eventType`` to a :class:`SamplingRule`:
+
+- ``rate`` is the fraction of events sent; kept events carry
+  ``data["sampleRate"]`` so totals can be re-weighted;
+- ``keep_above`` is a tail-keep rule: events whose ``data[measure]`` reaches it
+  (slow operations, large payloads) are always sent;
+- ``rollup`` counts every event, sent or not, into per-window counters keyed
+  by ``dimensions`` (values from ``data``). Each closed window becomes one
+  ``rollup`` event with the count, sum and maximum of the measure; events of
+  that type still sent individually are marked ``rolledUp`` so they are not
+  counted twice.
+
+:meth:`SamplingPolicy.from_settings` derives the policy from the user's
+:class:`~davybot_market_cli.types.analytics.AnalyticsSettings`, and
+:class:`SampledEmitter` applies it in front of an
+:class:`~davybot_market_cli.analytics.emitter.AnalyticsEmitter`::
+
+    policy = SamplingPolicy.from_settings(settings)
+    recorder = SampledEmitter(emitter, policy)
+    recorder.record(event)
+"""
+
+import random
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Self
+
+from .aggregate import ERROR_EVENT_TYPES, ROLLUP_EVENT_TYPE
+from .emitter import AnalyticsEmitter, encode_event
+
+if TYPE_CHECKING:
+    from ..types.analytics import AnalyticsEvent, AnalyticsSettings
+
+PERFORMANCE_EVENT_TYPES = frozenset({"performance"})
+# Event types emitted often enough to be rolled up rather than sent one by one
+HIGH_VOLUME_EVENT_TYPES = frozenset({"feature_use"})
+DEFAULT_WINDOW = 60.0
+
+
+@dataclass(frozen=True)
+class SamplingRule:
+    """How events of one type are sampled and rolled up.
+
+    Attributes:
+        rate: Fraction of events sent (0 sends none, 1 sends all)
+        keep_above: Always send events whose ``data[measure]`` is at least this
+        measure: Numeric ``data`` field used by ``keep_above`` and roll-up sums
+        rollup: Count every event into per-window counters
+        dimensions: ``data`` fields that split roll-up counters
+    """
+
+    rate: float = 1.0
+    keep_above: float | None = None
+    measure: str = "duration"
+    rollup: bool = False
+    dimensions: tuple[str, ...] = ()
+
+
+KEEP = SamplingRule()
+DROP = SamplingRule(rate=0.0)
+
+
+class SamplingPolicy:
+    """Sampling rules by event type."""
+
+    def __init__(
+        self,
+        rules: Mapping[str, SamplingRule] | None = None,
+        default: SamplingRule = KEEP,
+        window: float = DEFAULT_WINDOW,
+    ):
+        """Initialize the policy.
+
+        Args:
+            rules: Rule per event type
+            default: Rule for event types without one
+            window: Roll-up window in seconds
+        """
+        self.rules = dict(rules or {})
+        self.default = default
+        self.window = window
+
+    def rule_for(self, event_type: str) -> SamplingRule:
+        """The rule that applies to ``event_type``."""
+        return self.rules.get(event_type, self.default)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: "AnalyticsSettings",
+        high_volume: Iterable[str] = HIGH_VOLUME_EVENT_TYPES,
+        sample_rate: float = 0.01,
+        slow_threshold: float = 1000.0,
+        window: float = DEFAULT_WINDOW,
+    ) -> "SamplingPolicy":
+        """Derive a policy from the user's analytics settings.
+
+        - ``enabled`` off, or a category switched off, drops those events.
+        - ``errorReporting`` sends every error event.
+        - ``usageTracking`` rolls high-volume usage events up into counters.
+          With ``performanceMonitoring`` on, a ``sample_rate`` fraction of
+          them is also sent individually, along with every event slower than
+          ``slow_threshold`` (``data["duration"]``, ms).
+        - ``performanceMonitoring`` sends performance events with the same
+          sampling and tail-keep rule; off, they are dropped.
+
+        Args:
+            settings: AnalyticsSettings
+            high_volume: Event types to roll up
+            sample_rate: Fraction of high-volume and performance events sent
+            slow_threshold: Measure at or above which events are always sent
+            window: Roll-up window in seconds
+
+        Returns:
+            SamplingPolicy
+        """
+        if not settings.enabled:
+            return cls(default=DROP, window=window)
+        detailed = settings.performanceMonitoring
+        rules: dict[str, SamplingRule] = {}
+        for event_type in ERROR_EVENT_TYPES:
+            rules[event_type] = KEEP if settings.errorReporting else DROP
+        for event_type in PERFORMANCE_EVENT_TYPES:
+            rules[event_type] = (
+                SamplingRule(rate=sample_rate, keep_above=slow_threshold, rollup=True)
+                if detailed
+                else DROP
+            )
+        for event_type in high_volume:
+            if not settings.usageTracking:
+                rules[event_type] = DROP
+            elif detailed:
+                rules[event_type] = SamplingRule(
+                    rate=sample_rate,
+                    keep_above=slow_threshold,
+                    rollup=True,
+                    dimensions=("feature", "action"),
+                )
+            else:
+                rules[event_type] = SamplingRule(
+                    rate=0.0, rollup=True, dimensions=("feature", "action")
+                )
+        return cls(rules, default=KEEP if settings.usageTracking else DROP, window=window)
+
+
+class Rollups:
+    """Per-window counters for rolled-up events."""
+
+    def __init__(self, window: float = DEFAULT_WINDOW):
+        """Initialize empty counters.
+
+        Args:
+            window: Window length in seconds
+        """
+        self.window = window
+        self._current = -1
+        # (window, eventType, sessionId, dimensions) -> [count, sum, max]
+        self._counters: dict[tuple[int, str, str, tuple[Any, ...]], list[float]] = {}
+
+    def add(
+        self,
+        now: float,
+        event_type: str,
+        session_id: str,
+        dimensions: tuple[Any, ...],
+        value: float | None,
+    ) -> None:
+        """Count one event."""
+        key = (int(now // self.window), event_type, session_id, dimensions)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = [0, 0.0, float("-inf")]
+        counter[0] += 1
+        if value is not None:
+            counter[1] += value
+            counter[2] = max(counter[2], value)
+
+    def expire(self, now: float, rules: SamplingPolicy) -> list[dict[str, Any]]:
+        """Turn counters of windows that ended before ``now`` into roll-up events."""
+        current = int(now // self.window)
+        if current == self._current:
+            return []
+        self._current = current
+        closed = [key for key in self._counters if key[0] < current]
+        return [self._event(key, self._counters.pop(key), rules) for key in closed]
+
+    def drain(self, rules: SamplingPolicy) -> list[dict[str, Any]]:
+        """Turn every counter into a roll-up event."""
+        events = [self._event(key, counter, rules) for key, counter in self._counters.items()]
+        self._counters.clear()
+        return events
+
+    def _event(
+        self,
+        key: tuple[int, str, str, tuple[Any, ...]],
+        counter: list[float],
+        rules: SamplingPolicy,
+    ) -> dict[str, Any]:
+        window, event_type, session_id, values = key
+        rule = rules.rule_for(event_type)
+        count, total, peak = counter
+        data: dict[str, Any] = {
+            "eventType": event_type,
+            "count": int(count),
+            "windowSeconds": self.window,
+            "dimensions": dict(zip(rule.dimensions, values)),
+        }
+        if peak != float("-inf"):
+            data[rule.measure] = {"sum": total, "max": peak}
+        started = datetime.fromtimestamp(window * self.window, UTC)
+        return {
+            "eventType": ROLLUP_EVENT_TYPE,
+            "timestamp": started.isoformat().replace("+00:00", "Z"),
+            "sessionId": session_id,
+            "data": data,
+        }
+
+
+class SampledEmitter:
+    """Apply a sampling policy and roll-ups in front of an AnalyticsEmitter.
+
+    Attributes:
+        stats: Counters: recorded, sent, sampled_out, rolled_up
+    """
+
+    def __init__(self, emitter: AnalyticsEmitter, policy: SamplingPolicy, seed: int | None = None):
+        """Initialize the recorder.
+
+        Args:
+            emitter: Emitter that sends kept events and roll-ups
+            policy: Sampling policy
+            seed: Seed for sampling decisions (for tests)
+        """
+        self.emitter = emitter
+        self.policy = policy
+        self.rollups = Rollups(policy.window)
+        self.stats = {"recorded": 0, "sent": 0, "sampled_out": 0, "rolled_up": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def record(self, event: "AnalyticsEvent | dict[str, Any]") -> bool:
+        """Sample, roll up and forward one event.
+
+        Returns:
+            True if the event itself was queued for sending
+        """
+        encoded = encode_event(event)
+        event_type = encoded["eventType"]
+        rule = self.policy.rule_for(event_type)
+        data = encoded.get("data") or {}
+        value = data.get(rule.measure)
+        measure = float(value) if isinstance(value, (int, float)) else None
+        now = time.time()
+
+        with self._lock:
+            self.stats["recorded"] += 1
+            if rule.rollup:
+                dims = tuple(data.get(name) for name in rule.dimensions)
+                self.rollups.add(now, event_type, encoded["sessionId"], dims, measure)
+                self.stats["rolled_up"] += 1
+            expired = self.rollups.expire(now, self.policy)
+            keep = rule.rate >= 1.0 or (
+                rule.keep_above is not None and measure is not None and measure >= rule.keep_above
+            )
+            if not keep and rule.rate > 0:
+                keep = self._random.random() < rule.rate
+                if keep and not rule.rollup:
+                    encoded = {**encoded, "data": {**data, "sampleRate": rule.rate}}
+            if keep and rule.rollup:
+                encoded = {**encoded, "data": {**data, "rolledUp": True}}
+            self.stats["sent" if keep else "sampled_out"] += 1
+
+        for rollup in expired:
+            self.emitter.emit(rollup)
+        if keep:
+            return self.emitter.emit(encoded)
+        return False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send open roll-up windows and flush the emitter."""
+        with self._lock:
+            pending = self.rollups.drain(self.policy)
+        for rollup in pending:
+            self.emitter.emit(rollup)
+        return self.emitter.flush(timeout)
+
+    def close(self) -> None:
+        """Send open roll-up windows and close the emitter."""
+        with self._lock:
+            pending = self.rollups.drain(self.policy)
+        for rollup in pending:
+            self.emitter.emit(rollup)
+        self.emitter.close()
+
+    def __enter__(self) -> Self:
+        """Start the emitter."""
+        self.emitter.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Send pending roll-ups and close the emitter."""
+        self.close()
@@ -0,0 +1,208 @@
+"""Search-as-you-type with debouncing, stale-request cancellation and a prefix cache.
+
+:class:`Autocomplete` is meant to be called on every keystroke:
+
+- a query answered before, or narrowing a query whose complete result set is
+  cached (``total`` no larger than the results fetched), is answered at once
+  by filtering the cached results locally, without a request;
+- otherwise the request is debounced: the first keystroke after a pause is
+  sent immediately, later keystrokes in a burst wait ``debounce`` seconds;
+- every call takes a new generation number; a call overtaken by a newer
+  keystroke returns None, and in async code its request is cancelled::
+
+    completer = Autocomplete(client)
+    async def on_change(text: str) -> None:
+        result = await completer.acomplete(text)
+        if result is not None:
+            picker.show(result["results"])
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+DEFAULT_DEBOUNCE = 0.1
+DEFAULT_LIMIT = 20
+# Results requested per query; totals up to this size can be narrowed locally
+DEFAULT_FETCH_SIZE = 50
+DEFAULT_CACHE_SIZE = 256
+
+
+def normalize(query: str) -> str:
+    """Cache key form of a query: lower case with single spaces."""
+    return " ".join(query.lower().split())
+
+
+def matches(resource: dict[str, Any], terms: list[str]) -> bool:
+    """Whether every term occurs in a resource's name, description or tags."""
+    text = " ".join(
+        [
+            str(resource.get("name") or ""),
+            str(resource.get("description") or ""),
+            *map(str, resource.get("tags") or ()),
+        ]
+    ).lower()
+    return all(term in text for term in terms)
+
+
+class Autocomplete:
+    """Debounced, cached search for interactive pickers.
+
+    Attributes:
+        stats: Counters: requests, cached (answered locally), stale (superseded)
+    """
+
+    def __init__(
+        self,
+        client: "DavybotMarketClient",
+        resource_type: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+        debounce: float = DEFAULT_DEBOUNCE,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize the completer.
+
+        Args:
+            client: Open market client (async context for :meth:`acomplete`)
+            resource_type: Optional resource type filter
+            limit: Results returned per keystroke
+            debounce: Seconds to wait for more keystrokes during a burst
+            fetch_size: Results requested from the API per query
+            cache_size: Queries kept in the prefix cache
+        """
+        self.client = client
+        self.resource_type = resource_type
+        self.limit = limit
+        self.debounce = debounce
+        self.fetch_size = max(fetch_size, limit)
+        self.cache_size = cache_size
+        self.stats = {"requests": 0, "cached": 0, "stale": 0}
+        # normalized query -> (results, total), least recently used first
+        self._cache: OrderedDict[str, tuple[list[dict[str, Any]], int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._last_keystroke = float("-inf")
+        self._task: asyncio.Future[dict[str, Any]] | None = None
+
+    def _keystroke(self) -> tuple[int, float]:
+        """Start a new generation; return it and how long to debounce."""
+        with self._lock:
+            self._generation += 1
+            now = time.monotonic()
+            in_burst = now - self._last_keystroke < self.debounce
+            self._last_keystroke = now
+            return self._generation, self.debounce if in_burst else 0.0
+
+    def _current(self, generation: int) -> bool:
+        with self._lock:
+            if generation == self._generation:
+                return True
+            self.stats["stale"] += 1
+            return False
+
+    def lookup(self, query: str) -> dict[str, Any] | None:
+        """Answer a query from the cache, if possible.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Search results with 'results' and 'total' keys, or None on a miss
+        """
+        key = normalize(query)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                results, total = self._cache[key]
+                self.stats["cached"] += 1
+                return {"results": results[: self.limit], "total": total}
+            # The longest cached prefix whose result set is complete
+            for end in range(len(key) - 1, 0, -1):
+                entry = self._cache.get(key[:end])
+                if entry is not None and entry[1] <= len(entry[0]):
+                    terms = key.split()
+                    narrowed = [r for r in entry[0] if matches(r, terms)]
+                    self._store(key, narrowed, len(narrowed))
+                    self.stats["cached"] += 1
+                    return {"results": narrowed[: self.limit], "total": len(narrowed)}
+        return None
+
+    def _store(self, key: str, results: list[dict[str, Any]], total: int) -> None:
+        """Cache a result set (the lock must be held)."""
+        self._cache[key] = (results, total)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _remember(self, query: str, response: dict[str, Any]) -> dict[str, Any]:
+        results = response.get("results", [])
+        total = response.get("total", len(results))
+        with self._lock:
+            self.stats["requests"] += 1
+            self._store(normalize(query), results, total)
+        return {"results": results[: self.limit], "total": total}
+
+    def complete(self, query: str) -> dict[str, Any] | None:
+        """Results for the query typed so far (blocking).
+
+        Args:
+            query: Current input
+
+        Returns:
+            Search results with 'results' and 'total' keys, or None if a newer
+            keystroke superseded this one
+        """
+        generation, delay = self._keystroke()
+        if not normalize(query):
+            return {"results": [], "total": 0}
+        cached = self.lookup(query)
+        if cached is not None:
+            return cached
+        if delay:
+            time.sleep(delay)
+            if not self._current(generation):
+                return None
+        response = self.client.search(query, self.resource_type, limit=self.fetch_size)
+        result = self._remember(query, response)
+        return result if self._current(generation) else None
+
+    async def acomplete(self, query: str) -> dict[str, Any] | None:
+        """Results for the query typed so far; cancels the request of an older keystroke.
+
+        Args:
+            query: Current input
+
+        Returns:
+            Search results with 'results' and 'total' keys, or None if a newer
+            keystroke superseded this one
+        """
+        generation, delay = self._keystroke()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        if not normalize(query):
+            return {"results": [], "total": 0}
+        cached = self.lookup(query)
+        if cached is not None:
+            return cached
+        if delay:
+            await asyncio.sleep(delay)
+            if not self._current(generation):
+                return None
+        task = self._task = asyncio.ensure_future(
+            self.client.asearch(query, self.resource_type, limit=self.fetch_size)
+        )
+        try:
+            response = await task
+        except asyncio.CancelledError:
+            # Cancelled by a newer keystroke, rather than by our caller
+            if task.cancelled() and not self._current(generation):
+                return None
+            raise
+        result = self._remember(query, response)
+        return result if self._current(generation) else None
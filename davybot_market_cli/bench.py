@@ -0,0 +1,240 @@
+"""Latency benchmark for a market endpoint.
+
+Runs a weighted mix of ``search``, ``get_resource``, ``list`` and ``download``
+calls through the async client at a fixed concurrency and reports throughput
+and latency percentiles per operation. Used by ``davy bench``.
+"""
+
+import asyncio
+import math
+import random
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .client import DavybotMarketClient
+from .exceptions import DavybotMarketError
+
+OPERATIONS = ("search", "get_resource", "list", "download")
+DEFAULT_MIX = {"search": 4.0, "get_resource": 4.0, "list": 1.0, "download": 1.0}
+PERCENTILES = {"p50": 0.50, "p90": 0.90, "p99": 0.99, "p999": 0.999}
+RESOURCE_TYPES = ("skill", "agent", "mcp", "knowledge")
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse an operation mix such as ``search=4,get_resource=4,download=1``.
+
+    Args:
+        spec: Comma-separated ``operation=weight`` pairs
+
+    Returns:
+        Dict of operation to weight
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is not positive
+    """
+    mix: dict[str, float] = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; use one of {', '.join(OPERATIONS)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for {name}: {weight!r}") from None
+        if mix[name] <= 0:
+            raise ValueError(f"Weight for {name} must be positive")
+    if not mix:
+        raise ValueError("The operation mix is empty")
+    return mix
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(fraction * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class OperationStats:
+    """Latencies and errors of one operation."""
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        """Number of calls, failed ones included."""
+        return len(self.latencies) + self.errors
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the latencies in milliseconds."""
+        values = sorted(self.latencies)
+        summary: dict[str, Any] = {"count": self.count, "errors": self.errors}
+        if values:
+            summary["mean_ms"] = round(sum(values) / len(values) * 1000, 3)
+            summary["min_ms"] = round(values[0] * 1000, 3)
+            for name, fraction in PERCENTILES.items():
+                summary[f"{name}_ms"] = round(percentile(values, fraction) * 1000, 3)
+            summary["max_ms"] = round(values[-1] * 1000, 3)
+        return summary
+
+
+@dataclass
+class BenchResult:
+    """Outcome of one benchmark run."""
+
+    base_url: str
+    concurrency: int
+    mix: dict[str, float]
+    elapsed: float
+    operations: dict[str, OperationStats]
+
+    @property
+    def total(self) -> OperationStats:
+        """All operations combined."""
+        combined = OperationStats("total")
+        for stats in self.operations.values():
+            combined.latencies.extend(stats.latencies)
+            combined.errors += stats.errors
+        return combined
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second."""
+        return self.total.count / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "base_url": self.base_url,
+            "concurrency": self.concurrency,
+            "mix": self.mix,
+            "requests": self.total.count,
+            "elapsed_s": round(self.elapsed, 4),
+            "throughput_rps": round(self.throughput, 2),
+            "total": self.total.summary(),
+            "operations": {name: stats.summary() for name, stats in self.operations.items()},
+        }
+
+
+async def _load_targets(client: DavybotMarketClient, page_size: int = 100) -> list[tuple[str, str]]:
+    """Collect (type, id) pairs to fetch and download."""
+    pages = await asyncio.gather(
+        *(client.alist_resources(t, 0, page_size) for t in RESOURCE_TYPES),
+        return_exceptions=True,
+    )
+    return [
+        (resource_type, str(item["id"]))
+        for resource_type, page in zip(RESOURCE_TYPES, pages)
+        if isinstance(page, dict)
+        for item in page.get("items") or []
+        if item.get("id")
+    ]
+
+
+async def run_benchmark(
+    base_url: str,
+    mix: dict[str, float] | None = None,
+    requests: int = 1000,
+    concurrency: int = 16,
+    warmup: int = 0,
+    query: str = "resource",
+    seed: int = 0,
+    api_key: str | None = None,
+    timeout: float = 30.0,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> BenchResult:
+    """Benchmark a market endpoint.
+
+    Args:
+        base_url: API base URL
+        mix: Operation weights (default: :data:`DEFAULT_MIX`)
+        requests: Number of measured calls
+        concurrency: Number of calls in flight at once
+        warmup: Unmeasured calls made first, to open connections
+        query: Search query
+        seed: Seed for the operation schedule
+        api_key: Optional API key
+        timeout: Request timeout in seconds
+        transport: Async transport to send requests through, e.g. a cassette
+            :class:`~davybot_market_cli.transport.ReplayTransport`
+
+    Returns:
+        BenchResult
+
+    Raises:
+        DavybotMarketError: If the mix needs resources and the market lists none
+    """
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    names = list(mix)
+    schedule = [
+        (name, rng.random())
+        for name in rng.choices(names, weights=[mix[n] for n in names], k=warmup + requests)
+    ]
+    operations = {name: OperationStats(name) for name in names}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with DavybotMarketClient(
+        base_url=base_url,
+        api_key=api_key,
+        timeout=timeout,
+        limits=limits,
+        async_transport=transport,
+    ) as client:
+        targets = await _load_targets(client)
+        if not targets and {"get_resource", "download"} & set(mix):
+            raise DavybotMarketError("The market lists no resources to fetch or download")
+
+        with tempfile.TemporaryDirectory(prefix="davy-bench-") as tmp:
+
+            async def call(name: str, pick: float, worker: int) -> None:
+                if name == "search":
+                    await client.asearch(query)
+                elif name == "list":
+                    await client.alist_resources(RESOURCE_TYPES[int(pick * 4)], 0, 20)
+                else:
+                    resource_type, resource_id = targets[int(pick * len(targets))]
+                    if name == "get_resource":
+                        await client.aget_resource(resource_type, resource_id)
+                    else:
+                        await client.adownload(
+                            resource_type, resource_id, Path(tmp) / f"{worker}.zip"
+                        )
+
+            async def worker(index: int, calls: Any, record: bool) -> None:
+                for name, pick in calls:
+                    started = time.perf_counter()
+                    try:
+                        await call(name, pick, index)
+                    except (DavybotMarketError, httpx.HTTPError):
+                        if record:
+                            operations[name].errors += 1
+                        continue
+                    if record:
+                        operations[name].latencies.append(time.perf_counter() - started)
+
+            warmup_calls = iter(schedule[:warmup])
+            await asyncio.gather(*(worker(i, warmup_calls, False) for i in range(concurrency)))
+
+            measured_calls = iter(schedule[warmup:])
+            started = time.perf_counter()
+            await asyncio.gather(*(worker(i, measured_calls, True) for i in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+    return BenchResult(
+        base_url=base_url,
+        concurrency=concurrency,
+        mix=mix,
+        elapsed=elapsed,
+        operations=operations,
+    )
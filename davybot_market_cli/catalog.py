@@ -0,0 +1,427 @@
+"""Columnar catalog tables for bulk ranking and analysis.
+
+:class:`CatalogTable` stores list and search results column by column: NumPy
+arrays for the numeric fields, dictionary-encoded ``type`` and ``author``
+columns, and tags as a dictionary-encoded list column (one flat array of tag
+codes plus row offsets). Filters, sorts and top-k selections are vectorized
+and return new tables that share nothing with Python ``Resource`` objects.
+
+NumPy is required, and pyarrow for Arrow/Parquet export::
+
+    pip install davybot-market-cli[catalog]
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .client import DavybotMarketClient
+
+RESOURCE_TYPES = ("skill", "agent", "mcp", "knowledge")
+NUMERIC_COLUMNS = ("downloads", "rating")
+
+
+def _numpy() -> Any:
+    """Import NumPy, explaining how to install it if it is missing."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Catalog tables require NumPy: pip install davybot-market-cli[catalog]"
+        ) from e
+    return numpy
+
+
+def _pyarrow() -> Any:
+    """Import pyarrow, explaining how to install it if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow/Parquet export requires pyarrow: pip install davybot-market-cli[catalog]"
+        ) from e
+    return pyarrow
+
+
+def iter_pages(
+    client: "DavybotMarketClient",
+    resource_types: Sequence[str] = RESOURCE_TYPES,
+    page_size: int = 100,
+) -> Iterator[dict[str, Any]]:
+    """Page through the market's listings.
+
+    Args:
+        client: Open market client
+        resource_types: Resource types to include
+        page_size: Items requested per page
+
+    Yields:
+        List responses, one per page
+    """
+    for resource_type in resource_types:
+        skip = 0
+        while True:
+            page = client.list_resources(resource_type, skip, page_size)
+            yield page
+            count = len(page.get("items") or [])
+            skip += count
+            if count < page_size or skip >= int(page.get("total") or 0):
+                break
+
+
+class _Dictionary:
+    """Incrementally built value -> code mapping."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.codes: dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class CatalogTable:
+    """Column-oriented table of market resources.
+
+    Example usage:
+
+        with DavybotMarketClient() as client:
+            table = CatalogTable.from_client(client)
+        popular = table.where(resource_type="skill", tags_any=["web"]).top_k("downloads", 10)
+        popular.write_parquet("popular-skills.parquet")
+    """
+
+    def __init__(
+        self,
+        ids: "np.ndarray",
+        names: "np.ndarray",
+        versions: "np.ndarray",
+        type_codes: "np.ndarray",
+        type_values: list[str],
+        author_codes: "np.ndarray",
+        author_values: list[str],
+        downloads: "np.ndarray",
+        rating: "np.ndarray",
+        tag_offsets: "np.ndarray",
+        tag_codes: "np.ndarray",
+        tag_values: list[str],
+    ):
+        """Create a table from prepared columns; use the ``from_*`` constructors."""
+        self.ids = ids
+        self.names = names
+        self.versions = versions
+        self.type_codes = type_codes
+        self.type_values = type_values
+        self.author_codes = author_codes
+        self.author_values = author_values
+        self.downloads = downloads
+        self.rating = rating
+        self.tag_offsets = tag_offsets
+        self.tag_codes = tag_codes
+        self.tag_values = tag_values
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return int(self.ids.shape[0])
+
+    def __repr__(self) -> str:
+        """Summarize the table."""
+        return f"CatalogTable(rows={len(self)}, tags={len(self.tag_values)})"
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> "CatalogTable":
+        """Build a table from resource dictionaries.
+
+        Args:
+            items: Resources as returned by list or search calls
+
+        Returns:
+            CatalogTable instance
+        """
+        np = _numpy()
+        ids: list[str] = []
+        names: list[str] = []
+        versions: list[str] = []
+        type_codes: list[int] = []
+        author_codes: list[int] = []
+        downloads: list[int] = []
+        rating: list[float] = []
+        tag_offsets: list[int] = [0]
+        tag_codes: list[int] = []
+        types, authors, tags = _Dictionary(), _Dictionary(), _Dictionary()
+
+        for item in items:
+            ids.append(str(item.get("id", "")))
+            names.append(str(item.get("name", "")))
+            versions.append(str(item.get("version", "1.0.0")))
+            type_codes.append(types.encode(str(item.get("type", ""))))
+            author_codes.append(authors.encode(str(item.get("author") or "")))
+            downloads.append(int(item.get("downloads") or 0))
+            rating.append(float(item.get("rating") or 0.0))
+            tag_codes.extend(tags.encode(str(tag)) for tag in item.get("tags") or [])
+            tag_offsets.append(len(tag_codes))
+
+        return cls(
+            ids=np.array(ids, dtype=object),
+            names=np.array(names, dtype=object),
+            versions=np.array(versions, dtype=object),
+            type_codes=np.array(type_codes, dtype=np.int32),
+            type_values=types.values,
+            author_codes=np.array(author_codes, dtype=np.int32),
+            author_values=authors.values,
+            downloads=np.array(downloads, dtype=np.int64),
+            rating=np.array(rating, dtype=np.float64),
+            tag_offsets=np.array(tag_offsets, dtype=np.int64),
+            tag_codes=np.array(tag_codes, dtype=np.int32),
+            tag_values=tags.values,
+        )
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[dict[str, Any]]) -> "CatalogTable":
+        """Build a table from list (``items``) and search (``results``) responses.
+
+        Args:
+            responses: Decoded response dictionaries
+
+        Returns:
+            CatalogTable instance
+        """
+        return cls.from_items(
+            item
+            for response in responses
+            for item in (response.get("items") or response.get("results") or [])
+            if isinstance(item, dict)
+        )
+
+    @classmethod
+    def from_client(
+        cls,
+        client: "DavybotMarketClient",
+        resource_types: Sequence[str] = RESOURCE_TYPES,
+        page_size: int = 100,
+    ) -> "CatalogTable":
+        """Page through the market's listings into one table.
+
+        Args:
+            client: Open market client
+            resource_types: Resource types to include
+            page_size: Items requested per page
+
+        Returns:
+            CatalogTable instance
+        """
+        return cls.from_responses(iter_pages(client, resource_types, page_size))
+
+    def take(self, indices: "np.ndarray") -> "CatalogTable":
+        """Select rows by position.
+
+        Args:
+            indices: Row indices (any integer array)
+
+        Returns:
+            New table with the selected rows, in the given order
+        """
+        np = _numpy()
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.tag_offsets[:-1][indices]
+        lengths = self.tag_offsets[1:][indices] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # Gather each selected row's tag slice into one flat array
+        gather = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return CatalogTable(
+            ids=self.ids[indices],
+            names=self.names[indices],
+            versions=self.versions[indices],
+            type_codes=self.type_codes[indices],
+            type_values=self.type_values,
+            author_codes=self.author_codes[indices],
+            author_values=self.author_values,
+            downloads=self.downloads[indices],
+            rating=self.rating[indices],
+            tag_offsets=offsets,
+            tag_codes=self.tag_codes[gather],
+            tag_values=self.tag_values,
+        )
+
+    def _mark_tag(self, mask: "np.ndarray", tag: str) -> None:
+        """Set ``mask`` to True for every row carrying ``tag``."""
+        if tag not in self.tag_values:
+            return
+        np = _numpy()
+        rows = np.repeat(np.arange(len(self)), np.diff(self.tag_offsets))
+        mask[rows[self.tag_codes == self.tag_values.index(tag)]] = True
+
+    def where(
+        self,
+        resource_type: str | None = None,
+        min_rating: float | None = None,
+        min_downloads: int | None = None,
+        tags_all: Sequence[str] = (),
+        tags_any: Sequence[str] = (),
+    ) -> "CatalogTable":
+        """Filter rows with vectorized predicates.
+
+        Args:
+            resource_type: Keep only this resource type
+            min_rating: Minimum average rating
+            min_downloads: Minimum download count
+            tags_all: Tags every kept row must have
+            tags_any: Tags of which every kept row must have at least one
+
+        Returns:
+            New table with the matching rows
+        """
+        np = _numpy()
+        mask = np.ones(len(self), dtype=bool)
+        if resource_type is not None:
+            if resource_type not in self.type_values:
+                mask[:] = False
+            else:
+                mask &= self.type_codes == self.type_values.index(resource_type)
+        if min_rating is not None:
+            mask &= self.rating >= min_rating
+        if min_downloads is not None:
+            mask &= self.downloads >= min_downloads
+        for tag in tags_all:
+            tag_mask = np.zeros(len(self), dtype=bool)
+            self._mark_tag(tag_mask, tag)
+            mask &= tag_mask
+        if tags_any:
+            any_mask = np.zeros(len(self), dtype=bool)
+            for tag in tags_any:
+                self._mark_tag(any_mask, tag)
+            mask &= any_mask
+        return self.take(np.flatnonzero(mask))
+
+    def _numeric(self, column: str) -> "np.ndarray":
+        """Get a numeric column by name."""
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown numeric column {column!r}; use one of {NUMERIC_COLUMNS}")
+        values: np.ndarray = getattr(self, column)
+        return values
+
+    def sort_by(self, column: str, descending: bool = True) -> "CatalogTable":
+        """Sort rows by a numeric column (stable).
+
+        Args:
+            column: 'downloads' or 'rating'
+            descending: Largest first
+
+        Returns:
+            New sorted table
+        """
+        np = _numpy()
+        values = self._numeric(column)
+        order = np.argsort(-values if descending else values, kind="stable")
+        return self.take(order)
+
+    def top_k(self, column: str, k: int) -> "CatalogTable":
+        """Select the ``k`` rows with the largest values of a numeric column.
+
+        Uses a partial partition, so only the selected rows are fully sorted.
+
+        Args:
+            column: 'downloads' or 'rating'
+            k: Number of rows
+
+        Returns:
+            New table with at most ``k`` rows, largest first
+        """
+        np = _numpy()
+        values = self._numeric(column)
+        k = min(k, len(self))
+        if k <= 0:
+            return self.take(np.arange(0))
+        candidates = np.argpartition(-values, k - 1)[:k]
+        order = candidates[np.argsort(-values[candidates], kind="stable")]
+        return self.take(order)
+
+    def tags_of(self, row: int) -> list[str]:
+        """Decode the tags of one row."""
+        start, end = int(self.tag_offsets[row]), int(self.tag_offsets[row + 1])
+        return [self.tag_values[code] for code in self.tag_codes[start:end]]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Convert back to API-style resource dictionaries."""
+        return [
+            {
+                "id": self.ids[i],
+                "name": self.names[i],
+                "type": self.type_values[self.type_codes[i]],
+                "version": self.versions[i],
+                "author": self.author_values[self.author_codes[i]] or None,
+                "downloads": int(self.downloads[i]),
+                "rating": float(self.rating[i]),
+                "tags": self.tags_of(i),
+            }
+            for i in range(len(self))
+        ]
+
+    def to_arrow(self) -> Any:
+        """Convert to a ``pyarrow.Table`` keeping the dictionary encodings.
+
+        Returns:
+            pyarrow.Table
+        """
+        pa = _pyarrow()
+        tag_dictionary = pa.array(self.tag_values, type=pa.string())
+        tags = pa.ListArray.from_arrays(
+            pa.array(self.tag_offsets, type=pa.int32()),
+            pa.DictionaryArray.from_arrays(
+                pa.array(self.tag_codes, type=pa.int32()), tag_dictionary
+            ),
+        )
+        return pa.table(
+            {
+                "id": pa.array(self.ids.tolist(), type=pa.string()),
+                "name": pa.array(self.names.tolist(), type=pa.string()),
+                "type": pa.DictionaryArray.from_arrays(
+                    pa.array(self.type_codes), pa.array(self.type_values, type=pa.string())
+                ),
+                "version": pa.array(self.versions.tolist(), type=pa.string()),
+                "author": pa.DictionaryArray.from_arrays(
+                    pa.array(self.author_codes), pa.array(self.author_values, type=pa.string())
+                ),
+                "downloads": pa.array(self.downloads),
+                "rating": pa.array(self.rating),
+                "tags": tags,
+            }
+        )
+
+    def write_parquet(self, path: str | Path) -> Path:
+        """Write the table as a Parquet file.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path written
+        """
+        _pyarrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), str(path))
+        return Path(path)
+
+    def write_arrow(self, path: str | Path) -> Path:
+        """Write the table as an Arrow IPC (Feather v2) file.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path written
+        """
+        _pyarrow()
+        from pyarrow import feather
+
+        feather.write_feather(self.to_arrow(), str(path))
+        return Path(path)
@@ -1,24 +1,101 @@
 """DavyBot Market CLI entry point."""
 
-import click
+import importlib
 import sys
-import httpx
 
-from .commands import search, install, publish, info
+import click
+
 from .exit_codes import (
     ERROR_API_UNHEALTHY,
     ERROR_NETWORK,
     ExitCodeError,
 )
 
-
-@click.group(invoke_without_command=True)
+# Subcommands as name -> ("module:attribute", short help). Modules are imported
+# only when their command runs, so `davy --help` and `davy --version` never
+# load httpx, pydantic or the SDK. The short help must match the first line of
+# the command's docstring; tests/test_imports.py checks that they agree.
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "search": (".commands.search:search", "Search for resources in the market."),
+    "install": (".commands.install:install", "Install a resource from the market."),
+    "publish": (".commands.publish:publish", "Publish a resource to the market."),
+    "info": (".commands.info:info", "Show detailed information about a resource."),
+    "rollback": (
+        ".commands.rollback:rollback",
+        "Restore the version replaced by the last install.",
+    ),
+    "list": (
+        ".commands.list_resources:list_resources",
+        "List resources in the market, or those installed locally.",
+    ),
+    "outdated": (
+        ".commands.outdated:outdated",
+        "Show installed resources with newer versions in the market.",
+    ),
+    "upgrade": (
+        ".commands.upgrade:upgrade",
+        "Upgrade installed resources to their latest market versions.",
+    ),
+    "daemon": (".commands.daemon:daemon", "Run or control the local warm-up daemon."),
+    "catalog": (".commands.catalog:catalog", "Analyze the whole market catalog in bulk."),
+    "bench": (".commands.bench:bench", "Measure market API throughput and latency."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(
+        self,
+        *args: object,
+        lazy_commands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: object,
+    ):
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommands."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing its module if needed."""
+        if cmd_name in self.commands or cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = self.lazy_commands[cmd_name][0].split(":")
+        command = getattr(importlib.import_module(module_name, __package__), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attr} is not a click command")
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands in help output without importing lazy ones."""
+        rows = []
+        limit = formatter.width - 6 - max(len(name) for name in self.list_commands(ctx))
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True)
 @click.pass_context
 @click.option(
     "--api-url", envvar="DAVYBOT_API_URL", help="API URL (default: http://localhost:8000/api/v1)"
 )
+@click.option(
+    "--trace", is_flag=True, help="Print a timing waterfall of all requests to stderr on exit"
+)
 @click.version_option(version="0.1.0", prog_name="davy")
-def cli(ctx: click.Context, api_url: str) -> None:
+def cli(ctx: click.Context, api_url: str, trace: bool) -> None:
     """DavyBot Market - AI Agent Resources CLI.
 
     \b
@@ -32,6 +109,19 @@ def cli(ctx: click.Context, api_url: str) -> None:
         # Install a resource
         davy install skill://web-scraper
 
+        \b
+        # Undo the last install of a resource
+        davy rollback skill://web-scraper
+
+        \b
+        # Show what is installed and what has updates
+        davy list --installed
+        davy outdated
+
+        \b
+        # Upgrade everything that has a newer version
+        davy upgrade --all
+
         \b
         # Get resource information
         davy info agent://data-analyst
@@ -40,11 +130,21 @@ def cli(ctx: click.Context, api_url: str) -> None:
         # Publish a new resource
         davy publish skill ./my-skill --name "my-skill" --description "Does cool stuff"
 
+        \b
+        # See where an install spends its time
+        davy --trace install skill://web-scraper
+
     \b
     Note: 'dawei' is also available as an alias for 'davy'.
     """
     ctx.ensure_object(dict)
     ctx.obj["api_url"] = api_url
+    if trace:
+        from .tracing import SpanRecorder, format_waterfall
+
+        recorder = SpanRecorder()
+        ctx.obj["trace"] = recorder
+        ctx.call_on_close(lambda: click.echo(format_waterfall(recorder.spans), err=True))
 
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
@@ -55,6 +155,8 @@ def health() -> None:
     """Check API health status."""
     import os
 
+    import httpx
+
     api_url = os.environ.get("DAVYBOT_API_URL", "http://localhost:8000/api/v1").replace(
         "/api/v1", ""
     )
@@ -83,13 +185,6 @@ def health() -> None:
         raise ExitCodeError(ERROR_API_UNHEALTHY, str(e))
 
 
-# Add all commands
-cli.add_command(search.search)
-cli.add_command(install.install)
-cli.add_command(publish.publish)
-cli.add_command(info.info)
-
-
 def main() -> None:
     """Main entry point with proper exit codes."""
     try:
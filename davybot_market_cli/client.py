@@ -1,18 +1,37 @@
 """DavyBot Market SDK Client."""
 
+import asyncio
+import gzip
 import os
 import urllib.parse
 import httpx
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Generator, Iterator, Sequence
+from contextlib import nullcontext
+from typing import IO, Any
 from pathlib import Path
 
+from . import _json
+from ._stream_json import ArrayItemParser, iter_items
+from .compression import accept_encoding, compress_body
+from .models import Resource
+from .ratelimit import RateLimiter, route_group
+from .ratings import iter_ratings
+from .scheduler import DownloadScheduler, Transfer
+from .tracing import Span, TraceHook, Tracer
+
 from .exceptions import (
     AuthenticationError,
     NotFoundError,
     ValidationError,
     APIError,
+    RateLimitError,
 )
 
+# Downloads are written to disk in chunks of this size instead of being buffered
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Streamed JSON bodies are decoded in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class DavybotMarketClient:
     """Client for DavyBot Market API.
@@ -50,6 +69,13 @@ class DavybotMarketClient:
         api_key: str | None = None,
         timeout: float = 30.0,
         verify_ssl: bool = True,
+        limits: httpx.Limits | None = None,
+        hooks: Sequence[TraceHook] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: RateLimiter | None = None,
+        scheduler: DownloadScheduler | None = None,
+        compression_threshold: int | None = None,
     ):
         """Initialize the client.
 
@@ -58,6 +84,16 @@ class DavybotMarketClient:
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            limits: Optional connection pool limits (size, keep-alive expiry)
+            hooks: Optional trace hooks that receive a span for every request
+            transport: Optional httpx transport for the sync client (e.g. a mock)
+            async_transport: Optional httpx transport for the async client
+            rate_limiter: Optional client-side rate limiter; it may be shared by
+                several clients, threads and async tasks
+            scheduler: Optional download scheduler that orders downloads by
+                priority and caps their bandwidth
+            compression_threshold: Gzip JSON request bodies of at least this many
+                bytes; off by default, as not every server accepts compressed requests
         """
         self.base_url = (
             base_url or os.environ.get("DAVYBOT_API_URL", "http://localhost:8000/api/v1")
@@ -65,6 +101,13 @@ class DavybotMarketClient:
         self.api_key = api_key or os.environ.get("DAVYBOT_API_KEY")
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.limits = limits or httpx.Limits()
+        self.tracer = Tracer(hooks or ())
+        self.transport = transport
+        self.async_transport = async_transport
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
+        self.compression_threshold = compression_threshold
         self._client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
 
@@ -75,6 +118,8 @@ class DavybotMarketClient:
             timeout=self.timeout,
             headers=self._get_headers(),
             verify=self.verify_ssl,
+            limits=self.limits,
+            transport=self.transport,
         )
         return self
 
@@ -90,6 +135,8 @@ class DavybotMarketClient:
             timeout=self.timeout,
             headers=self._get_headers(),
             verify=self.verify_ssl,
+            limits=self.limits,
+            transport=self.async_transport,
         )
         return self
 
@@ -116,13 +163,241 @@ class DavybotMarketClient:
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers."""
-        headers = {
-            "Content-Type": "application/json",
-        }
+        # No default Content-Type: httpx sets it per body (JSON, multipart, ...)
+        headers = {"Accept-Encoding": accept_encoding()}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
+    def _request(
+        self,
+        method: str,
+        route: str,
+        path_params: dict[str, str] | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request and trace it.
+
+        Args:
+            method: HTTP method
+            route: Route template, e.g. "/{resource_type}s/{resource_id}"
+            path_params: Values for the route placeholders (URL-encoded here)
+            stream: Return before reading the body; the caller must close the response
+            **kwargs: Passed to httpx.Client.request
+
+        Returns:
+            HTTP response; status errors are left to the caller
+        """
+        client = self._get_client()
+        url = self._route_url(route, path_params)
+        body_bytes = self._compress_json(kwargs)
+        if not self.tracer:
+            return self._send_limited(client, method, route, url, stream, kwargs)
+
+        span = self._start_span(method, route, url)
+        timer = self.tracer.phase_timer(span)
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": timer.sync_callback()}
+        try:
+            response = self._send_limited(client, method, route, url, stream, kwargs, span)
+            self._record_response(span, response, body_bytes)
+        except BaseException as e:
+            if isinstance(e, httpx.HTTPError):
+                span.error = type(e).__name__
+            self.tracer.end(span)
+            raise
+        if stream:
+            # The body is read by the caller: the span ends when the response is closed
+            self._end_span_on_close(span, response, is_async=False)
+        else:
+            self.tracer.end(span)
+        return response
+
+    async def _arequest(
+        self,
+        method: str,
+        route: str,
+        path_params: dict[str, str] | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Async counterpart of :meth:`_request`."""
+        client = await self._get_async_client()
+        url = self._route_url(route, path_params)
+        body_bytes = self._compress_json(kwargs)
+        if not self.tracer:
+            return await self._asend_limited(client, method, route, url, stream, kwargs)
+
+        span = self._start_span(method, route, url)
+        timer = self.tracer.phase_timer(span)
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": timer.async_callback()}
+        try:
+            response = await self._asend_limited(client, method, route, url, stream, kwargs, span)
+            self._record_response(span, response, body_bytes)
+        except BaseException as e:
+            if isinstance(e, httpx.HTTPError):
+                span.error = type(e).__name__
+            self.tracer.end(span)
+            raise
+        if stream:
+            # The body is read by the caller: the span ends when the response is closed
+            self._end_span_on_close(span, response, is_async=True)
+        else:
+            self.tracer.end(span)
+        return response
+
+    def _compress_json(self, kwargs: dict[str, Any]) -> int | None:
+        """Encode a JSON body, gzipped if it is large enough (in place).
+
+        Without a compression threshold the body is left to httpx.
+
+        Returns:
+            The uncompressed body size if the body was compressed, else None
+        """
+        if "json" not in kwargs or self.compression_threshold is None:
+            return None
+        body = _json.dumps(kwargs.pop("json"))
+        compressed = compress_body(body, self.compression_threshold)
+        headers = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+        if compressed is None:
+            kwargs["content"], kwargs["headers"] = body, headers
+            return None
+        kwargs["content"] = compressed
+        kwargs["headers"] = {**headers, "Content-Encoding": "gzip"}
+        return len(body)
+
+    def _send_limited(
+        self,
+        client: httpx.Client,
+        method: str,
+        route: str,
+        url: str,
+        stream: bool,
+        kwargs: dict[str, Any],
+        span: Span | None = None,
+    ) -> httpx.Response:
+        """Send a request under the rate limiter, retrying throttled (429) responses."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self._send(client, method, url, stream, kwargs)
+        group = route_group(method, route)
+        retries = 0
+        while True:
+            limiter.acquire(group)
+            response = self._send(client, method, url, stream, dict(kwargs))
+            limiter.observe(group, response)
+            if response.status_code != 429 or retries >= limiter.max_retries:
+                return response
+            response.close()
+            retries += 1
+            if span is not None:
+                span.retries = retries
+
+    async def _asend_limited(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        route: str,
+        url: str,
+        stream: bool,
+        kwargs: dict[str, Any],
+        span: Span | None = None,
+    ) -> httpx.Response:
+        """Async counterpart of :meth:`_send_limited`."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self._asend(client, method, url, stream, kwargs)
+        group = route_group(method, route)
+        retries = 0
+        while True:
+            await limiter.aacquire(group)
+            response = await self._asend(client, method, url, stream, dict(kwargs))
+            limiter.observe(group, response)
+            if response.status_code != 429 or retries >= limiter.max_retries:
+                return response
+            await response.aclose()
+            retries += 1
+            if span is not None:
+                span.retries = retries
+
+    @staticmethod
+    def _send(
+        client: httpx.Client, method: str, url: str, stream: bool, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send a request, optionally leaving the body unread."""
+        if not stream:
+            return client.request(method, url, **kwargs)
+        follow_redirects = kwargs.pop("follow_redirects", False)
+        request = client.build_request(method, url, **kwargs)
+        return client.send(request, stream=True, follow_redirects=follow_redirects)
+
+    @staticmethod
+    async def _asend(
+        client: httpx.AsyncClient, method: str, url: str, stream: bool, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Async counterpart of :meth:`_send`."""
+        if not stream:
+            return await client.request(method, url, **kwargs)
+        follow_redirects = kwargs.pop("follow_redirects", False)
+        request = client.build_request(method, url, **kwargs)
+        return await client.send(request, stream=True, follow_redirects=follow_redirects)
+
+    def _route_url(self, route: str, path_params: dict[str, str] | None) -> str:
+        """Fill a route template with URL-encoded path parameters."""
+        return route.format(
+            **{key: self._encode_resource_id(value) for key, value in (path_params or {}).items()}
+        )
+
+    def _start_span(self, method: str, route: str, url: str) -> Span:
+        """Start the span for one request."""
+        return self.tracer.start(
+            Span(name=f"{method} {route}", method=method, route=route, url=self.base_url + url)
+        )
+
+    def _record_response(
+        self, span: Span, response: httpx.Response, body_bytes: int | None = None
+    ) -> None:
+        """Copy response details onto a request span.
+
+        Args:
+            span: Span of the request
+            response: Its response
+            body_bytes: Request body size before compression, if it was compressed
+        """
+        span.url = str(response.url)
+        span.status = response.status_code
+        # Streamed bodies (multipart, uploads) cannot be read back: use the announced size
+        span.request_bytes = int(response.request.headers.get("Content-Length") or 0)
+        span.request_decoded_bytes = span.request_bytes if body_bytes is None else body_bytes
+        encoding = response.headers.get("Content-Encoding")
+        if encoding:
+            span.attributes["content_encoding"] = encoding
+        if response.is_stream_consumed:
+            span.response_bytes = response.num_bytes_downloaded
+            span.response_decoded_bytes = len(response.content)
+        else:
+            # Until a streamed body is read and closed, only its announced size is known
+            span.response_bytes = int(response.headers.get("Content-Length") or 0)
+            if not encoding:
+                span.response_decoded_bytes = span.response_bytes
+            span.attributes["streamed"] = True
+
+    def _end_span_on_close(self, span: Span, response: httpx.Response, is_async: bool) -> None:
+        """End the span of a streamed response once its body has been read and closed."""
+
+        def end() -> None:
+            span.response_bytes = response.num_bytes_downloaded
+            if "content_encoding" not in span.attributes:
+                span.response_decoded_bytes = span.response_bytes
+            self.tracer.end(span)
+
+        if is_async:
+            assert isinstance(response.stream, httpx.AsyncByteStream)
+            response.stream = _AsyncClosingStream(response.stream, end)
+        else:
+            assert isinstance(response.stream, httpx.SyncByteStream)
+            response.stream = _ClosingStream(response.stream, end)
+
     def _parse_json_response(self, response: httpx.Response) -> dict[str, Any]:
         """Parse JSON response and ensure it's a dict.
 
@@ -132,7 +407,7 @@ class DavybotMarketClient:
         Returns:
             Parsed JSON dict
         """
-        json_data: Any = response.json()
+        json_data: Any = _json.loads(response.content)
         assert isinstance(json_data, dict), "API response must be a dict"
         return json_data
 
@@ -145,13 +420,43 @@ class DavybotMarketClient:
         Returns:
             Parsed JSON list
         """
-        json_data: Any = response.json()
+        json_data: Any = _json.loads(response.content)
         assert isinstance(json_data, list), "API response must be a list"
         # Ensure each item is a dict
         for item in json_data:
             assert isinstance(item, dict), "API response items must be dicts"
         return json_data  # type: ignore[return-value]
 
+    def _stream_resources(
+        self,
+        method: str,
+        route: str,
+        path_params: dict[str, str] | None = None,
+        keys: Sequence[str] = ("items", "results"),
+        **kwargs: Any,
+    ) -> Generator[Resource, None, None]:
+        """Send a request and decode the resources of its item array as they arrive.
+
+        Args:
+            method: HTTP method
+            route: Route template
+            path_params: Values for the route placeholders
+            keys: Names of the top-level array holding the resources
+            **kwargs: Passed to httpx.Client.request
+
+        Yields:
+            Resources, in response order
+        """
+        response = self._request(method, route, path_params, stream=True, **kwargs)
+        try:
+            self._handle_error(response)
+            parser = ArrayItemParser(keys)
+            for item in iter_items(response.iter_bytes(STREAM_CHUNK_SIZE), parser):
+                assert isinstance(item, dict), "API response items must be dicts"
+                yield Resource.from_dict(item)
+        finally:
+            response.close()
+
     # Health check
     def health(self) -> dict[str, Any]:
         """Check API health.
@@ -159,9 +464,8 @@ class DavybotMarketClient:
         Returns:
             Health status
         """
-        client = self._get_client()
         url = self.base_url.replace("/api/v1", "") + "/health"
-        response = client.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return self._parse_json_response(response)
 
@@ -186,17 +490,46 @@ class DavybotMarketClient:
         Returns:
             Search results with 'results' and 'total' keys
         """
-        client = self._get_client()
         payload = {"query": query, "limit": limit, "offset": offset}
         if resource_type:
             payload["type"] = resource_type
         if tags:
             payload["tags"] = tags
 
-        response = client.post("/search", json=payload)
+        response = self._request("POST", "/search", json=payload)
         self._handle_error(response)
         return self._parse_json_response(response)
 
+    def iter_search(
+        self,
+        query: str,
+        resource_type: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Iterator[Resource]:
+        """Search for resources, decoding results one by one as the response arrives.
+
+        Unlike :meth:`search`, the page is never held in memory as a whole, so
+        large limits cost about one resource of memory.
+
+        Args:
+            query: Search query
+            resource_type: Optional resource type filter
+            tags: Optional list of tags to filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Iterator of resources; the request is sent on first use
+        """
+        payload: dict[str, Any] = {"query": query, "limit": limit, "offset": offset}
+        if resource_type:
+            payload["type"] = resource_type
+        if tags:
+            payload["tags"] = tags
+        return self._stream_resources("POST", "/search", keys=("results",), json=payload)
+
     # List resources
     def list_skills(self, skip: int = 0, limit: int = 100) -> dict[str, Any]:
         """List all skills.
@@ -248,16 +581,59 @@ class DavybotMarketClient:
 
     def _list_resources(self, resource_type: str, skip: int, limit: int) -> dict[str, Any]:
         """Internal method to list resources by type."""
-        client = self._get_client()
-        response = client.get(f"/{resource_type}s", params={"skip": skip, "limit": limit})
+        response = self._request(
+            "GET",
+            "/{resource_type}s",
+            {"resource_type": resource_type},
+            params={"skip": skip, "limit": limit},
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
+    def list_resources(self, resource_type: str, skip: int = 0, limit: int = 100) -> dict[str, Any]:
+        """List resources of one type, one page at a time.
+
+        Args:
+            resource_type: Type of resource (skill, agent, mcp, knowledge)
+            skip: Number of results to skip
+            limit: Maximum number of results
+
+        Returns:
+            List of resources with metadata
+        """
+        return self._list_resources(resource_type, skip, limit)
+
+    def iter_resources(
+        self, resource_type: str, skip: int = 0, limit: int = 100
+    ) -> Iterator[Resource]:
+        """List resources of one type, decoding them one by one as the response arrives.
+
+        Unlike the ``list_*`` methods, the page is never held in memory as a
+        whole, so large limits cost about one resource of memory.
+
+        Args:
+            resource_type: Type of resource (skill, agent, mcp, knowledge)
+            skip: Number of results to skip
+            limit: Maximum number of results
+
+        Returns:
+            Iterator of resources; the request is sent on first use
+        """
+        return self._stream_resources(
+            "GET",
+            "/{resource_type}s",
+            {"resource_type": resource_type},
+            keys=("items",),
+            params={"skip": skip, "limit": limit},
+        )
+
     def _get_resource(self, resource_type: str, resource_id: str) -> dict[str, Any]:
         """Internal method to get resource by type."""
-        client = self._get_client()
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.get(f"/{resource_type}s/{encoded_id}")
+        response = self._request(
+            "GET",
+            "/{resource_type}s/{resource_id}",
+            {"resource_type": resource_type, "resource_id": resource_id},
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
@@ -414,7 +790,6 @@ class DavybotMarketClient:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Internal method to create resource."""
-        client = self._get_client()
         payload = {"name": name, "files": files}
         if description:
             payload["description"] = description
@@ -425,7 +800,9 @@ class DavybotMarketClient:
         if metadata:
             payload["metadata"] = metadata
 
-        response = client.post(f"/{resource_type}s", json=payload)
+        response = self._request(
+            "POST", "/{resource_type}s", {"resource_type": resource_type}, json=payload
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
@@ -437,6 +814,7 @@ class DavybotMarketClient:
         output_path: str | Path,
         format: str = "zip",
         version: str | None = None,
+        priority: str = "normal",
     ) -> Path:
         """Download a resource.
 
@@ -446,38 +824,65 @@ class DavybotMarketClient:
             output_path: Output file or directory path
             format: Download format (zip, python)
             version: Optional version to download
+            priority: Scheduling class when the client has a download scheduler
+                ('urgent', 'normal' or 'background')
 
         Returns:
             Path to downloaded file
         """
-        client = self._get_client()
         params = {"format": format}
         if version:
             params["version"] = version
 
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.get(
-            f"/{resource_type}s/{encoded_id}/download",
-            params=params,
-            follow_redirects=True,
-        )
-        self._handle_error(response)
-
-        output = Path(output_path)
-        if output.is_dir():
-            # Get filename from resource
-            resource = self._get_resource(resource_type, resource_id)
-            name = resource.get("name", "resource")
-            ver = resource.get("version", "1.0.0")
-            if format == "zip":
-                filename = f"{name}-{ver}.zip"
-            else:
-                filename = f"{name}-{ver}.tar.gz"
-            output = output / filename
-
-        output.write_bytes(response.content)
+        with self._transfer(resource_type, resource_id, priority) as transfer:
+            response = self._request(
+                "GET",
+                "/{resource_type}s/{resource_id}/download",
+                {"resource_type": resource_type, "resource_id": resource_id},
+                stream=True,
+                params=params,
+                # Archives are already compressed
+                headers={"Accept-Encoding": "identity"},
+                follow_redirects=True,
+            )
+            try:
+                self._handle_error(response)
+
+                output = Path(output_path)
+                if output.is_dir():
+                    # Get filename from resource
+                    resource = self._get_resource(resource_type, resource_id)
+                    name = resource.get("name", "resource")
+                    ver = resource.get("version", "1.0.0")
+                    if format == "zip":
+                        filename = f"{name}-{ver}.zip"
+                    else:
+                        filename = f"{name}-{ver}.tar.gz"
+                    output = output / filename
+
+                if transfer is not None:
+                    transfer.set_size(_content_length(response))
+                try:
+                    with open(output, "wb") as f:
+                        for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            if transfer is not None:
+                                transfer.throttle(len(chunk))
+                except BaseException:
+                    output.unlink(missing_ok=True)
+                    raise
+            finally:
+                response.close()
         return output
 
+    def _transfer(
+        self, resource_type: str, resource_id: str, priority: str
+    ) -> Transfer | nullcontext[None]:
+        """Schedule a download, if the client has a scheduler (sync or async context)."""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.transfer(f"{resource_type}/{resource_id}", priority)
+
     # Ratings
     def rate_resource(
         self,
@@ -495,13 +900,16 @@ class DavybotMarketClient:
         Returns:
             Created rating
         """
-        client = self._get_client()
         payload: dict[str, Any] = {"score": score}
         if comment:
             payload["comment"] = comment
 
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.post(f"/resources/{encoded_id}/ratings", json=payload)
+        response = self._request(
+            "POST",
+            "/resources/{resource_id}/ratings",
+            {"resource_id": resource_id},
+            json=payload,
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
@@ -518,14 +926,30 @@ class DavybotMarketClient:
         Returns:
             List of ratings
         """
-        client = self._get_client()
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.get(
-            f"/resources/{encoded_id}/ratings", params={"skip": skip, "limit": limit}
+        response = self._request(
+            "GET",
+            "/resources/{resource_id}/ratings",
+            {"resource_id": resource_id},
+            params={"skip": skip, "limit": limit},
         )
         self._handle_error(response)
         return self._parse_json_list_response(response)
 
+    def iter_resource_ratings(
+        self, resource_id: str, page_size: int = 50, prefetch: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every rating of a resource, fetching pages as needed.
+
+        Args:
+            resource_id: Resource ID
+            page_size: Ratings requested per page
+            prefetch: Request the next page while the current one is consumed
+
+        Returns:
+            Iterator of ratings
+        """
+        return iter_ratings(self, resource_id, page_size, prefetch)
+
     def get_average_rating(self, resource_id: str) -> dict[str, Any]:
         """Get average rating for a resource.
 
@@ -535,9 +959,9 @@ class DavybotMarketClient:
         Returns:
             Average rating info
         """
-        client = self._get_client()
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.get(f"/resources/{encoded_id}/ratings/avg")
+        response = self._request(
+            "GET", "/resources/{resource_id}/ratings/avg", {"resource_id": resource_id}
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
@@ -552,12 +976,40 @@ class DavybotMarketClient:
         Returns:
             Similar resources
         """
-        client = self._get_client()
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.get(f"/search/similar/{encoded_id}", params={"limit": limit})
+        response = self._request(
+            "GET",
+            "/search/similar/{resource_id}",
+            {"resource_id": resource_id},
+            params={"limit": limit},
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
+    # Version checks
+    def check_updates(
+        self, resources: list[dict[str, str]], etag: str | None = None
+    ) -> dict[str, Any] | None:
+        """Look up the latest versions of many resources in one request.
+
+        Args:
+            resources: Resources to check, each with 'type', 'id' and 'version'
+            etag: ETag of an earlier response for the same resource list
+
+        Returns:
+            Dict with 'items' (each with 'type', 'id' and latest 'version') and
+            the response 'etag', or None if unchanged since ``etag``
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        response = self._request(
+            "POST", "/resources/versions", json={"resources": resources}, headers=headers
+        )
+        if response.status_code == 304:
+            return None
+        self._handle_error(response)
+        result = self._parse_json_response(response)
+        result["etag"] = response.headers.get("ETag")
+        return result
+
     # Update and delete
     def update_resource(
         self,
@@ -581,7 +1033,6 @@ class DavybotMarketClient:
         Returns:
             Updated resource
         """
-        client = self._get_client()
         payload: dict[str, Any] = {}
         if name:
             payload["name"] = name
@@ -592,8 +1043,12 @@ class DavybotMarketClient:
         if metadata is not None:
             payload["metadata"] = metadata
 
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.put(f"/{resource_type}s/{encoded_id}", json=payload)
+        response = self._request(
+            "PUT",
+            "/{resource_type}s/{resource_id}",
+            {"resource_type": resource_type, "resource_id": resource_id},
+            json=payload,
+        )
         self._handle_error(response)
         return self._parse_json_response(response)
 
@@ -604,10 +1059,228 @@ class DavybotMarketClient:
             resource_type: Type of resource
             resource_id: Resource ID
         """
-        client = self._get_client()
-        encoded_id = self._encode_resource_id(resource_id)
-        response = client.delete(f"/{resource_type}s/{encoded_id}")
+        response = self._request(
+            "DELETE",
+            "/{resource_type}s/{resource_id}",
+            {"resource_type": resource_type, "resource_id": resource_id},
+        )
+        self._handle_error(response)
+
+    # Configuration sync
+    def get_sync_configuration(self) -> dict[str, Any]:
+        """Get the user's full synchronised configuration.
+
+        Returns:
+            SyncConfiguration data
+        """
+        response = self._request("GET", "/sync/configuration")
+        self._handle_error(response)
+        return self._parse_json_response(response)
+
+    def patch_sync_configuration(
+        self, patch: Sequence[dict[str, Any]], since: str | None = None
+    ) -> dict[str, Any]:
+        """Send changed configuration keys and receive the keys changed elsewhere.
+
+        Args:
+            patch: JSON-patch operations, each with the ``timestamp`` of the change
+            since: ``lastSyncTime`` of the previous sync (None for a first sync)
+
+        Returns:
+            Dict with the server's ``patch`` (changes since ``since``) and the
+            new ``lastSyncTime``
+        """
+        response = self._request(
+            "PATCH", "/sync/configuration", json={"since": since, "patch": list(patch)}
+        )
+        self._handle_error(response)
+        return self._parse_json_response(response)
+
+    # Feedback
+    def submit_feedback(
+        self,
+        feedback: dict[str, Any],
+        screenshots: Sequence[tuple[str, IO[bytes], str, dict[str, str]]] = (),
+    ) -> dict[str, Any]:
+        """Submit a feedback report as a multipart request.
+
+        Args:
+            feedback: Encoded Feedback; its inline ``screenshots`` should be empty
+            screenshots: Binary screenshot parts as ``(filename, stream,
+                content type, headers)``, streamed from their file objects
+
+        Returns:
+            FeedbackResponse data
+        """
+        # The report is a part of its own, so the body is multipart even without screenshots
+        report = ("feedback", (None, _json.dumps(feedback), "application/json"))
+        response = self._request(
+            "POST",
+            "/feedback",
+            files=[report, *(("screenshots", part) for part in screenshots)],
+        )
+        self._handle_error(response)
+        return self._parse_json_response(response)
+
+    # Analytics
+    def send_analytics_events(
+        self, events: Sequence[dict[str, Any]], compress: bool = True
+    ) -> dict[str, Any]:
+        """Send a batch of analytics events in one request.
+
+        Args:
+            events: Encoded analytics events (see AnalyticsEvent)
+            compress: Gzip the request body
+
+        Returns:
+            The API's acknowledgement (empty if it sent no body)
+        """
+        body = _json.dumps({"events": list(events)})
+        headers = {"Content-Type": "application/json"}
+        if compress:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        response = self._request("POST", "/analytics/events", content=body, headers=headers)
+        self._handle_error(response)
+        return self._parse_json_response(response) if response.content else {}
+
+    # Async API
+    async def asearch(
+        self,
+        query: str,
+        resource_type: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Search for resources (async).
+
+        Args:
+            query: Search query
+            resource_type: Optional resource type filter
+            tags: Optional list of tags to filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Search results with 'results' and 'total' keys
+        """
+        payload: dict[str, Any] = {"query": query, "limit": limit, "offset": offset}
+        if resource_type:
+            payload["type"] = resource_type
+        if tags:
+            payload["tags"] = tags
+
+        response = await self._arequest("POST", "/search", json=payload)
         self._handle_error(response)
+        return self._parse_json_response(response)
+
+    async def alist_resources(
+        self, resource_type: str, skip: int = 0, limit: int = 100
+    ) -> dict[str, Any]:
+        """List resources of one type (async).
+
+        Args:
+            resource_type: Type of resource
+            skip: Number of results to skip
+            limit: Maximum number of results
+
+        Returns:
+            List of resources with metadata
+        """
+        response = await self._arequest(
+            "GET",
+            "/{resource_type}s",
+            {"resource_type": resource_type},
+            params={"skip": skip, "limit": limit},
+        )
+        self._handle_error(response)
+        return self._parse_json_response(response)
+
+    async def aget_resource(self, resource_type: str, resource_id: str) -> dict[str, Any]:
+        """Get resource details (async).
+
+        Args:
+            resource_type: Type of resource
+            resource_id: Resource ID
+
+        Returns:
+            Resource details
+        """
+        response = await self._arequest(
+            "GET",
+            "/{resource_type}s/{resource_id}",
+            {"resource_type": resource_type, "resource_id": resource_id},
+        )
+        self._handle_error(response)
+        return self._parse_json_response(response)
+
+    async def adownload(
+        self,
+        resource_type: str,
+        resource_id: str,
+        output_path: str | Path,
+        format: str = "zip",
+        version: str | None = None,
+        priority: str = "normal",
+    ) -> Path:
+        """Download a resource (async).
+
+        Args:
+            resource_type: Type of resource
+            resource_id: Resource ID
+            output_path: Output file or directory path
+            format: Download format (zip, python)
+            version: Optional version to download
+            priority: Scheduling class when the client has a download scheduler
+
+        Returns:
+            Path to downloaded file
+        """
+        params = {"format": format}
+        if version:
+            params["version"] = version
+
+        async with self._transfer(resource_type, resource_id, priority) as transfer:
+            response = await self._arequest(
+                "GET",
+                "/{resource_type}s/{resource_id}/download",
+                {"resource_type": resource_type, "resource_id": resource_id},
+                stream=True,
+                params=params,
+                # Archives are already compressed
+                headers={"Accept-Encoding": "identity"},
+                follow_redirects=True,
+            )
+            try:
+                self._handle_error(response)
+
+                output = Path(output_path)
+                if output.is_dir():
+                    resource = await self.aget_resource(resource_type, resource_id)
+                    name = resource.get("name", "resource")
+                    ver = resource.get("version", "1.0.0")
+                    suffix = "zip" if format == "zip" else "tar.gz"
+                    output = output / f"{name}-{ver}.{suffix}"
+
+                if transfer is not None:
+                    transfer.set_size(_content_length(response))
+                try:
+                    # File writes run in a worker thread so they never block the event loop
+                    f = await asyncio.to_thread(open, output, "wb")
+                    try:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            await asyncio.to_thread(f.write, chunk)
+                            if transfer is not None:
+                                await transfer.athrottle(len(chunk))
+                    finally:
+                        await asyncio.to_thread(f.close)
+                except BaseException:
+                    output.unlink(missing_ok=True)
+                    raise
+            finally:
+                await response.aclose()
+        return output
 
     # Compatibility aliases for CLI
     def get_resource(self, resource_type: str, resource_id: str) -> dict[str, Any]:
@@ -652,6 +1325,51 @@ class DavybotMarketClient:
             raise NotFoundError("Resource not found")
         elif response.status_code == 422:
             raise ValidationError("Validation error")
+        elif response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded")
         elif response.status_code >= 400:
             raise APIError(f"API error: {response.status_code}")
         response.raise_for_status()
+
+
+def _content_length(response: httpx.Response) -> int | None:
+    """Size of a response body from its Content-Length header, if valid."""
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+class _ClosingStream(httpx.SyncByteStream):
+    """Response body stream that calls ``on_close`` once it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._on_close()
+
+
+class _AsyncClosingStream(httpx.AsyncByteStream):
+    """Async counterpart of :class:`_ClosingStream`."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
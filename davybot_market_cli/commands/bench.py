@@ -0,0 +1,136 @@
+"""Bench command for CLI."""
+
+import asyncio
+import json
+import os
+from contextlib import ExitStack
+
+import click
+import httpx
+
+from ..bench import DEFAULT_MIX, BenchResult, parse_mix, run_benchmark
+from ..exceptions import DavybotMarketError
+from ..testing import FakeMarketServer
+from ..transport import MODES, cassette_transport
+
+
+@click.command()
+@click.option(
+    "--mix",
+    default=",".join(f"{name}={weight:g}" for name, weight in DEFAULT_MIX.items()),
+    show_default=True,
+    help="Weighted operations: search, get_resource, list, download",
+)
+@click.option("--requests", "-n", default=1000, show_default=True, help="Measured requests")
+@click.option("--concurrency", "-c", default=16, show_default=True, help="Requests in flight")
+@click.option("--warmup", default=50, show_default=True, help="Unmeasured warm-up requests")
+@click.option("--query", "-q", default="resource", show_default=True, help="Search query")
+@click.option("--seed", default=0, show_default=True, help="Seed for the request schedule")
+@click.option(
+    "--local", is_flag=True, help="Benchmark a local stand-in server instead of the market"
+)
+@click.option(
+    "--local-latency",
+    default=0.0,
+    show_default=True,
+    help="Seconds the stand-in server waits before each response",
+)
+@click.option(
+    "--cassette",
+    type=click.Path(dir_okay=False),
+    help="Record requests to, or replay them from, a cassette file",
+)
+@click.option(
+    "--cassette-mode",
+    type=click.Choice(MODES),
+    default="auto",
+    show_default=True,
+    help="Record, replay, or replay if the cassette exists",
+)
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    mix: str,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    query: str,
+    seed: int,
+    local: bool,
+    local_latency: float,
+    cassette: str | None,
+    cassette_mode: str,
+    output: str,
+) -> None:
+    """Measure market API throughput and latency.
+
+    Examples:
+
+        davy bench --requests 2000 --concurrency 32
+
+        davy bench --mix search=1,download=1 --output json
+
+        davy bench --local --output json
+
+        davy bench --cassette market.jsonl.gz --requests 10000
+    """
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--mix")
+    if requests < 1 or concurrency < 1:
+        raise click.BadParameter("--requests and --concurrency must be positive")
+
+    root = ctx.find_root().obj or {}
+    base_url = root.get("api_url") or os.environ.get(
+        "DAVYBOT_API_URL", "http://localhost:8000/api/v1"
+    )
+    with ExitStack() as stack:
+        if local:
+            base_url = stack.enter_context(FakeMarketServer(latency=local_latency)).base_url
+        try:
+            transport = cassette_transport(cassette, cassette_mode) if cassette else None
+            result = asyncio.run(
+                run_benchmark(
+                    base_url,
+                    weights,
+                    requests=requests,
+                    concurrency=concurrency,
+                    warmup=warmup,
+                    query=query,
+                    seed=seed,
+                    api_key=os.environ.get("DAVYBOT_API_KEY"),
+                    transport=transport,
+                )
+            )
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            click.echo(click.style(f"Benchmark failed: {e}", fg="red"), err=True)
+            raise click.Abort()
+
+    if output == "json":
+        click.echo(json.dumps(result.to_dict(), indent=2))
+    else:
+        _print_result(result)
+
+
+def _print_result(result: BenchResult) -> None:
+    """Print throughput and a latency table."""
+    total = result.total
+    click.echo(click.style(f"Benchmark of {result.base_url}", bold=True))
+    click.echo(
+        f"  {total.count} requests, concurrency {result.concurrency}, "
+        f"{result.elapsed:.2f} s, {result.throughput:.1f} req/s, {total.errors} errors"
+    )
+    columns = ("mean", "p50", "p90", "p99", "p999", "max")
+    click.echo(
+        f"\n  {'operation':<14}{'count':>7}{'errors':>8}" + "".join(f"{c:>9}" for c in columns)
+    )
+    rows = [*result.operations.values(), total]
+    for stats in rows:
+        summary = stats.summary()
+        latencies = "".join(f"{summary.get(f'{c}_ms', 0.0):9.2f}" for c in columns)
+        click.echo(f"  {stats.name:<14}{stats.count:>7}{stats.errors:>8}{latencies}")
+    click.echo("  (latencies in ms)")
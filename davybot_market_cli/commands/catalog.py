@@ -0,0 +1,208 @@
+"""Catalog command for CLI."""
+
+import json
+import time
+from typing import Any
+
+import click
+
+from ..catalog import RESOURCE_TYPES, CatalogTable, iter_pages
+from ..exceptions import DavybotMarketError, SnapshotError
+from ..snapshot import CatalogSnapshot, SnapshotRecord, write_snapshot
+
+
+def _fetch_items(resource_type: str | None, page_size: int) -> list[dict[str, Any]]:
+    """Page the market's listings into resource dictionaries."""
+    # Imported here so `davy catalog query` works offline without loading httpx
+    import httpx
+
+    from ..utils import get_api_client
+
+    types = [resource_type] if resource_type else list(RESOURCE_TYPES)
+    with get_api_client() as client:
+        try:
+            return [
+                item
+                for page in iter_pages(client, types, page_size)
+                for item in page.get("items") or []
+            ]
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            click.echo(click.style(f"Error fetching catalog: {e}", fg="red"), err=True)
+            raise click.Abort()
+
+
+def _load(resource_type: str | None, page_size: int) -> CatalogTable:
+    """Fetch the catalog, turning a missing optional dependency into a CLI error."""
+    try:
+        return CatalogTable.from_items(_fetch_items(resource_type, page_size))
+    except ImportError as e:
+        raise click.ClickException(str(e))
+
+
+@click.group()
+def catalog() -> None:
+    """Analyze the whole market catalog in bulk.
+
+    Examples:
+
+        davy catalog top --by downloads -k 20 --tag web
+
+        davy catalog export catalog.parquet
+
+        davy catalog snapshot && davy catalog query --tag web --by rating
+    """
+
+
+@catalog.command()
+@click.option(
+    "--type", "-t", "resource_type", type=click.Choice(RESOURCE_TYPES), help="Resource type"
+)
+@click.option(
+    "--by",
+    "column",
+    type=click.Choice(["downloads", "rating"]),
+    default="downloads",
+    show_default=True,
+    help="Ranking column",
+)
+@click.option("-k", "k", default=10, show_default=True, help="Number of resources to show")
+@click.option("--tag", "tags", multiple=True, help="Required tag (repeatable)")
+@click.option("--min-rating", type=float, help="Minimum average rating")
+@click.option("--page-size", default=100, show_default=True, help="Items fetched per request")
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def top(
+    resource_type: str | None,
+    column: str,
+    k: int,
+    tags: tuple[str, ...],
+    min_rating: float | None,
+    page_size: int,
+    output: str,
+) -> None:
+    """Rank resources by downloads or rating."""
+    table = _load(resource_type, page_size)
+    ranked = table.where(resource_type, min_rating=min_rating, tags_all=tags).top_k(column, k)
+    records = ranked.to_records()
+
+    if output == "json":
+        click.echo(json.dumps(records, indent=2))
+        return
+    if not records:
+        click.echo(click.style("No matching resources.", fg="yellow"))
+        return
+    for i, record in enumerate(records, 1):
+        uri = f"{record['type']}://{record['name']}"
+        click.echo(
+            f"{i:>3}. {click.style(uri, fg='cyan', bold=True)}  "
+            f"downloads={record['downloads']}  rating={record['rating']:.1f}"
+        )
+
+
+@catalog.command()
+@click.argument("path", type=click.Path(dir_okay=False))
+@click.option(
+    "--type", "-t", "resource_type", type=click.Choice(RESOURCE_TYPES), help="Resource type"
+)
+@click.option(
+    "--format",
+    "-f",
+    "file_format",
+    type=click.Choice(["parquet", "arrow"]),
+    help="File format (default: from the file extension)",
+)
+@click.option("--page-size", default=100, show_default=True, help="Items fetched per request")
+def export(path: str, resource_type: str | None, file_format: str | None, page_size: int) -> None:
+    """Export the catalog as a Parquet or Arrow file."""
+    if file_format is None:
+        file_format = "arrow" if path.endswith((".arrow", ".feather", ".ipc")) else "parquet"
+    table = _load(resource_type, page_size)
+    try:
+        if file_format == "parquet":
+            table.write_parquet(path)
+        else:
+            table.write_arrow(path)
+    except ImportError as e:
+        raise click.ClickException(str(e))
+    click.echo(click.style(f"Exported {len(table)} resources to {path}", fg="green"))
+
+
+@catalog.command()
+@click.option(
+    "--type", "-t", "resource_type", type=click.Choice(RESOURCE_TYPES), help="Resource type"
+)
+@click.option("--path", "-p", type=click.Path(dir_okay=False), help="Snapshot file")
+@click.option("--page-size", default=100, show_default=True, help="Items fetched per request")
+def snapshot(resource_type: str | None, path: str | None, page_size: int) -> None:
+    """Save the catalog as a binary snapshot for offline queries."""
+    items = _fetch_items(resource_type, page_size)
+    written = write_snapshot(items, path)
+    click.echo(click.style(f"Saved {len(items)} resources to {written}", fg="green"))
+
+
+@catalog.command()
+@click.option("--name", "-n", help="Look up a single resource by name")
+@click.option(
+    "--type", "-t", "resource_type", type=click.Choice(RESOURCE_TYPES), help="Resource type"
+)
+@click.option("--tag", "tags", multiple=True, help="Required tag (repeatable)")
+@click.option("--min-rating", type=float, help="Minimum average rating")
+@click.option("--min-downloads", type=int, help="Minimum download count")
+@click.option("--by", "sort_by", type=click.Choice(["downloads", "rating"]), help="Rank by")
+@click.option("-k", "limit", default=20, show_default=True, help="Maximum number of results")
+@click.option("--path", "-p", type=click.Path(dir_okay=False), help="Snapshot file")
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def query(
+    name: str | None,
+    resource_type: str | None,
+    tags: tuple[str, ...],
+    min_rating: float | None,
+    min_downloads: int | None,
+    sort_by: str | None,
+    limit: int,
+    path: str | None,
+    output: str,
+) -> None:
+    """Query the saved catalog snapshot without network access."""
+    try:
+        snap = CatalogSnapshot.open(path)
+    except SnapshotError as e:
+        raise click.ClickException(f"{e}. Run `davy catalog snapshot` first.")
+
+    with snap:
+        if name:
+            found = snap.find(name, resource_type)
+            records = [found] if found else []
+        else:
+            records = snap.query(
+                resource_type=resource_type,
+                tags=tags,
+                min_rating=min_rating,
+                min_downloads=min_downloads,
+                sort_by=sort_by,
+                limit=limit,
+            )
+        age = time.time() - snap.built_at
+
+    if output == "json":
+        click.echo(json.dumps([record.to_dict() for record in records], indent=2))
+        return
+    if not records:
+        click.echo(click.style("No matching resources.", fg="yellow"))
+    else:
+        _print_records(records)
+    click.echo(f"Snapshot age: {age / 3600:.1f}h")
+
+
+def _print_records(records: list[SnapshotRecord]) -> None:
+    """Print snapshot records one per line."""
+    for record in records:
+        uri = f"{record.type}://{record.name}"
+        tags = f"  [{', '.join(record.tags)}]" if record.tags else ""
+        click.echo(
+            f"{click.style(uri, fg='cyan', bold=True)}  {record.version}  "
+            f"downloads={record.downloads}  rating={record.rating:.1f}{tags}"
+        )
@@ -0,0 +1,110 @@
+"""Daemon command for CLI."""
+
+import json
+from pathlib import Path
+
+import click
+
+from ..daemon import MarketDaemon, default_socket_path, default_watch_list_path, send_control
+from ..scheduler import DownloadScheduler, parse_rate
+
+
+@click.group()
+def daemon() -> None:
+    """Run or control the local warm-up daemon.
+
+    While the daemon runs, other davy commands send read-only requests
+    through it over a Unix socket and reuse its warm connections, metadata
+    cache and prefetched archives. Commands fall back to direct requests
+    when it is not running; set DAVYBOT_NO_DAEMON=1 to bypass it.
+
+    Examples:
+
+        davy daemon start --watch ./watchlist &
+
+        davy daemon status
+
+        davy daemon stop
+    """
+
+
+@daemon.command()
+@click.option(
+    "--watch",
+    "-w",
+    type=click.Path(dir_okay=False),
+    help="File of resource URIs to prefetch, one per line (default: data dir watchlist)",
+)
+@click.option("--ttl", default=60.0, show_default=True, help="Metadata cache TTL in seconds")
+@click.option("--refresh", default=60.0, show_default=True, help="Seconds between warm-up passes")
+@click.option("--limit-rate", help="Bandwidth budget for all downloads, e.g. 20M (bytes/s)")
+@click.option("--background-rate", help="Bandwidth budget for prefetches, e.g. 2M (bytes/s)")
+def start(
+    watch: str | None,
+    ttl: float,
+    refresh: float,
+    limit_rate: str | None,
+    background_rate: str | None,
+) -> None:
+    """Run the daemon in the foreground.
+
+    Downloads served by the daemon share one scheduler: prefetches of watched
+    resources run in the background class and pause while commands download.
+    """
+    try:
+        scheduler = DownloadScheduler(
+            bandwidth=parse_rate(limit_rate) if limit_rate else None,
+            background_bandwidth=parse_rate(background_rate) if background_rate else None,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    watch_path = Path(watch) if watch else default_watch_list_path()
+    watch_list: list[str] = []
+    if watch_path.is_file():
+        for line in watch_path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                watch_list.append(line)
+
+    server = MarketDaemon(
+        watch_list=watch_list, cache_ttl=ttl, refresh_interval=refresh, scheduler=scheduler
+    )
+    click.echo(f"Listening on {server.socket_path} ({len(watch_list)} watched resources)")
+    try:
+        server.serve_forever()
+    except RuntimeError as e:
+        click.echo(click.style(f"Error: {e}", fg="red"), err=True)
+        raise click.Abort()
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command()
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def status(output: str) -> None:
+    """Show whether the daemon is running."""
+    try:
+        info = send_control("__status__")
+    except OSError:
+        click.echo(click.style(f"Daemon not running ({default_socket_path()})", fg="yellow"))
+        return
+
+    if output == "json":
+        click.echo(json.dumps(info, indent=2))
+        return
+    click.echo(click.style("[OK] Daemon is running", fg="green", bold=True))
+    for key, value in info.items():
+        click.echo(f"  {key}: {round(value, 1) if isinstance(value, float) else value}")
+
+
+@daemon.command()
+def stop() -> None:
+    """Stop a running daemon."""
+    try:
+        send_control("__shutdown__")
+    except OSError:
+        click.echo(click.style("Daemon not running.", fg="yellow"))
+        return
+    click.echo(click.style("Daemon stopped.", fg="green"))
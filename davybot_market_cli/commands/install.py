@@ -2,9 +2,13 @@
 
 import click
 import httpx
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ..utils import get_api_client, parse_resource_uri
+from typing import Any
+from .. import installer
+from ..registry import Registry
+from ..resolver import DependencyResolver
+from ..utils import get_api_client, get_cache_dir, parse_resource_uri
 
 
 @click.command()
@@ -14,9 +18,28 @@ from ..utils import get_api_client, parse_resource_uri
 )
 @click.option("--output", "-o", type=click.Path(), default=".", help="Output directory")
 @click.option("--dev", is_flag=True, help="Install in development mode")
-def install(resource_uri: str, format: str, output: str, dev: bool) -> None:
+@click.option("--no-deps", is_flag=True, help="Do not install declared dependencies")
+@click.option("--jobs", "-j", default=4, show_default=True, help="Parallel downloads")
+@click.option("--refresh", is_flag=True, help="Ignore cached dependency resolutions")
+def install(
+    resource_uri: str,
+    format: str,
+    output: str,
+    dev: bool,
+    no_deps: bool,
+    jobs: int,
+    refresh: bool,
+) -> None:
     """Install a resource from the market.
 
+    The resource is unpacked into OUTPUT/<name> atomically: files are staged
+    next to the target and swapped in with a rename, and the replaced version
+    is kept for `davy rollback`.
+
+    Dependencies declared in the resource's metadata (skills and MCP servers
+    used by an agent, for example) are resolved and downloaded in parallel,
+    then activated dependencies-first.
+
     RESOURCE_URI can be:
     - Full URI: skill://skill-name or agent://agent-name
     - Resource ID: abc123-def456
@@ -28,6 +51,8 @@ def install(resource_uri: str, format: str, output: str, dev: bool) -> None:
         dawi install agent://data-analyst --format python
 
         dawi install abc123-def456 --output ./my-skills
+
+        dawi install agent://data-analyst --no-deps
     """
     output_dir = Path(output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -57,25 +82,70 @@ def install(resource_uri: str, format: str, output: str, dev: bool) -> None:
                 raise click.Abort()
 
     with get_api_client() as client:
+        staged: list[installer.StagedInstall] = []
+        activated = 0
         try:
-            click.echo(f"Downloading {resource_type}...")
-            downloaded_path = client.download_resource(
-                resource_type, resource_id, format=format, output_dir=output_dir
-            )
-
-            click.echo(click.style(f"Downloaded to: {downloaded_path}", fg="green", bold=True))
-
-            # Extract if zip
-            if format == "zip" and downloaded_path.suffix == ".zip":
-                click.echo("Extracting...")
-                with zipfile.ZipFile(downloaded_path, "r") as zip_ref:
-                    zip_ref.extractall(output_dir)
-                    extracted_files = zip_ref.namelist()
-                click.echo(click.style(f"Extracted {len(extracted_files)} files.", fg="green"))
-
-                # Optionally remove zip file
-                # downloaded_path.unlink()
-
+            # (type, id, version to download, known metadata) in activation order
+            plan: list[tuple[str, str, str | None, dict[str, Any] | None]] = []
+            if no_deps:
+                plan.append((resource_type, resource_id, None, None))
+            else:
+                resolver = DependencyResolver(client, max_workers=jobs, cache_dir=get_cache_dir())
+                resolution = resolver.resolve(resource_type, resource_id, refresh=refresh)
+                order = resolution.install_order()
+                # Install directories are named after the resource, not its type
+                installer.check_targets(output_dir, ((n.resource_type, n.name) for n in order))
+                for node in order:
+                    metadata = {"id": node.resource_id, "name": node.name, "version": node.version}
+                    # Download exactly the resolved version, which may come from a cached
+                    # resolution, so the manifest and registry record what was installed
+                    plan.append((node.resource_type, node.resource_id, node.version, metadata))
+                if len(plan) > 1:
+                    click.echo(f"Resolved {len(plan) - 1} dependencies.")
+
+            click.echo(f"Downloading {len(plan)} resource(s)...")
+            errors: list[BaseException] = []
+            with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+                futures = [
+                    pool.submit(
+                        installer.stage_resource,
+                        client,
+                        item_type,
+                        item_id,
+                        output_dir,
+                        format,
+                        pin,
+                        metadata,
+                    )
+                    for item_type, item_id, pin, metadata in plan
+                ]
+                for future in futures:
+                    error = future.exception()
+                    if error is None:
+                        staged.append(future.result())
+                    else:
+                        errors.append(error)
+            if errors:
+                raise errors[0]
+
+            with Registry() as registry:
+                for item in staged:
+                    previous = installer.activate(item)
+                    activated += 1
+                    registry.record_install(item)
+                    click.echo(
+                        click.style(
+                            f"Installed {item.resource_type}://{item.name} {item.version} "
+                            f"({item.file_count} files) to: {item.target}",
+                            fg="green",
+                        )
+                    )
+                    if previous is not None:
+                        click.echo(
+                            f"  Previous version kept; undo with: "
+                            f"davy rollback {item.resource_type}://{item.target.name} "
+                            f"--output {output_dir}"
+                        )
             click.echo(click.style("Installation complete!", fg="green", bold=True))
 
         except httpx.HTTPError as e:
@@ -84,3 +154,6 @@ def install(resource_uri: str, format: str, output: str, dev: bool) -> None:
         except Exception as e:
             click.echo(click.style(f"Error: {e}", fg="red"), err=True)
             raise click.Abort()
+        finally:
+            for item in staged[activated:]:
+                installer.discard_staging(item.staging)
@@ -0,0 +1,80 @@
+"""List command for CLI."""
+
+import json
+
+import click
+import httpx
+
+from ..exceptions import DavybotMarketError
+from ..registry import Registry
+from ..utils import get_api_client
+
+RESOURCE_TYPES = ["skill", "agent", "mcp", "knowledge"]
+
+
+@click.command(name="list")
+@click.option(
+    "--type",
+    "-t",
+    "resource_type",
+    type=click.Choice(RESOURCE_TYPES),
+    help="Filter by resource type",
+)
+@click.option("--installed", "-i", is_flag=True, help="List locally installed resources")
+@click.option("--limit", "-l", default=20, help="Maximum number of results per type")
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def list_resources(resource_type: str | None, installed: bool, limit: int, output: str) -> None:
+    """List resources in the market, or those installed locally.
+
+    Examples:
+
+        davy list --type skill
+
+        davy list --installed
+
+        davy list --installed --type agent --output json
+    """
+    if installed:
+        with Registry() as registry:
+            entries = registry.all(resource_type)
+
+        if output == "json":
+            click.echo(json.dumps([entry.to_dict() for entry in entries], indent=2))
+            return
+        if not entries:
+            click.echo(click.style("No resources installed.", fg="yellow"))
+            return
+        for entry in entries:
+            click.echo(f"{click.style(entry.uri, fg='cyan', bold=True)}  {entry.version}")
+            click.echo(f"   Path: {entry.path}")
+        return
+
+    with get_api_client() as client:
+        try:
+            listers = {
+                "skill": client.list_skills,
+                "agent": client.list_agents,
+                "mcp": client.list_mcp_servers,
+                "knowledge": client.list_knowledge_bases,
+            }
+            types = [resource_type] if resource_type else RESOURCE_TYPES
+            items = []
+            for item_type in types:
+                items.extend(listers[item_type](limit=limit).get("items", []))
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            click.echo(click.style(f"Error listing resources: {e}", fg="red"), err=True)
+            raise click.Abort()
+
+    if output == "json":
+        click.echo(json.dumps(items, indent=2))
+        return
+    if not items:
+        click.echo(click.style("No resources found.", fg="yellow"))
+        return
+    for item in items:
+        click.echo(
+            f"{click.style(item['name'], fg='cyan', bold=True)} ({item['type']}) "
+            f"{item.get('version', '')} - {item.get('rating', 0.0):.1f}★"
+        )
@@ -0,0 +1,57 @@
+"""Outdated command for CLI."""
+
+import json
+
+import click
+import httpx
+
+from ..exceptions import DavybotMarketError
+from ..registry import Registry, find_outdated
+from ..utils import get_api_client
+
+
+@click.command()
+@click.option(
+    "--type",
+    "-t",
+    "resource_type",
+    type=click.Choice(["skill", "agent", "mcp", "knowledge"]),
+    help="Filter by resource type",
+)
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def outdated(resource_type: str | None, output: str) -> None:
+    """Show installed resources with newer versions in the market.
+
+    All installed resources are checked in a single batched request.
+
+    Examples:
+
+        davy outdated
+
+        davy outdated --type skill --output json
+    """
+    with Registry() as registry, get_api_client() as client:
+        try:
+            results = find_outdated(client, registry, resource_type)
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            click.echo(click.style(f"Error checking versions: {e}", fg="red"), err=True)
+            raise click.Abort()
+
+    if output == "json":
+        click.echo(
+            json.dumps(
+                [{**entry.to_dict(), "latest_version": latest} for entry, latest in results],
+                indent=2,
+            )
+        )
+        return
+
+    if not results:
+        click.echo(click.style("All installed resources are up to date.", fg="green"))
+        return
+
+    click.echo(click.style(f"{len(results)} outdated resources:", bold=True))
+    for entry, latest in results:
+        click.echo(f"  {click.style(entry.uri, fg='cyan')}  {entry.version} -> {latest}")
@@ -5,7 +5,7 @@ import httpx
 import json
 from pathlib import Path
 from typing import Dict
-from ..utils import get_api_client
+from ..utils import collect_files, get_api_client
 
 
 @click.command()
@@ -50,17 +50,7 @@ def publish(
         )
         raise click.Abort()
     elif path_obj.is_dir():
-        # Read all files in directory
-        for file_path in path_obj.rglob("*"):
-            if file_path.is_file() and not any(part.startswith(".") for part in file_path.parts):
-                try:
-                    relative_path = file_path.relative_to(path_obj)
-                    files[str(relative_path)] = file_path.read_text(
-                        encoding="utf-8", errors="ignore"
-                    )
-                except Exception:
-                    # Skip binary files
-                    pass
+        files = collect_files(path_obj)
 
     if not files:
         click.echo(click.style(f"No files found in {path}", fg="yellow"), err=True)
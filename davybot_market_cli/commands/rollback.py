@@ -0,0 +1,55 @@
+"""Rollback command for CLI."""
+
+from pathlib import Path
+
+import click
+
+from .. import installer
+from ..exceptions import InstallError
+from ..registry import InstalledResource, Registry
+from ..utils import parse_resource_uri
+
+
+@click.command()
+@click.argument("resource_uri")
+@click.option(
+    "--output", "-o", type=click.Path(), default=".", help="Directory the resource is installed in"
+)
+def rollback(resource_uri: str, output: str) -> None:
+    """Restore the version replaced by the last install.
+
+    Rolling back swaps the active and previous versions, so running the
+    command twice returns to the newer version.
+
+    Examples:
+
+        davy rollback skill://web-scraper
+
+        davy rollback agent://data-analyst --output ./my-agents
+    """
+    _, name = parse_resource_uri(resource_uri)
+    target = installer.target_dir_for(Path(output), name)
+
+    try:
+        installer.rollback(target)
+    except (InstallError, OSError) as e:
+        click.echo(click.style(f"Error: {e}", fg="red"), err=True)
+        raise click.Abort()
+
+    manifest = installer.read_manifest(target)
+    version = manifest.get("version", "unknown")
+    if manifest.get("type") and manifest.get("id"):
+        with Registry() as registry:
+            registry.record(
+                InstalledResource(
+                    resource_type=manifest["type"],
+                    resource_id=manifest["id"],
+                    name=manifest.get("name", target.name),
+                    version=version,
+                    path=str(target.resolve()),
+                    hash=manifest.get("hash", ""),
+                )
+            )
+    click.echo(
+        click.style(f"Rolled back {target.name} to version {version}", fg="green", bold=True)
+    )
@@ -2,6 +2,7 @@
 
 import click
 import httpx
+from ..search_cache import SearchCache
 from ..utils import get_api_client
 from ..exit_codes import (
     ERROR_NETWORK,
@@ -28,7 +29,8 @@ from ..exceptions import (
 @click.option(
     "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
 )
-def search(query: str, type: str, limit: int, output: str) -> None:
+@click.option("--fresh", is_flag=True, help="Bypass the search result cache")
+def search(query: str, type: str, limit: int, output: str, fresh: bool) -> None:
     """Search for resources in the market.
 
     Examples:
@@ -38,10 +40,14 @@ def search(query: str, type: str, limit: int, output: str) -> None:
         dawi search "agent" --type agent
 
         dawi search "data processing" --limit 50 --output json
+
+    Results are cached; repeated searches are answered at once and refreshed
+    in the background once they are a few minutes old. Use --fresh to wait for
+    the API instead.
     """
-    with get_api_client() as client:
+    with get_api_client() as client, SearchCache() as cache:
         try:
-            result = client.search(query, resource_type=type, limit=limit)
+            result = cache.search(client, query, resource_type=type, limit=limit, fresh=fresh)
 
             if output == "json":
                 import json
@@ -0,0 +1,167 @@
+"""Upgrade command for CLI."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import click
+import httpx
+
+from .. import installer
+from ..exceptions import DavybotMarketError
+from ..registry import InstalledResource, Registry, find_outdated
+from ..utils import get_api_client, parse_resource_uri
+
+
+@click.command()
+@click.argument("resource_uris", nargs=-1)
+@click.option("--all", "upgrade_all", is_flag=True, help="Upgrade every installed resource")
+@click.option(
+    "--type",
+    "-t",
+    "resource_type",
+    type=click.Choice(["skill", "agent", "mcp", "knowledge"]),
+    help="Only upgrade resources of this type",
+)
+@click.option("--jobs", "-j", default=4, show_default=True, help="Parallel downloads")
+@click.option("--dry-run", is_flag=True, help="Show what would be upgraded")
+@click.option(
+    "--background", is_flag=True, help="Download at background priority, yielding to other installs"
+)
+@click.option(
+    "--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format"
+)
+def upgrade(
+    resource_uris: tuple[str, ...],
+    upgrade_all: bool,
+    resource_type: str | None,
+    jobs: int,
+    dry_run: bool,
+    background: bool,
+    output: str,
+) -> None:
+    """Upgrade installed resources to their latest market versions.
+
+    Installed versions are compared against the market in one batched
+    request; only resources with a newer version are downloaded. Downloads
+    run in parallel and each upgrade is swapped in atomically, keeping the
+    replaced version for `davy rollback`.
+
+    Examples:
+
+        davy upgrade --all
+
+        davy upgrade skill://web-scraper agent://data-analyst
+
+        davy upgrade --all --type skill --jobs 8 --dry-run
+
+        davy upgrade --all --background
+    """
+    if not upgrade_all and not resource_uris:
+        click.echo(click.style("Specify resources to upgrade or use --all.", fg="yellow"), err=True)
+        raise click.Abort()
+
+    timings: dict[str, float] = {}
+    upgraded: list[tuple[InstalledResource, str]] = []
+    failed: list[tuple[InstalledResource, str]] = []
+
+    with Registry() as registry, get_api_client() as client:
+        started = time.perf_counter()
+        try:
+            outdated = find_outdated(client, registry, resource_type)
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            click.echo(click.style(f"Error checking versions: {e}", fg="red"), err=True)
+            raise click.Abort()
+        if resource_uris:
+            wanted = {parse_resource_uri(uri) for uri in resource_uris}
+            outdated = [
+                (entry, latest)
+                for entry, latest in outdated
+                if (entry.resource_type, entry.resource_id) in wanted
+                or (entry.resource_type, entry.name) in wanted
+                or (None, entry.resource_id) in wanted
+                or (None, entry.name) in wanted
+            ]
+        timings["check"] = time.perf_counter() - started
+
+        if dry_run or not outdated:
+            _print_summary(outdated, [], timings, output, dry_run=dry_run)
+            return
+
+        started = time.perf_counter()
+        staged: dict[int, installer.StagedInstall] = {}
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = {
+                pool.submit(
+                    installer.stage_resource,
+                    client,
+                    entry.resource_type,
+                    entry.resource_id,
+                    Path(entry.path).parent,
+                    installer.read_manifest(Path(entry.path)).get("format", "zip"),
+                    latest,
+                    {"id": entry.resource_id, "name": entry.name, "version": latest},
+                    "background" if background else "normal",
+                ): index
+                for index, (entry, latest) in enumerate(outdated)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                error = future.exception()
+                if error is None:
+                    staged[index] = future.result()
+                else:
+                    failed.append((outdated[index][0], str(error)))
+        timings["download"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for index, item in sorted(staged.items()):
+            entry = outdated[index][0]
+            try:
+                installer.activate(item)
+            except (DavybotMarketError, OSError) as e:
+                installer.discard_staging(item.staging)
+                failed.append((entry, str(e)))
+                continue
+            registry.record_install(item)
+            upgraded.append((entry, item.version))
+        timings["apply"] = time.perf_counter() - started
+
+    _print_summary(upgraded, failed, timings, output)
+    if failed:
+        raise click.Abort()
+
+
+def _print_summary(
+    changes: list[tuple[InstalledResource, str]],
+    failed: list[tuple[InstalledResource, str]],
+    timings: dict[str, float],
+    output: str,
+    dry_run: bool = False,
+) -> None:
+    """Print what changed and how long each phase took."""
+    if output == "json":
+        summary = {
+            "dry_run": dry_run,
+            "upgraded": [{**entry.to_dict(), "new_version": version} for entry, version in changes],
+            "failed": [{**entry.to_dict(), "error": error} for entry, error in failed],
+            "timings": timings,
+        }
+        click.echo(json.dumps(summary, indent=2))
+        return
+
+    if not changes and not failed:
+        click.echo(click.style("All installed resources are up to date.", fg="green"))
+    elif changes:
+        heading = "Would upgrade" if dry_run else "Upgraded"
+        click.echo(click.style(f"{heading} {len(changes)} resources:", bold=True))
+        for entry, version in changes:
+            click.echo(f"  {click.style(entry.uri, fg='cyan')}  {entry.version} -> {version}")
+    if failed:
+        click.echo(click.style(f"Failed to upgrade {len(failed)} resources:", fg="red"), err=True)
+        for entry, error in failed:
+            click.echo(f"  {entry.uri}: {error}", err=True)
+
+    phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+    click.echo(f"Timings: {phases}")
@@ -0,0 +1,83 @@
+"""HTTP compression: response encoding negotiation and request body compression.
+
+JSON responses compress well, so the client asks for the best content coding
+httpx can decode in this environment: ``zstd`` (needs ``zstandard``) and
+``br`` (needs ``brotli`` or ``brotlicffi``) when installed, otherwise ``gzip``.
+Install the ``compression`` extra to enable both. Archive downloads ask for
+``identity``, as they are already compressed.
+
+Request compression is opt-in, as not every server decodes compressed
+requests: with ``compression_threshold`` set on the client (or
+``DAVYBOT_COMPRESS_REQUESTS`` for the CLI), JSON request bodies of at least
+that many bytes are sent with ``Content-Encoding: gzip``.
+"""
+
+import gzip
+import importlib
+
+import httpx
+
+# Encodings we ask for, most preferred first, with their quality values
+PREFERENCE = (("zstd", "1.0"), ("br", "0.9"), ("gzip", "0.8"))
+# Suggested threshold: smaller request bodies are not worth compressing
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+# A fast level: bodies are compressed on every call
+COMPRESSION_LEVEL = 5
+
+
+def _httpx_version() -> tuple[int, ...]:
+    """Numeric part of the installed httpx version."""
+    parts = []
+    for part in httpx.__version__.split(".")[:3]:
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def _importable(*modules: str) -> bool:
+    """Whether any of the modules can be imported."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def supported_encodings() -> list[str]:
+    """Response content codings httpx can decode here, most preferred first."""
+    supported = {"gzip"}
+    # httpx decodes zstd (since 0.27.1) and br when their libraries are installed
+    if _importable("zstandard") and _httpx_version() >= (0, 27, 1):
+        supported.add("zstd")
+    if _importable("brotli", "brotlicffi"):
+        supported.add("br")
+    return [name for name, _ in PREFERENCE if name in supported]
+
+
+def accept_encoding() -> str:
+    """Value for the ``Accept-Encoding`` request header."""
+    supported = supported_encodings()
+    return ", ".join(
+        name if quality == "1.0" else f"{name};q={quality}"
+        for name, quality in PREFERENCE
+        if name in supported
+    )
+
+
+def compress_body(body: bytes, threshold: int | None) -> bytes | None:
+    """Gzip a request body, if it is large enough and compressing pays off.
+
+    Args:
+        body: Encoded request body
+        threshold: Minimum body size to compress (None to never compress)
+
+    Returns:
+        The compressed body, or None to send it as is
+    """
+    if threshold is None or len(body) < threshold:
+        return None
+    compressed = gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    return compressed if len(compressed) < len(body) else None
@@ -0,0 +1,521 @@
+"""Local warm-up daemon and the client that talks to it.
+
+``davy daemon start`` runs a long-lived process that owns one pooled
+:class:`DavybotMarketClient`, keeps its connections alive, caches metadata
+responses and prefetches the archives of a watch-list of resources. CLI
+commands reach it over a Unix socket through :class:`DaemonClient`, which
+falls back to talking to the market directly whenever the daemon is not
+running or cannot serve a request.
+
+The wire protocol is one JSON object per line in each direction::
+
+    -> {"method": "get_resource", "args": ["skill", "web-scraper"],
+        "kwargs": {}, "base_url": "https://market.example/api/v1"}
+    <- {"ok": true, "result": {...}}
+    <- {"ok": false, "error": "NotFoundError", "message": "Resource not found"}
+"""
+
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Self
+
+import httpx
+
+from . import exceptions
+from .client import DavybotMarketClient
+from .scheduler import DownloadScheduler
+from .utils import get_cache_dir, get_data_dir, parse_resource_uri
+
+# Read-only methods served through the daemon, and those whose results it caches
+PROXIED_METHODS = (
+    "health",
+    "search",
+    "list_skills",
+    "list_agents",
+    "list_mcp_servers",
+    "list_knowledge_bases",
+    "list_resources",
+    "get_skill",
+    "get_agent",
+    "get_mcp_server",
+    "get_knowledge_base",
+    "get_resource",
+    "get_resource_ratings",
+    "get_average_rating",
+    "find_similar",
+    "get_similar",
+    "check_updates",
+    "download",
+    "download_resource",
+)
+CACHED_METHODS = frozenset(PROXIED_METHODS) - {
+    "health",
+    "check_updates",
+    "download",
+    "download_resource",
+}
+# Output path argument (position, keyword) of proxied methods that write files
+PATH_ARGUMENTS = {"download": (2, "output_path"), "download_resource": (4, "output_dir")}
+
+
+def _absolute_paths(
+    method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any]]:
+    """Arguments of a proxied call with paths made absolute.
+
+    The daemon runs in its own working directory, so relative paths must be
+    resolved against the caller's before they are sent.
+    """
+    position, keyword = PATH_ARGUMENTS.get(method, (-1, ""))
+    absolute = [
+        str(Path(a).resolve()) if isinstance(a, os.PathLike) or i == position else a
+        for i, a in enumerate(args)
+    ]
+    absolute_kwargs = {
+        k: str(Path(v).resolve()) if isinstance(v, os.PathLike) or k == keyword else v
+        for k, v in kwargs.items()
+    }
+    return absolute, absolute_kwargs
+
+
+def default_socket_path() -> Path:
+    """Get the daemon socket path.
+
+    Uses ``DAVYBOT_DAEMON_SOCKET`` if set, otherwise ``daemon.sock`` in the
+    cache directory.
+
+    Returns:
+        Socket path
+    """
+    if os.environ.get("DAVYBOT_DAEMON_SOCKET"):
+        return Path(os.environ["DAVYBOT_DAEMON_SOCKET"])
+    return get_cache_dir() / "daemon.sock"
+
+
+def default_watch_list_path() -> Path:
+    """Get the default watch-list file (one resource URI per line)."""
+    return get_data_dir() / "watchlist"
+
+
+def daemon_available(socket_path: Path | None = None) -> bool:
+    """Check whether a daemon socket appears to be present.
+
+    This only checks for the socket file; :class:`DaemonClient` falls back to
+    direct mode if the daemon behind it is gone.
+
+    Args:
+        socket_path: Socket path (defaults to :func:`default_socket_path`)
+
+    Returns:
+        True if a daemon may be listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    return (socket_path or default_socket_path()).exists()
+
+
+class _DaemonUnavailable(Exception):
+    """The daemon could not serve a request; use direct mode instead."""
+
+
+class DaemonClient(DavybotMarketClient):
+    """Market client that routes read-only calls through the local daemon.
+
+    It is a drop-in replacement for :class:`DavybotMarketClient`. Methods not
+    served by the daemon, and every method once the daemon has failed, run
+    directly against the market.
+    """
+
+    def __init__(self, socket_path: Path | None = None, **kwargs: Any):
+        """Initialize the client.
+
+        Args:
+            socket_path: Daemon socket (defaults to :func:`default_socket_path`)
+            **kwargs: Passed to :class:`DavybotMarketClient`
+        """
+        super().__init__(**kwargs)
+        self.socket_path = socket_path or default_socket_path()
+        self._local = threading.local()
+        self._sockets: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._direct = False
+
+    def __enter__(self) -> Self:
+        """Enter context manager; the direct connection is opened lazily."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager."""
+        with self._lock:
+            for sock in self._sockets:
+                sock.close()
+            self._sockets.clear()
+        super().__exit__(*args)
+
+    def _connection(self) -> tuple[socket.socket, Any]:
+        """Get this thread's daemon connection, connecting if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            conn = (sock, sock.makefile("rb"))
+            self._local.conn = conn
+            with self._lock:
+                self._sockets.append(sock)
+        return conn  # type: ignore[no-any-return]
+
+    def _remote(
+        self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, bool]:
+        """Send one call to the daemon.
+
+        Returns:
+            The call's result, and whether the daemon answered from its cache
+        """
+        sent_args, sent_kwargs = _absolute_paths(method, args, kwargs)
+        request = {
+            "method": method,
+            "args": sent_args,
+            "kwargs": sent_kwargs,
+            "base_url": self.base_url,
+        }
+        try:
+            sock, reader = self._connection()
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            line = reader.readline()
+        except (OSError, ValueError) as e:
+            self._local.conn = None
+            raise _DaemonUnavailable(str(e)) from e
+        if not line:
+            self._local.conn = None
+            raise _DaemonUnavailable("daemon closed the connection")
+
+        reply = json.loads(line)
+        if reply.get("ok"):
+            return reply.get("result"), bool(reply.get("cached"))
+        error = reply.get("error", "")
+        if error == "Unavailable":
+            raise _DaemonUnavailable(reply.get("message", ""))
+        error_class = getattr(exceptions, error, None)
+        if not (isinstance(error_class, type) and issubclass(error_class, Exception)):
+            error_class = exceptions.APIError
+        raise error_class(reply.get("message", ""))
+
+    def _open_direct(self) -> None:
+        """Open the direct connection to the market if it is not open yet."""
+        with self._lock:
+            if self._client is None:
+                DavybotMarketClient.__enter__(self)
+
+    def _use_direct(self) -> None:
+        """Switch to direct mode for the rest of this client's life."""
+        self._direct = True
+        self._open_direct()
+
+    def _dispatch(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a method through the daemon, or directly if it is unavailable."""
+        if not self._direct:
+            with self.tracer.span(f"daemon {method}", kind="daemon") as span:
+                try:
+                    result, span.cache_hit = self._remote(method, args, kwargs)
+                except _DaemonUnavailable as e:
+                    span.error = f"unavailable: {e}"
+                else:
+                    return Path(result) if method in ("download", "download_resource") else result
+            self._use_direct()
+        return getattr(DavybotMarketClient, method)(self, *args, **kwargs)
+
+    def _get_client(self) -> httpx.Client:
+        """Get the direct client, opening it on first use."""
+        if self._client is None:
+            self._open_direct()
+        return super()._get_client()
+
+
+def _make_proxy(name: str) -> Callable[..., Any]:
+    """Build a DaemonClient method that dispatches ``name``."""
+
+    def proxy(self: DaemonClient, *args: Any, **kwargs: Any) -> Any:
+        return self._dispatch(name, *args, **kwargs)
+
+    proxy.__name__ = name
+    proxy.__doc__ = getattr(DavybotMarketClient, name).__doc__
+    return proxy
+
+
+for _name in PROXIED_METHODS:
+    setattr(DaemonClient, _name, _make_proxy(_name))
+
+
+class MarketDaemon:
+    """The long-lived process behind ``davy daemon start``."""
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        base_url: str | None = None,
+        watch_list: list[str] | None = None,
+        cache_ttl: float = 60.0,
+        refresh_interval: float = 60.0,
+        max_cache_entries: int = 4096,
+        prefetch_dir: Path | None = None,
+        scheduler: DownloadScheduler | None = None,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Socket to listen on
+            base_url: Market API base URL
+            watch_list: Resource URIs to keep prefetched
+            cache_ttl: Seconds a cached metadata response stays fresh
+            refresh_interval: Seconds between warm-up passes
+            max_cache_entries: Maximum cached metadata responses
+            prefetch_dir: Directory for prefetched archives
+            scheduler: Download scheduler shared by every download the daemon
+                serves; prefetches run in its background class
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.watch_list = list(watch_list or [])
+        self.cache_ttl = cache_ttl
+        self.refresh_interval = refresh_interval
+        self.max_cache_entries = max_cache_entries
+        self.prefetch_dir = prefetch_dir or get_cache_dir() / "prefetch"
+        # Keep pooled connections alive across the gaps between warm-up passes
+        self.client = DavybotMarketClient(
+            base_url=base_url,
+            limits=httpx.Limits(keepalive_expiry=max(refresh_interval * 2, 30.0)),
+            scheduler=scheduler or DownloadScheduler(),
+        )
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._prefetched: dict[tuple[str, str, str], Path] = {}
+        self._stop = threading.Event()
+        self._server: Any = None
+        self.started_at = time.time()
+        self.stats = {"requests": 0, "cache_hits": 0, "prefetch_hits": 0, "errors": 0}
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until :meth:`shutdown` is called."""
+        import socketserver
+
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise RuntimeError("The daemon requires Unix domain socket support")
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        reply = daemon.handle(json.loads(line))
+                    except ValueError as e:
+                        reply = {"ok": False, "error": "ValidationError", "message": str(e)}
+                    self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                    if reply.get("shutdown"):
+                        threading.Thread(target=daemon.shutdown, daemon=True).start()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if self._socket_in_use():
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.client.__enter__()
+        server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        server.daemon_threads = True
+        self._server = server
+        os.chmod(self.socket_path, 0o600)
+        warmer = threading.Thread(target=self._warm_loop, name="davy-warmup", daemon=True)
+        warmer.start()
+        try:
+            server.serve_forever()
+        finally:
+            self._stop.set()
+            server.server_close()
+            self.client.__exit__()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop serving."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _socket_in_use(self) -> bool:
+        """Check whether another process is accepting on the socket path."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                return False
+        return True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Serve one request.
+
+        Args:
+            request: Decoded request line
+
+        Returns:
+            Reply to send back
+        """
+        method = request.get("method", "")
+        if method == "__status__":
+            return {"ok": True, "result": self.status()}
+        if method == "__shutdown__":
+            return {"ok": True, "result": None, "shutdown": True}
+        if method not in PROXIED_METHODS:
+            return {"ok": False, "error": "Unavailable", "message": f"Not proxied: {method}"}
+        if request.get("base_url") and request["base_url"] != self.client.base_url:
+            return {"ok": False, "error": "Unavailable", "message": "Different market URL"}
+
+        self.stats["requests"] += 1
+        args = list(request.get("args", []))
+        kwargs = dict(request.get("kwargs", {}))
+        cached = False
+        try:
+            if method in ("download", "download_resource"):
+                result: Any = self._download(method, args, kwargs)
+            elif method in CACHED_METHODS:
+                result, cached = self._cached_call(method, args, kwargs)
+            else:
+                result = getattr(self.client, method)(*args, **kwargs)
+        except exceptions.DavybotMarketError as e:
+            self.stats["errors"] += 1
+            return {"ok": False, "error": type(e).__name__, "message": str(e)}
+        except httpx.HTTPError as e:
+            self.stats["errors"] += 1
+            return {"ok": False, "error": "ConnectionError", "message": str(e)}
+        return {"ok": True, "result": result, "cached": cached}
+
+    def status(self) -> dict[str, Any]:
+        """Describe the daemon's state."""
+        return {
+            "pid": os.getpid(),
+            "base_url": self.client.base_url,
+            "uptime": time.time() - self.started_at,
+            "cache_entries": len(self._cache),
+            "watched": len(self.watch_list),
+            "prefetched": len(self._prefetched),
+            "transfers": len(self.client.scheduler.active) if self.client.scheduler else 0,
+            **self.stats,
+        }
+
+    def _cached_call(
+        self, method: str, args: list[Any], kwargs: dict[str, Any]
+    ) -> tuple[Any, bool]:
+        """Serve a metadata call from the cache, refreshing it when stale.
+
+        Returns:
+            The call's result, and whether it came from the cache
+        """
+        key = json.dumps([method, args, kwargs], sort_keys=True)
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return entry[1], True
+
+        result = getattr(self.client, method)(*args, **kwargs)
+        with self._cache_lock:
+            self._cache[key] = (now, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+        return result, False
+
+    def _download(self, method: str, args: list[Any], kwargs: dict[str, Any]) -> str:
+        """Serve a download, copying a prefetched archive when one matches."""
+        if method == "download_resource":
+            resource_type, resource_id = args[0], args[1]
+            fmt = kwargs.get("format", args[2] if len(args) > 2 else "zip")
+            version = kwargs.get("version", args[3] if len(args) > 3 else None)
+            output = kwargs.get("output_dir", args[4] if len(args) > 4 else ".")
+        else:
+            resource_type, resource_id, output = args[0], args[1], args[2]
+            fmt = kwargs.get("format", args[3] if len(args) > 3 else "zip")
+            version = kwargs.get("version", args[4] if len(args) > 4 else None)
+
+        prefetched = self._prefetched.get((resource_type, resource_id, fmt))
+        if (
+            prefetched is not None
+            and prefetched.exists()
+            and (version is None or version == prefetched.stem.rsplit("-", 1)[-1])
+        ):
+            destination = Path(output)
+            if destination.is_dir():
+                destination = destination / prefetched.name
+            shutil.copyfile(prefetched, destination)
+            self.stats["prefetch_hits"] += 1
+            return str(destination)
+
+        return str(getattr(self.client, method)(*args, **kwargs))
+
+    def _warm_loop(self) -> None:
+        """Keep connections, metadata and watched archives warm."""
+        while not self._stop.is_set():
+            try:
+                self.client.health()
+            except (exceptions.DavybotMarketError, httpx.HTTPError):
+                pass
+            for uri in self.watch_list:
+                if self._stop.is_set():
+                    break
+                try:
+                    self._prefetch(uri)
+                except (exceptions.DavybotMarketError, httpx.HTTPError, OSError):
+                    self.stats["errors"] += 1
+            self._stop.wait(self.refresh_interval)
+
+    def _prefetch(self, uri: str) -> None:
+        """Refresh metadata for a watched resource and fetch its latest archive."""
+        resource_type, resource_id = parse_resource_uri(uri)
+        if resource_type is None:
+            return
+        args: list[Any] = [resource_type, resource_id]
+        key = json.dumps(["get_resource", args, {}], sort_keys=True)
+        resource = self.client.get_resource(resource_type, resource_id)
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), resource)
+
+        name = str(resource.get("name") or resource_id).replace("/", "_")
+        version = str(resource.get("version", "1.0.0"))
+        path = self.prefetch_dir / resource_type / f"{name}-{version}.zip"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(".part")
+            self.client.download(resource_type, resource_id, partial, "zip", priority="background")
+            os.replace(partial, path)
+        self._prefetched[(resource_type, resource_id, "zip")] = path
+        if resource.get("id"):
+            self._prefetched[(resource_type, str(resource["id"]), "zip")] = path
+
+
+def send_control(method: str, socket_path: Path | None = None) -> Any:
+    """Send a control request (``__status__``, ``__shutdown__``) to the daemon.
+
+    Args:
+        method: Control method name
+        socket_path: Daemon socket
+
+    Returns:
+        The daemon's result
+    """
+    path = socket_path or default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5.0)
+        sock.connect(str(path))
+        sock.sendall(json.dumps({"method": method}).encode("utf-8") + b"\n")
+        reply = json.loads(sock.makefile("rb").readline())
+    return reply.get("result")
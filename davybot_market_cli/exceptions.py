@@ -4,40 +4,46 @@
 class DavybotMarketError(Exception):
     """Base exception for DavyBot Market SDK."""
 
-    pass
-
 
 class AuthenticationError(DavybotMarketError):
     """Raised when authentication fails."""
 
-    pass
-
 
 class NotFoundError(DavybotMarketError):
     """Raised when a resource is not found."""
 
-    pass
-
 
 class ValidationError(DavybotMarketError):
     """Raised when request validation fails."""
 
-    pass
-
 
 class APIError(DavybotMarketError):
     """Raised when the API returns an error."""
 
-    pass
+
+class RateLimitError(APIError):
+    """Raised when the API keeps rejecting requests for exceeding its rate limit."""
 
 
 class ConnectionError(DavybotMarketError):
     """Raised when connection to the API fails."""
 
-    pass
-
 
 class DownloadError(DavybotMarketError):
     """Raised when a download fails."""
 
-    pass
+
+class InstallError(DavybotMarketError):
+    """Raised when a resource cannot be installed or rolled back."""
+
+
+class ResolutionError(DavybotMarketError):
+    """Raised when resource dependencies cannot be resolved."""
+
+
+class SnapshotError(DavybotMarketError):
+    """Raised when a catalog snapshot is missing or unreadable."""
+
+
+class CassetteError(DavybotMarketError):
+    """Raised when a cassette cannot be read or has no matching response."""
@@ -0,0 +1,267 @@
+"""Background submission of user feedback with bounded logs and binary screenshots.
+
+A :class:`~davybot_market_cli.types.feedback.Feedback` carries screenshots as
+inline base64 strings and logs as an unbounded list. Serialising that as one
+JSON document can take tens of megabytes of memory. :class:`FeedbackSubmitter`
+sends a multipart request instead:
+
+- the report itself is a small JSON part, with ``screenshots`` emptied and
+  ``appLogs`` replaced by the tail held in a :class:`LogBuffer`;
+- each screenshot is a separate binary part, streamed from disk when given as
+  a path. Formats that are not already compressed are gzipped first.
+
+Submission runs on a background thread with retries, so filing a report never
+blocks (or slows down) the command that is misbehaving::
+
+    logs = LogBuffer()
+    logging.getLogger("davybot_market_cli").addHandler(logs.handler())
+    ...
+    with FeedbackSubmitter(client, logs=logs) as submitter:
+        future = submitter.submit(feedback, screenshots=[Path("screen.png")])
+"""
+
+import base64
+import gzip
+import io
+import logging
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Self
+
+import httpx
+
+from .exceptions import APIError, ConnectionError
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+    from .types.feedback import Feedback
+
+DEFAULT_LOG_BYTES = 256 * 1024
+DEFAULT_LOG_LINES = 2000
+DEFAULT_RETRIES = 4
+RETRY_DELAY = 1.0
+# Leading bytes of image formats that are already compressed
+_COMPRESSED_SIGNATURES = (b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"RIFF")
+# Attachments larger than this are compressed through a temporary file
+_SPOOL_BYTES = 4 * 2**20
+
+Screenshot = Path | bytes | str
+
+
+class LogBuffer:
+    """Ring buffer of recent log lines, capped by line count and total size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_LOG_BYTES, max_lines: int = DEFAULT_LOG_LINES):
+        """Initialize an empty buffer.
+
+        Args:
+            max_bytes: Total UTF-8 size kept; the oldest lines are dropped first
+            max_lines: Number of lines kept
+        """
+        self.max_bytes = max_bytes
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._sizes: deque[int] = deque(maxlen=max_lines)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def append(self, line: str) -> None:
+        """Add a line, evicting old lines to stay within the caps."""
+        data = line.encode("utf-8", "replace")
+        if len(data) > self.max_bytes:
+            line = data[-self.max_bytes :].decode("utf-8", "ignore")
+            data = line.encode("utf-8")
+        encoded = len(data)
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self._size -= self._sizes[0]
+                self.dropped += 1
+            self._lines.append(line)
+            self._sizes.append(encoded)
+            self._size += encoded
+            while self._size > self.max_bytes:
+                self._lines.popleft()
+                self._size -= self._sizes.popleft()
+                self.dropped += 1
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """Add several lines."""
+        for line in lines:
+            self.append(line)
+
+    def lines(self) -> list[str]:
+        """The buffered lines, oldest first."""
+        with self._lock:
+            return list(self._lines)
+
+    @property
+    def size(self) -> int:
+        """UTF-8 size of the buffered lines."""
+        return self._size
+
+    def handler(self, level: int = logging.INFO) -> logging.Handler:
+        """A logging handler that writes formatted records into this buffer."""
+        return _BufferHandler(self, level)
+
+
+class _BufferHandler(logging.Handler):
+    """Logging handler feeding a LogBuffer."""
+
+    def __init__(self, buffer: LogBuffer, level: int):
+        super().__init__(level)
+        self.buffer = buffer
+        self.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:  # noqa: BLE001  # pragma: no cover - logging must never raise
+            self.handleError(record)
+
+
+def _is_compressed(head: bytes) -> bool:
+    return head.startswith(_COMPRESSED_SIGNATURES)
+
+
+def _content_type(head: bytes) -> str:
+    if head.startswith(b"\x89PNG"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"GIF8"):
+        return "image/gif"
+    if head.startswith(b"RIFF"):
+        return "image/webp"
+    return "application/octet-stream"
+
+
+class Attachment:
+    """One screenshot, opened afresh for every upload attempt."""
+
+    def __init__(self, source: Screenshot, name: str):
+        """Initialize the attachment.
+
+        Args:
+            source: File path, raw bytes, or a base64 string (optionally a data URL)
+            name: Part file name
+        """
+        if isinstance(source, str):
+            source = base64.b64decode(source.split(",", 1)[-1])
+        self.source = source
+        self.name = name
+
+    def _raw(self) -> IO[bytes]:
+        if isinstance(self.source, Path):
+            return self.source.open("rb")
+        return io.BytesIO(self.source)
+
+    def part(self) -> tuple[str, IO[bytes], str, dict[str, str]]:
+        """Build the multipart file tuple; the caller closes the stream.
+
+        Returns:
+            ``(filename, stream, content type, headers)`` for httpx ``files``
+        """
+        raw = self._raw()
+        head = raw.read(16)
+        raw.seek(0)
+        content_type = _content_type(head)
+        if _is_compressed(head):
+            return self.name, raw, content_type, {}
+        # Compress into a file that spills to disk, so large images stay out of memory
+        compressed = tempfile.SpooledTemporaryFile(max_size=_SPOOL_BYTES)  # noqa: SIM115
+        with raw, gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=6) as gz:
+            shutil.copyfileobj(raw, gz)
+        compressed.seek(0)
+        return self.name + ".gz", compressed, content_type, {"Content-Encoding": "gzip"}
+
+
+class FeedbackSubmitter:
+    """Submit feedback reports from a background thread with retries."""
+
+    def __init__(
+        self,
+        client: "DavybotMarketClient",
+        logs: LogBuffer | None = None,
+        max_retries: int = DEFAULT_RETRIES,
+        retry_delay: float = RETRY_DELAY,
+    ):
+        """Initialize the submitter.
+
+        Args:
+            client: Open market client
+            logs: Log buffer whose lines are attached as ``appLogs``
+            max_retries: Attempts after the first that may be made for one report
+            retry_delay: Wait before the first retry, doubling after each failure
+        """
+        self.client = client
+        self.logs = logs
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        # One worker: reports go out one at a time, behind whatever the user is doing
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="davybot-feedback")
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Wait for pending reports and stop."""
+        self.close()
+
+    def submit(
+        self, feedback: "Feedback", screenshots: Sequence[Screenshot] = ()
+    ) -> "Future[dict[str, Any]]":
+        """Queue a report for submission.
+
+        Args:
+            feedback: The report; inline ``screenshots`` are sent as binary parts
+            screenshots: Additional screenshots (paths are streamed from disk)
+
+        Returns:
+            Future resolving to the API response (see FeedbackResponse)
+        """
+        logs = self.logs.lines() if self.logs is not None else feedback.appLogs
+        if self.logs is None and logs:
+            bounded = LogBuffer()
+            bounded.extend(logs)
+            logs = bounded.lines()
+        sources = [*feedback.screenshots, *screenshots]
+        attachments = [
+            Attachment(source, source.name if isinstance(source, Path) else f"screenshot-{i}")
+            for i, source in enumerate(sources)
+        ]
+        report = feedback.model_dump(mode="json", exclude_none=True)
+        report.update(appLogs=logs, screenshots=[])
+        return self._executor.submit(self._send, report, attachments)
+
+    def _send(self, report: dict[str, Any], attachments: list[Attachment]) -> dict[str, Any]:
+        """Upload one report, retrying transient failures."""
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            parts = [attachment.part() for attachment in attachments]
+            try:
+                return self.client.submit_feedback(report, parts)
+            # Authentication and validation errors are not retried
+            except (APIError, ConnectionError, httpx.TransportError):
+                if attempt == self.max_retries:
+                    raise
+            finally:
+                for part in parts:
+                    part[1].close()
+            time.sleep(delay)
+            delay *= 2
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting reports.
+
+        Args:
+            wait: Wait for queued reports to be submitted
+        """
+        self._executor.shutdown(wait=wait)
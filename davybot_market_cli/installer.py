@@ -0,0 +1,350 @@
+"""Atomic, rollback-capable installation of downloaded resources.
+
+A resource is never extracted directly into its install directory. Instead it
+is unpacked into a staging directory next to the target and swapped in with a
+rename, so an interrupted install leaves the previous version untouched. The
+version being replaced is kept beside the target and can be restored with
+:func:`rollback`.
+
+Layout for a resource installed into ``./skills``::
+
+    skills/
+        web-scraper/                  # active version
+        .web-scraper.previous/        # version replaced by the last install
+        .web-scraper.staging-XXXX/    # only present while an install runs
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import InstallError
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+MANIFEST_NAME = ".davy-install.json"
+
+
+@dataclass
+class StagedInstall:
+    """A downloaded and unpacked resource waiting to be activated."""
+
+    resource_type: str
+    resource_id: str
+    name: str
+    version: str
+    format: str
+    target: Path
+    staging: Path
+    file_count: int = 0
+    content_hash: str = ""
+
+    def manifest(self) -> dict[str, Any]:
+        """Build the install manifest for this resource."""
+        return {
+            "type": self.resource_type,
+            "id": self.resource_id,
+            "name": self.name,
+            "version": self.version,
+            "format": self.format,
+            "hash": self.content_hash,
+        }
+
+
+def target_dir_for(output_dir: Path, name: str) -> Path:
+    """Get the install directory for a resource.
+
+    Args:
+        output_dir: Directory resources are installed into
+        name: Resource name
+
+    Returns:
+        Path of the resource's install directory
+    """
+    safe_name = name.replace("/", "_").replace("\\", "_").strip(".") or "resource"
+    return output_dir / safe_name
+
+
+def check_targets(output_dir: Path, resources: Iterable[tuple[str, str]]) -> None:
+    """Check that resources installed together get separate install directories.
+
+    The install directory is named after the resource only, so e.g.
+    ``skill://foo`` and ``mcp://foo`` cannot share an output directory.
+
+    Args:
+        output_dir: Directory resources are installed into
+        resources: ``(resource type, name)`` of each resource
+
+    Raises:
+        InstallError: If two resources map to the same directory
+    """
+    seen: dict[Path, str] = {}
+    for resource_type, name in resources:
+        target = target_dir_for(output_dir, name)
+        uri = f"{resource_type}://{name}"
+        if target in seen:
+            raise InstallError(
+                f"{seen[target]} and {uri} would both install to {target}; "
+                "install them into separate --output directories"
+            )
+        seen[target] = uri
+
+
+def previous_dir_for(target: Path) -> Path:
+    """Get the directory holding the version replaced by the last install.
+
+    Args:
+        target: Install directory
+
+    Returns:
+        Path of the previous-version directory
+    """
+    return target.with_name(f".{target.name}.previous")
+
+
+def create_staging_dir(target: Path) -> Path:
+    """Create an empty staging directory on the same filesystem as the target.
+
+    Args:
+        target: Install directory the staged files will replace
+
+    Returns:
+        Path of the new staging directory
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f".{target.name}.staging-", dir=target.parent))
+
+
+def discard_staging(staging: Path) -> None:
+    """Remove a staging directory left by a failed install.
+
+    Args:
+        staging: Staging directory
+    """
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def extract_archive(archive: Path, dest: Path) -> list[str]:
+    """Extract a zip archive, refusing members that escape the destination.
+
+    Args:
+        archive: Zip file to extract
+        dest: Destination directory
+
+    Returns:
+        Names of the extracted members
+    """
+    root = dest.resolve()
+    with zipfile.ZipFile(archive, "r") as zip_ref:
+        names = zip_ref.namelist()
+        for member in names:
+            member_path = (root / member).resolve()
+            if member_path != root and root not in member_path.parents:
+                raise InstallError(f"Archive member escapes install directory: {member}")
+        zip_ref.extractall(dest)
+    return names
+
+
+def hash_tree(root: Path) -> str:
+    """Hash the files under a directory, independent of filesystem order.
+
+    The install manifest is excluded so the hash only covers resource files.
+
+    Args:
+        root: Directory to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        relative = path.relative_to(root).as_posix()
+        if relative == MANIFEST_NAME:
+            continue
+        digest.update(relative.encode("utf-8") + b"\0")
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def write_manifest(staging: Path, manifest: dict[str, Any]) -> None:
+    """Record what was installed alongside the staged files.
+
+    Args:
+        staging: Staging directory
+        manifest: Install metadata (type, id, name, version, ...)
+    """
+    (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def read_manifest(install_dir: Path) -> dict[str, Any]:
+    """Read the install manifest of an installed or previous version.
+
+    Args:
+        install_dir: Install or previous-version directory
+
+    Returns:
+        Manifest contents, or an empty dict if there is none
+    """
+    manifest_path = install_dir / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {}
+    try:
+        data: Any = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def commit_staging(staging: Path, target: Path) -> Path | None:
+    """Swap a fully staged install into place.
+
+    The current version (if any) is renamed to the previous-version slot and
+    the staging directory is renamed onto the target. If the second rename
+    fails the current version is put back.
+
+    Args:
+        staging: Staging directory holding the new version
+        target: Install directory
+
+    Returns:
+        Path of the kept previous version, or None for a fresh install
+    """
+    previous = previous_dir_for(target)
+    had_current = target.exists()
+    if had_current:
+        if previous.exists():
+            shutil.rmtree(previous)
+        os.replace(target, previous)
+    try:
+        os.replace(staging, target)
+    except OSError as e:
+        if had_current and not target.exists():
+            os.replace(previous, target)
+        raise InstallError(f"Could not activate {target.name}: {e}") from e
+    return previous if had_current else None
+
+
+def rollback(target: Path) -> Path:
+    """Restore the version replaced by the last install.
+
+    The two versions swap places, so running rollback again rolls forward.
+
+    Args:
+        target: Install directory
+
+    Returns:
+        Path of the directory now holding the rolled-back-from version
+    """
+    previous = previous_dir_for(target)
+    if not previous.is_dir():
+        raise InstallError(f"No previous version of {target.name} to roll back to")
+
+    if not target.exists():
+        os.replace(previous, target)
+        return previous
+
+    parking = Path(tempfile.mkdtemp(prefix=f".{target.name}.rollback-", dir=target.parent))
+    parked = parking / target.name
+    os.replace(target, parked)
+    try:
+        os.replace(previous, target)
+    except OSError as e:
+        os.replace(parked, target)
+        shutil.rmtree(parking, ignore_errors=True)
+        raise InstallError(f"Could not roll back {target.name}: {e}") from e
+    os.replace(parked, previous)
+    shutil.rmtree(parking, ignore_errors=True)
+    return previous
+
+
+def stage_resource(
+    client: "DavybotMarketClient",
+    resource_type: str,
+    resource_id: str,
+    output_dir: Path,
+    format: str = "zip",
+    version: str | None = None,
+    resource: dict[str, Any] | None = None,
+    priority: str = "normal",
+) -> StagedInstall:
+    """Download and unpack a resource into a staging directory.
+
+    Nothing under the install directory changes until :func:`activate` is
+    called, so staging can safely run concurrently for many resources.
+
+    Args:
+        client: Open market client
+        resource_type: Type of resource
+        resource_id: Resource ID or name
+        output_dir: Directory resources are installed into
+        format: Download format (zip, python)
+        version: Optional version to download
+        resource: Resource metadata, fetched if not given
+        priority: Download scheduling class ('urgent', 'normal' or 'background')
+
+    Returns:
+        The staged install
+    """
+    if resource is None:
+        resource = client.get_resource(resource_type, resource_id)
+    name = str(resource.get("name") or resource_id)
+    resolved_version = version or str(resource.get("version", "1.0.0"))
+    target = target_dir_for(output_dir, name)
+    staging = create_staging_dir(target)
+
+    try:
+        suffix = "zip" if format == "zip" else "tar.gz"
+        archive = client.download(
+            resource_type,
+            resource_id,
+            staging / f"{target.name}-{resolved_version}.{suffix}",
+            format,
+            version,
+            priority=priority,
+        )
+        with client.tracer.span("extract", resource=f"{resource_type}://{name}") as span:
+            file_count = 1
+            if format == "zip" and archive.suffix == ".zip":
+                file_count = len(extract_archive(archive, staging))
+                archive.unlink()
+            content_hash = hash_tree(staging)
+            span.attributes["files"] = file_count
+    except BaseException:
+        discard_staging(staging)
+        raise
+
+    return StagedInstall(
+        resource_type=resource_type,
+        resource_id=str(resource.get("id") or resource_id),
+        name=name,
+        version=resolved_version,
+        format=format,
+        target=target,
+        staging=staging,
+        file_count=file_count,
+        content_hash=content_hash,
+    )
+
+
+def activate(staged: StagedInstall) -> Path | None:
+    """Swap a staged resource into its install directory.
+
+    Args:
+        staged: Staged install
+
+    Returns:
+        Path of the kept previous version, or None for a fresh install
+    """
+    write_manifest(staged.staging, staged.manifest())
+    return commit_staging(staged.staging, staged.target)
@@ -1,7 +1,18 @@
 """Data models for DavyBot Market SDK."""
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, overload
+
+from . import _json
+
+
+def _parse_datetime(value: object) -> object:
+    """Parse an ISO 8601 timestamp string, passing other values through."""
+    if value and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
 
 
 @dataclass
@@ -31,13 +42,11 @@ class Resource:
         Returns:
             Resource instance
         """
+        data = dict(data)
+
         # Handle datetime fields
-        created_at_val = data.get("created_at")
-        if created_at_val and isinstance(created_at_val, str):
-            data["created_at"] = datetime.fromisoformat(created_at_val.replace("Z", "+00:00"))
-        updated_at_val = data.get("updated_at")
-        if updated_at_val and isinstance(updated_at_val, str):
-            data["updated_at"] = datetime.fromisoformat(updated_at_val.replace("Z", "+00:00"))
+        data["created_at"] = _parse_datetime(data.get("created_at"))
+        data["updated_at"] = _parse_datetime(data.get("updated_at"))
 
         # Map metadata field
         if "metadata" in data and "extra_metadata" not in data:
@@ -89,12 +98,9 @@ class Rating:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "Rating":
         """Create from API response dictionary."""
-        created_at_val = data.get("created_at")
-        if created_at_val and isinstance(created_at_val, str):
-            data["created_at"] = datetime.fromisoformat(created_at_val.replace("Z", "+00:00"))
-        updated_at_val = data.get("updated_at")
-        if updated_at_val and isinstance(updated_at_val, str):
-            data["updated_at"] = datetime.fromisoformat(updated_at_val.replace("Z", "+00:00"))
+        data = dict(data)
+        data["created_at"] = _parse_datetime(data.get("created_at"))
+        data["updated_at"] = _parse_datetime(data.get("updated_at"))
         return cls(**data)  # type: ignore[arg-type]
 
 
@@ -127,9 +133,8 @@ class Review:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "Review":
         """Create from API response dictionary."""
-        created_at_val = data.get("created_at")
-        if created_at_val and isinstance(created_at_val, str):
-            data["created_at"] = datetime.fromisoformat(created_at_val.replace("Z", "+00:00"))
+        data = dict(data)
+        data["created_at"] = _parse_datetime(data.get("created_at"))
         return cls(**data)  # type: ignore[arg-type]
 
 
@@ -195,3 +200,235 @@ class ResourceListResponse:
             page=page,
             page_size=page_size,
         )
+
+
+_UNSET: Any = object()
+
+
+class ResourceView:
+    """Read-only, lazily decoded view of a resource from an API response.
+
+    Unlike :class:`Resource` it keeps a reference to the decoded JSON object
+    instead of copying it into a dataclass, and parses timestamps only when
+    they are read. Use :meth:`to_resource` to get a full :class:`Resource`.
+    """
+
+    __slots__ = ("_created_at", "_data", "_updated_at")
+
+    def __init__(self, data: dict[str, Any]):
+        """Wrap a decoded resource object.
+
+        Args:
+            data: Resource dictionary (not copied or modified)
+        """
+        self._data = data
+        self._created_at = _UNSET
+        self._updated_at = _UNSET
+
+    def __repr__(self) -> str:
+        """Show the resource identity."""
+        return f"ResourceView(id={self.id!r}, name={self.name!r}, type={self.type!r})"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The underlying API dictionary."""
+        return self._data
+
+    @property
+    def id(self) -> str:
+        """Resource ID."""
+        return str(self._data.get("id", ""))
+
+    @property
+    def name(self) -> str:
+        """Resource name."""
+        return str(self._data.get("name", ""))
+
+    @property
+    def type(self) -> str:
+        """Resource type."""
+        return str(self._data.get("type", ""))
+
+    @property
+    def description(self) -> str | None:
+        """Resource description."""
+        return self._data.get("description")
+
+    @property
+    def author(self) -> str | None:
+        """Resource author."""
+        return self._data.get("author")
+
+    @property
+    def version(self) -> str:
+        """Resource version."""
+        return str(self._data.get("version", "1.0.0"))
+
+    @property
+    def tags(self) -> list[str]:
+        """Resource tags."""
+        return self._data.get("tags") or []
+
+    @property
+    def extra_metadata(self) -> dict[str, object]:
+        """Resource metadata."""
+        return self._data.get("extra_metadata") or self._data.get("metadata") or {}
+
+    @property
+    def downloads(self) -> int:
+        """Download count."""
+        return int(self._data.get("downloads", 0))
+
+    @property
+    def rating(self) -> float:
+        """Average rating."""
+        return float(self._data.get("rating", 0.0))
+
+    @property
+    def created_at(self) -> datetime | None:
+        """Creation time, parsed on first access."""
+        if self._created_at is _UNSET:
+            self._created_at = _parse_datetime(self._data.get("created_at")) or None
+        return self._created_at  # type: ignore[no-any-return]
+
+    @property
+    def updated_at(self) -> datetime | None:
+        """Last update time, parsed on first access."""
+        if self._updated_at is _UNSET:
+            self._updated_at = _parse_datetime(self._data.get("updated_at")) or None
+        return self._updated_at  # type: ignore[no-any-return]
+
+    def to_resource(self) -> Resource:
+        """Decode into a full :class:`Resource` dataclass."""
+        return Resource.from_dict(self._data)
+
+
+class ResourceViewList(Sequence[ResourceView]):
+    """Sequence of resources that wraps each item only when it is accessed."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[Any]):
+        """Wrap a decoded list of resource objects.
+
+        Args:
+            items: Resource dictionaries (non-dict entries become empty views)
+        """
+        self._items = items
+
+    def __len__(self) -> int:
+        """Number of resources."""
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> ResourceView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ResourceViewList": ...
+
+    def __getitem__(self, index: int | slice) -> "ResourceView | ResourceViewList":
+        """Get one resource view, or a lazily wrapped slice."""
+        if isinstance(index, slice):
+            return ResourceViewList(self._items[index])
+        item = self._items[index]
+        return ResourceView(item if isinstance(item, dict) else {})
+
+    def __iter__(self) -> Iterator[ResourceView]:
+        """Iterate over resource views."""
+        for item in self._items:
+            yield ResourceView(item if isinstance(item, dict) else {})
+
+
+def _int_field(data: dict[str, Any], key: str, default: int) -> int:
+    """Read an integer field the way the dataclass decoders do."""
+    value = data.get(key, default)
+    return int(value) if isinstance(value, (int, str)) else default
+
+
+class SearchResultView:
+    """Lazily decoded counterpart of :class:`SearchResult`."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]):
+        """Wrap a decoded search response.
+
+        Args:
+            data: Search response dictionary
+        """
+        self._data = data
+
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "SearchResultView":
+        """Decode a search response body.
+
+        Args:
+            raw: Response body
+
+        Returns:
+            SearchResultView instance
+        """
+        return cls(_json.loads(raw))
+
+    @property
+    def results(self) -> ResourceViewList:
+        """Matching resources."""
+        results = self._data.get("results")
+        return ResourceViewList(results if isinstance(results, list) else [])
+
+    @property
+    def total(self) -> int:
+        """Total number of matches."""
+        return _int_field(self._data, "total", 0)
+
+    @property
+    def query(self) -> str:
+        """The query that was run."""
+        return str(self._data.get("query") or "")
+
+
+class ResourceListView:
+    """Lazily decoded counterpart of :class:`ResourceListResponse`."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]):
+        """Wrap a decoded list response.
+
+        Args:
+            data: List response dictionary
+        """
+        self._data = data
+
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "ResourceListView":
+        """Decode a list response body.
+
+        Args:
+            raw: Response body
+
+        Returns:
+            ResourceListView instance
+        """
+        return cls(_json.loads(raw))
+
+    @property
+    def items(self) -> ResourceViewList:
+        """Resources on this page."""
+        items = self._data.get("items")
+        return ResourceViewList(items if isinstance(items, list) else [])
+
+    @property
+    def total(self) -> int:
+        """Total number of resources."""
+        return _int_field(self._data, "total", 0)
+
+    @property
+    def page(self) -> int:
+        """Page number."""
+        return _int_field(self._data, "page", 1)
+
+    @property
+    def page_size(self) -> int:
+        """Page size."""
+        return _int_field(self._data, "page_size", 20)
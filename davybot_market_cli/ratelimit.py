@@ -0,0 +1,271 @@
+"""Client-side rate limiting.
+
+:class:`RateLimiter` keeps one :class:`TokenBucket` per route group (search,
+metadata, download) and makes every request take a token before it is sent,
+so batch jobs stay under the market's quotas instead of running into them::
+
+    limiter = RateLimiter({"search": 5, "metadata": 20, "download": 2})
+    with DavybotMarketClient(rate_limiter=limiter) as client:
+        ...
+
+The limiter adapts to the server. A ``429`` pauses its group until the
+``Retry-After`` time and halves the group's rate; ``X-RateLimit-Remaining`` and
+``X-RateLimit-Reset`` spread the remaining quota over the rest of the window;
+successful responses raise the rate back towards its configured ceiling.
+
+Buckets are guarded by a thread lock and never block while holding it: a
+caller reserves a token and then sleeps outside the lock (``time.sleep`` or
+``asyncio.sleep``), so one limiter can be shared by threads and async tasks.
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from collections.abc import Callable, Mapping
+
+import httpx
+
+GROUPS = ("search", "metadata", "download")
+# Requests per second per group
+DEFAULT_RATES = {"search": 10.0, "metadata": 25.0, "download": 5.0}
+# Rates are never adapted below this fraction of their ceiling
+MIN_RATE_FRACTION = 0.05
+# Rate increase per successful response, as a fraction of the ceiling
+RECOVERY_FRACTION = 0.05
+
+
+def route_group(method: str, route: str) -> str:
+    """Map a request to its rate limit group.
+
+    Args:
+        method: HTTP method
+        route: Route template, e.g. "/{resource_type}s/{resource_id}/download"
+
+    Returns:
+        'search', 'download' or 'metadata'
+    """
+    if route == "/search":
+        return "search"
+    if route.endswith("/download"):
+        return "download"
+    return "metadata"
+
+
+def parse_rates(spec: str) -> dict[str, float]:
+    """Parse per-group rates such as ``search=5,metadata=20,download=2``.
+
+    Args:
+        spec: Comma-separated ``group=requests_per_second`` pairs
+
+    Returns:
+        Dict of group to rate
+
+    Raises:
+        ValueError: If a group is unknown or a rate is not positive
+    """
+    rates: dict[str, float] = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in GROUPS:
+            raise ValueError(f"Unknown rate limit group {name!r}; use one of {', '.join(GROUPS)}")
+        try:
+            rates[name] = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid rate for {name}: {value!r}") from None
+        if rates[name] <= 0:
+            raise ValueError(f"Rate for {name} must be positive")
+    return rates
+
+
+def retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header.
+
+    Args:
+        value: Header value, in seconds or as an HTTP date
+        now: Current wall-clock time (default: ``time.time()``)
+
+    Returns:
+        Non-negative delay, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    :meth:`reserve` takes tokens immediately, going into debt if needed, and
+    returns how long the caller must wait before using them; callers that
+    reserve later queue up behind the debt.
+    """
+
+    def __init__(
+        self, rate: float, capacity: float | None = None, clock: Callable[[], float] | None = None
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum stored tokens, i.e. the burst size (default: one second of rate)
+            clock: Monotonic clock (default: ``time.monotonic``)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock or time.monotonic
+        self._tokens = self.capacity
+        self._updated = self._clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(now, self._updated)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available now (negative while reservations are outstanding)."""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens, sleeping until they are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: float = 1.0) -> None:
+        """Take tokens, sleeping asynchronously until they are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate; tokens accrued so far are kept."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = max(rate, 1e-9)
+
+    def limit_tokens(self, tokens: float) -> None:
+        """Lower the stored tokens to at most ``tokens``."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``; the bucket restarts empty."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = max(self._paused_until, now + seconds)
+
+
+class RateLimiter:
+    """Per-route-group token buckets that adapt to the server's limits.
+
+    Attributes:
+        ceilings: Configured rate per group; adapted rates never exceed these
+        max_retries: How many times a throttled (429) request is retried
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float] | None = None,
+        burst: float = 1.0,
+        max_retries: int = 3,
+        adaptive: bool = True,
+        clock: Callable[[], float] | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rates: Requests per second per group; missing groups use
+                :data:`DEFAULT_RATES`
+            burst: Bucket capacity in seconds of rate
+            max_retries: Retries for a request answered with 429
+            adaptive: Adjust rates from 429 responses and rate limit headers
+            clock: Monotonic clock (for tests)
+        """
+        self.ceilings = {**DEFAULT_RATES, **(rates or {})}
+        unknown = set(self.ceilings) - set(GROUPS)
+        if unknown:
+            raise ValueError(f"Unknown rate limit groups: {', '.join(sorted(unknown))}")
+        self.max_retries = max_retries
+        self.adaptive = adaptive
+        self.buckets = {
+            group: TokenBucket(rate, max(1.0, rate * burst), clock=clock)
+            for group, rate in self.ceilings.items()
+        }
+
+    def acquire(self, group: str) -> None:
+        """Wait for a request slot in ``group``."""
+        self.buckets[group].acquire()
+
+    async def aacquire(self, group: str) -> None:
+        """Wait asynchronously for a request slot in ``group``."""
+        await self.buckets[group].aacquire()
+
+    def observe(self, group: str, response: httpx.Response) -> None:
+        """Adapt ``group`` to a response's status and rate limit headers."""
+        if not self.adaptive:
+            return
+        bucket = self.buckets[group]
+        ceiling = self.ceilings[group]
+        floor = ceiling * MIN_RATE_FRACTION
+        headers = response.headers
+
+        if response.status_code == 429:
+            delay = retry_after(headers.get("Retry-After"))
+            bucket.set_rate(max(floor, bucket.rate / 2))
+            bucket.pause(delay if delay is not None else 1.0 / bucket.rate)
+            return
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if remaining is not None:
+            bucket.limit_tokens(remaining)
+            if reset is not None:
+                # Reset is either seconds from now or an epoch timestamp
+                window = reset - time.time() if reset > 1e9 else reset
+                if remaining < 1 and window > 0:
+                    bucket.pause(window)
+                elif window > 0:
+                    bucket.set_rate(min(ceiling, max(floor, remaining / window)))
+                return
+        if bucket.rate < ceiling:
+            bucket.set_rate(min(ceiling, bucket.rate + ceiling * RECOVERY_FRACTION))
+
+
+def _header_float(headers: httpx.Headers, name: str) -> float | None:
+    """Read a numeric header, ignoring malformed values."""
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
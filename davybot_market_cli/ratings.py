@@ -0,0 +1,286 @@
+"""Paginated rating iteration and cached, incrementally built rating summaries.
+
+:func:`iter_ratings` walks every page of a resource's ratings, fetching the
+next page on a background thread while the current one is consumed.
+:class:`RatingAggregator` folds ratings into an
+:class:`~davybot_market_cli.models.AverageRating`, including the per-score
+``rating_distribution`` that ``get_average_rating`` does not provide.
+
+:class:`RatingsCache` keeps one aggregate per resource in SQLite (by default
+``~/.cache/davybot/ratings.db``), keyed by the timestamp of the newest rating
+it has seen. Ratings are listed newest first, so refreshing a cached summary
+reads only until the first rating already counted. For an unchanged resource
+that is a single request::
+
+    with RatingsCache() as cache:
+        for resource_id in resource_ids:
+            summary = cache.summary(client, resource_id)
+            print(resource_id, summary.average_rating, summary.rating_distribution)
+"""
+
+import json
+import sqlite3
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from .models import AverageRating
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+DEFAULT_PAGE_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ratings (
+    resource_id TEXT PRIMARY KEY,
+    last_rated TEXT,
+    state TEXT NOT NULL
+);
+"""
+
+
+def iter_ratings(
+    client: "DavybotMarketClient",
+    resource_id: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Generator[dict[str, Any], None, None]:
+    """Iterate over every rating of a resource, page by page.
+
+    Args:
+        client: Open market client
+        resource_id: Resource ID
+        page_size: Ratings requested per page
+        prefetch: Request the next page while the current one is consumed
+
+    Yields:
+        Rating dicts, in API order (newest first)
+    """
+    if not prefetch:
+        skip = 0
+        while True:
+            page = client.get_resource_ratings(resource_id, skip=skip, limit=page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="davybot-ratings") as executor:
+
+        def fetch(skip: int) -> "Future[list[dict[str, Any]]]":
+            return executor.submit(client.get_resource_ratings, resource_id, skip, page_size)
+
+        pending = fetch(0)
+        skip = 0
+        while True:
+            page = pending.result()
+            if len(page) < page_size:
+                yield from page
+                return
+            skip += page_size
+            pending = fetch(skip)
+            try:
+                yield from page
+            except GeneratorExit:
+                pending.cancel()
+                raise
+
+
+def _rated_at(rating: dict[str, Any]) -> datetime | None:
+    """When a rating was last created or changed."""
+    stamps = []
+    for key in ("updated_at", "created_at"):
+        value = rating.get(key)
+        if isinstance(value, str):
+            try:
+                stamp = datetime.fromisoformat(value)
+            except ValueError:
+                continue
+            stamps.append(stamp if stamp.tzinfo else stamp.replace(tzinfo=UTC))
+    return max(stamps, default=None)
+
+
+class RatingAggregator:
+    """Incrementally built rating summary for one resource.
+
+    Attributes:
+        last_rated: Timestamp of the newest rating added
+    """
+
+    def __init__(self, resource_id: str):
+        """Initialize an empty aggregate.
+
+        Args:
+            resource_id: Resource the ratings belong to
+        """
+        self.resource_id = resource_id
+        self.distribution: dict[int, int] = {}
+        self.total = 0
+        self.score_sum = 0
+        self.last_rated: datetime | None = None
+        # Score by rating ID, so re-scored or repeated ratings replace their old score
+        self._scores: dict[str, int] = {}
+        # IDs of the ratings stamped exactly last_rated, to skip them on refresh
+        self._newest_ids: set[str] = set()
+
+    def add(self, rating: dict[str, Any]) -> None:
+        """Fold in one rating."""
+        score = int(rating["score"])
+        rating_id = str(rating["id"]) if "id" in rating else None
+        previous = self._scores.get(rating_id) if rating_id is not None else None
+        if previous is not None:
+            self.distribution[previous] -= 1
+            self.score_sum -= previous
+        else:
+            self.total += 1
+        if rating_id is not None:
+            self._scores[rating_id] = score
+        self.distribution[score] = self.distribution.get(score, 0) + 1
+        self.score_sum += score
+        stamp = _rated_at(rating)
+        if stamp is None:
+            return
+        if self.last_rated is None or stamp > self.last_rated:
+            self.last_rated = stamp
+            self._newest_ids = set()
+        if stamp == self.last_rated and "id" in rating:
+            self._newest_ids.add(str(rating["id"]))
+
+    def seen(self, rating: dict[str, Any]) -> bool:
+        """Whether a rating is no newer than the ones already added."""
+        stamp = _rated_at(rating)
+        if stamp is None or self.last_rated is None:
+            return False
+        if stamp == self.last_rated:
+            return str(rating.get("id")) in self._newest_ids
+        return stamp < self.last_rated
+
+    def result(self) -> AverageRating:
+        """The summary of every rating added."""
+        return AverageRating(
+            resource_id=self.resource_id,
+            average_rating=self.score_sum / self.total if self.total else 0.0,
+            total_ratings=self.total,
+            rating_distribution={s: n for s, n in sorted(self.distribution.items()) if n},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialisable state."""
+        return {
+            "resource_id": self.resource_id,
+            "distribution": {str(score): n for score, n in self.distribution.items()},
+            "total": self.total,
+            "score_sum": self.score_sum,
+            "last_rated": self.last_rated.isoformat() if self.last_rated else None,
+            "newest_ids": sorted(self._newest_ids),
+            "scores": self._scores,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RatingAggregator":
+        """Restore state saved by :meth:`to_dict`."""
+        aggregator = cls(data["resource_id"])
+        aggregator.distribution = {int(score): n for score, n in data["distribution"].items()}
+        aggregator.total = data["total"]
+        aggregator.score_sum = data["score_sum"]
+        if data["last_rated"]:
+            aggregator.last_rated = datetime.fromisoformat(data["last_rated"])
+        aggregator._newest_ids = set(data["newest_ids"])
+        aggregator._scores = data["scores"]
+        return aggregator
+
+
+class RatingsCache:
+    """Rating summaries cached per resource and refreshed incrementally."""
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: Database file (defaults to ratings.db in the cache directory)
+        """
+        if path is None:
+            from .utils import get_cache_dir
+
+            path = get_cache_dir() / "ratings.db"
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        self._connect()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, resource_id: str) -> RatingAggregator | None:
+        """The cached aggregate for a resource, if any."""
+        row = (
+            self._connect()
+            .execute("SELECT state FROM ratings WHERE resource_id = ?", (resource_id,))
+            .fetchone()
+        )
+        return RatingAggregator.from_dict(json.loads(row[0])) if row else None
+
+    def put(self, aggregator: RatingAggregator) -> None:
+        """Store an aggregate."""
+        conn = self._connect()
+        last_rated = aggregator.last_rated.isoformat() if aggregator.last_rated else None
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ratings VALUES (?, ?, ?)",
+                (aggregator.resource_id, last_rated, json.dumps(aggregator.to_dict())),
+            )
+
+    def summary(
+        self, client: "DavybotMarketClient", resource_id: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AverageRating:
+        """Rating summary with distribution, reading only ratings newer than the cache.
+
+        Args:
+            client: Open market client
+            resource_id: Resource ID
+            page_size: Ratings requested per page
+
+        Returns:
+            AverageRating
+        """
+        cached = self.get(resource_id)
+        aggregator = cached or RatingAggregator(resource_id)
+        # A refresh usually stops within the first page, so only a full scan prefetches
+        ratings = iter_ratings(client, resource_id, page_size, prefetch=cached is None)
+        fresh = []
+        with closing(ratings):
+            for rating in ratings:
+                if cached is None:
+                    aggregator.add(rating)
+                elif aggregator.seen(rating):
+                    break
+                else:
+                    fresh.append(rating)
+        # Added only after the scan, so seen() compares against the cached state
+        for rating in fresh:
+            aggregator.add(rating)
+        if cached is None or fresh:
+            self.put(aggregator)
+        return aggregator.result()
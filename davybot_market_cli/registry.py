@@ -0,0 +1,276 @@
+"""Local registry of installed resources.
+
+Every successful install is recorded in a small SQLite database (by default
+``~/.local/share/davybot/registry.db``) keyed by resource type and ID, with a
+secondary index on name so ``type://name`` URIs resolve without touching the
+filesystem or the API.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from .resolver import parse_version
+from .utils import get_data_dir
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+    from .installer import StagedInstall
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS installed (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    path TEXT NOT NULL,
+    hash TEXT NOT NULL DEFAULT '',
+    installed_at REAL NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE INDEX IF NOT EXISTS installed_by_name ON installed (type, name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class InstalledResource:
+    """A resource recorded in the local registry."""
+
+    resource_type: str
+    resource_id: str
+    name: str
+    version: str
+    path: str
+    hash: str = ""
+    installed_at: float = 0.0
+
+    @property
+    def uri(self) -> str:
+        """Resource URI using the resource name."""
+        return f"{self.resource_type}://{self.name}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to an API-style dictionary."""
+        return {
+            "type": self.resource_type,
+            "id": self.resource_id,
+            "name": self.name,
+            "version": self.version,
+            "path": self.path,
+            "hash": self.hash,
+            "installed_at": self.installed_at,
+        }
+
+
+class Registry:
+    """Indexed local record of installed resources.
+
+    Example usage:
+
+        with Registry() as registry:
+            for resource in registry.all():
+                print(resource.uri, resource.version)
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the registry.
+
+        Args:
+            path: Database file (defaults to registry.db in the data directory)
+        """
+        self.path = path or get_data_dir() / "registry.db"
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        self._connect()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def record(self, resource: InstalledResource) -> None:
+        """Insert or replace an installed resource.
+
+        Args:
+            resource: Resource to record
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO installed VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    resource.resource_type,
+                    resource.resource_id,
+                    resource.name,
+                    resource.version,
+                    resource.path,
+                    resource.hash,
+                    resource.installed_at or time.time(),
+                ),
+            )
+
+    def record_install(self, staged: "StagedInstall") -> InstalledResource:
+        """Record a resource that has just been activated.
+
+        Args:
+            staged: Activated install
+
+        Returns:
+            The recorded entry
+        """
+        resource = InstalledResource(
+            resource_type=staged.resource_type,
+            resource_id=staged.resource_id,
+            name=staged.name,
+            version=staged.version,
+            path=str(staged.target.resolve()),
+            hash=staged.content_hash,
+            installed_at=time.time(),
+        )
+        self.record(resource)
+        return resource
+
+    def get(self, resource_type: str, id_or_name: str) -> InstalledResource | None:
+        """Look up an installed resource by ID or name.
+
+        Args:
+            resource_type: Type of resource
+            id_or_name: Resource ID or name
+
+        Returns:
+            The entry, or None if not installed
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT * FROM installed WHERE type = ? AND id = ?", (resource_type, id_or_name)
+        ).fetchone()
+        if row is None:
+            row = conn.execute(
+                "SELECT * FROM installed WHERE type = ? AND name = ?", (resource_type, id_or_name)
+            ).fetchone()
+        return InstalledResource(*row) if row else None
+
+    def remove(self, resource_type: str, resource_id: str) -> None:
+        """Forget an installed resource.
+
+        Args:
+            resource_type: Type of resource
+            resource_id: Resource ID
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "DELETE FROM installed WHERE type = ? AND id = ?", (resource_type, resource_id)
+            )
+
+    def all(self, resource_type: str | None = None) -> list[InstalledResource]:
+        """List installed resources.
+
+        Args:
+            resource_type: Optional resource type filter
+
+        Returns:
+            Installed resources ordered by type and name
+        """
+        conn = self._connect()
+        if resource_type:
+            rows = conn.execute(
+                "SELECT * FROM installed WHERE type = ? ORDER BY name", (resource_type,)
+            )
+        else:
+            rows = conn.execute("SELECT * FROM installed ORDER BY type, name")
+        return [InstalledResource(*row) for row in rows]
+
+    def get_meta(self, key: str) -> str | None:
+        """Read a registry metadata value."""
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Write a registry metadata value."""
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+
+def find_outdated(
+    client: "DavybotMarketClient",
+    registry: Registry,
+    resource_type: str | None = None,
+) -> list[tuple[InstalledResource, str]]:
+    """Compare installed versions against the market in one batched request.
+
+    The previous response and its ETag are kept in the registry, so when the
+    installed set is unchanged the request is conditional and an unchanged
+    market answers with an empty 304.
+
+    Args:
+        client: Open market client
+        registry: Open registry
+        resource_type: Optional resource type filter
+
+    Returns:
+        Pairs of (installed resource, latest version) for outdated resources
+    """
+    installed = registry.all(resource_type)
+    if not installed:
+        return []
+
+    query = [
+        {"type": r.resource_type, "id": r.resource_id, "version": r.version} for r in installed
+    ]
+    query_hash = hashlib.sha256(json.dumps(query, sort_keys=True).encode()).hexdigest()
+    cached: dict[str, Any] = {}
+    cached_raw = registry.get_meta("versions_response")
+    if cached_raw:
+        try:
+            cached = json.loads(cached_raw)
+        except ValueError:
+            cached = {}
+    etag = cached.get("etag") if cached.get("query_hash") == query_hash else None
+
+    result = client.check_updates(query, etag=etag)
+    if result is None:
+        items = cached.get("items", [])
+    else:
+        items = result.get("items", [])
+        registry.set_meta(
+            "versions_response",
+            json.dumps({"query_hash": query_hash, "etag": result.get("etag"), "items": items}),
+        )
+
+    latest = {
+        (str(item.get("type")), str(item.get("id"))): str(item.get("version"))
+        for item in items
+        if isinstance(item, dict) and item.get("version")
+    }
+    outdated = []
+    for resource in installed:
+        version = latest.get((resource.resource_type, resource.resource_id))
+        if version and parse_version(version) > parse_version(resource.version):
+            outdated.append((resource, version))
+    return outdated
@@ -0,0 +1,382 @@
+"""Dependency resolution for resources that depend on other resources.
+
+A resource declares dependencies in ``extra_metadata["dependencies"]``, either
+as a list of URIs with optional version constraints or as a mapping from
+resource type to such a list::
+
+    "dependencies": [
+        "skill://web-scraper@>=1.2,<2.0",
+        {"type": "mcp", "id": "filesystem", "version": "==0.3.1"}
+    ]
+
+    "dependencies": {"skill": ["web-scraper@>=1.2"], "mcp": ["filesystem"]}
+
+The resolver walks the graph breadth-first, fetching the metadata of every
+resource on a level concurrently, and merges repeated references into a single
+node. Each node gets the market's current version when it satisfies every
+constraint placed on it, or an exact ``==`` pin otherwise.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import NotFoundError, ResolutionError
+from .utils import parse_resource_uri
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+VERSION_OPERATORS = ("==", "!=", ">=", "<=", "~=", ">", "<")
+
+_REQUIREMENT_RE = re.compile(r"^(?P<ref>.+?)(?:@(?P<spec>[<>=!~\d*][^@]*))?$")
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """Parse a dotted version into a comparable tuple.
+
+    Non-numeric suffixes (``1.2.0-beta``) are ignored and trailing zeros are
+    dropped, so ``1.0`` and ``1.0.0`` compare equal.
+
+    Args:
+        version: Version string
+
+    Returns:
+        Tuple of integer components
+    """
+    parts: list[int] = []
+    for piece in version.strip().lstrip("vV").split("."):
+        match = re.match(r"\d+", piece)
+        parts.append(int(match.group()) if match else 0)
+        if not piece.isdigit():
+            break
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def satisfies(version: str, spec: str) -> bool:
+    """Check a version against a comma-separated constraint list.
+
+    Args:
+        version: Version string
+        spec: Constraints such as ``>=1.2,<2.0``; empty or ``*`` matches all
+
+    Returns:
+        True if every constraint holds
+    """
+    current = parse_version(version)
+    for clause in spec.split(","):
+        clause = clause.strip()
+        if not clause or clause == "*":
+            continue
+        op = next((o for o in VERSION_OPERATORS if clause.startswith(o)), "==")
+        wanted_raw = clause[len(op) :].strip() if clause.startswith(op) else clause
+        wanted = parse_version(wanted_raw)
+        if op == "==" and current != wanted:
+            return False
+        if op == "!=" and current == wanted:
+            return False
+        if op == ">=" and current < wanted:
+            return False
+        if op == "<=" and current > wanted:
+            return False
+        if op == ">" and current <= wanted:
+            return False
+        if op == "<" and current >= wanted:
+            return False
+        if op == "~=":
+            components = [int(p) for p in re.findall(r"\d+", wanted_raw)]
+            prefix = tuple(components[:-1]) if len(components) > 1 else tuple(components)
+            if current < wanted or current[: len(prefix)] != prefix:
+                return False
+    return True
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """A reference to a resource with an optional version constraint."""
+
+    resource_type: str
+    resource_id: str
+    spec: str = ""
+
+    @property
+    def key(self) -> str:
+        """Node key for the referenced resource."""
+        return f"{self.resource_type}://{self.resource_id}"
+
+    @classmethod
+    def parse(cls, entry: object, default_type: str | None = None) -> "Requirement":
+        """Parse a dependency entry from resource metadata.
+
+        Args:
+            entry: URI string (``skill://name@>=1.0``) or mapping with
+                ``type``, ``id``/``name`` and ``version`` keys
+            default_type: Type to use when the entry does not name one
+
+        Returns:
+            Parsed requirement
+        """
+        if isinstance(entry, str):
+            match = _REQUIREMENT_RE.match(entry.strip())
+            if not match:
+                raise ResolutionError(f"Invalid dependency: {entry!r}")
+            resource_type, resource_id = parse_resource_uri(match.group("ref"))
+            spec = match.group("spec") or ""
+        elif isinstance(entry, dict):
+            resource_type = entry.get("type")
+            resource_id = str(entry.get("id") or entry.get("name") or "")
+            spec = str(entry.get("version") or "")
+        else:
+            raise ResolutionError(f"Invalid dependency: {entry!r}")
+
+        resource_type = resource_type or default_type
+        if not resource_type or not resource_id:
+            raise ResolutionError(f"Dependency must name a type and resource: {entry!r}")
+        return cls(str(resource_type), resource_id, spec.strip())
+
+
+def dependency_entries(resource: dict[str, Any]) -> list[Requirement]:
+    """Read the dependencies declared by a resource.
+
+    Args:
+        resource: Resource metadata as returned by the API
+
+    Returns:
+        Declared requirements
+    """
+    metadata = resource.get("extra_metadata") or resource.get("metadata") or {}
+    declared = metadata.get("dependencies") if isinstance(metadata, dict) else None
+    if not declared:
+        return []
+    if isinstance(declared, dict):
+        return [
+            Requirement.parse(entry, default_type=resource_type)
+            for resource_type, entries in declared.items()
+            for entry in (entries if isinstance(entries, list) else [entries])
+        ]
+    if isinstance(declared, list):
+        return [Requirement.parse(entry) for entry in declared]
+    raise ResolutionError(f"Invalid dependencies for {resource.get('name')}: {declared!r}")
+
+
+@dataclass
+class ResolvedNode:
+    """A resource selected for installation."""
+
+    resource_type: str
+    resource_id: str
+    name: str
+    version: str
+    pinned: bool = False
+    dependencies: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Node key for this resource."""
+        return f"{self.resource_type}://{self.resource_id}"
+
+
+@dataclass
+class Resolution:
+    """A deduplicated dependency graph rooted at one resource."""
+
+    root: str
+    nodes: dict[str, ResolvedNode]
+    from_cache: bool = False
+
+    def install_order(self) -> list[ResolvedNode]:
+        """Order the nodes so every dependency precedes its dependents.
+
+        Returns:
+            Nodes in topological order
+        """
+        order: list[ResolvedNode] = []
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(key: str, path: list[str]) -> None:
+            if state.get(key) == 2:
+                return
+            if state.get(key) == 1:
+                cycle = " -> ".join(path[path.index(key) :] + [key])
+                raise ResolutionError(f"Dependency cycle: {cycle}")
+            state[key] = 1
+            node = self.nodes[key]
+            for dep in node.dependencies:
+                visit(dep, path + [key])
+            state[key] = 2
+            order.append(node)
+
+        visit(self.root, [])
+        return order
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the resolution cache."""
+        return {"root": self.root, "nodes": [asdict(node) for node in self.nodes.values()]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Resolution":
+        """Load from the resolution cache."""
+        nodes = [ResolvedNode(**node) for node in data["nodes"]]
+        return cls(root=data["root"], nodes={node.key: node for node in nodes}, from_cache=True)
+
+
+class DependencyResolver:
+    """Resolve a resource's dependency graph against the market.
+
+    Example usage:
+
+        with DavybotMarketClient() as client:
+            resolution = DependencyResolver(client).resolve("agent", "data-analyst")
+            for node in resolution.install_order():
+                print(node.key, node.version)
+    """
+
+    def __init__(
+        self,
+        client: "DavybotMarketClient",
+        max_workers: int = 4,
+        cache_dir: Path | None = None,
+        cache_ttl: float = 3600.0,
+    ):
+        """Initialize the resolver.
+
+        Args:
+            client: Open market client
+            max_workers: Maximum concurrent metadata requests
+            cache_dir: Directory for cached resolutions (no caching if None)
+            cache_ttl: Seconds a cached resolution stays valid
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+
+    def resolve(self, resource_type: str, resource_id: str, refresh: bool = False) -> Resolution:
+        """Resolve the dependency graph of a resource.
+
+        Args:
+            resource_type: Type of the root resource
+            resource_id: Root resource ID or name
+            refresh: Ignore any cached resolution
+
+        Returns:
+            The resolved graph
+        """
+        root = Requirement(resource_type, resource_id)
+        if not refresh:
+            cached = self._load_cached(root)
+            if cached is not None:
+                return cached
+
+        nodes: dict[str, ResolvedNode] = {}
+        aliases: dict[str, str] = {}
+        requirements: list[Requirement] = []
+        frontier = [root]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while frontier:
+                pending = list(
+                    {req.key: req for req in frontier if req.key not in aliases}.values()
+                )
+                for req, resource in zip(pending, pool.map(self._fetch, pending)):
+                    canonical_id = str(resource.get("id") or req.resource_id)
+                    canonical = f"{req.resource_type}://{canonical_id}"
+                    aliases[req.key] = canonical
+                    aliases[canonical] = canonical
+                    if canonical in nodes:
+                        continue
+                    deps = dependency_entries(resource)
+                    requirements.extend(deps)
+                    nodes[canonical] = ResolvedNode(
+                        resource_type=req.resource_type,
+                        resource_id=canonical_id,
+                        name=str(resource.get("name") or canonical_id),
+                        version=str(resource.get("version") or "1.0.0"),
+                        dependencies=[dep.key for dep in deps],
+                    )
+                frontier = [dep for dep in requirements if dep.key not in aliases]
+
+        for node in nodes.values():
+            node.dependencies = list(dict.fromkeys(aliases[dep] for dep in node.dependencies))
+
+        constraints: dict[str, list[str]] = {}
+        for req in requirements:
+            if req.spec:
+                constraints.setdefault(aliases[req.key], []).append(req.spec)
+        for key, specs in constraints.items():
+            self._select_version(nodes[key], specs)
+
+        resolution = Resolution(root=aliases[root.key], nodes=nodes)
+        resolution.install_order()  # reject cycles before caching
+        self._store_cached(root, resolution)
+        return resolution
+
+    def _fetch(self, req: Requirement) -> dict[str, Any]:
+        """Fetch metadata for a requirement."""
+        try:
+            return self.client.get_resource(req.resource_type, req.resource_id)
+        except NotFoundError as e:
+            raise ResolutionError(f"Dependency not found: {req.key}") from e
+
+    def _select_version(self, node: ResolvedNode, specs: list[str]) -> None:
+        """Pick a version of a node that satisfies every constraint on it."""
+        if all(satisfies(node.version, spec) for spec in specs):
+            return
+        pins = [
+            clause.strip()[2:].strip()
+            for spec in specs
+            for clause in spec.split(",")
+            if clause.strip().startswith("==")
+        ]
+        for pin in pins:
+            if all(satisfies(pin, spec) for spec in specs):
+                node.version = pin
+                node.pinned = True
+                return
+        raise ResolutionError(
+            f"No version of {node.key} satisfies {', '.join(specs)} (market has {node.version})"
+        )
+
+    def _cache_path(self, root: Requirement) -> Path | None:
+        """Get the cache file for a root requirement."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(f"{self.client.base_url}|{root.key}".encode()).hexdigest()
+        return self.cache_dir / "resolutions" / f"{digest[:32]}.json"
+
+    def _load_cached(self, root: Requirement) -> Resolution | None:
+        """Load a fresh cached resolution, if any."""
+        path = self._cache_path(root)
+        if path is None or not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - float(data["created"]) > self.cache_ttl:
+                return None
+            return Resolution.from_dict(data["resolution"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached(self, root: Requirement, resolution: Resolution) -> None:
+        """Write a resolution to the cache, ignoring filesystem errors."""
+        path = self._cache_path(root)
+        if path is None:
+            return
+        payload = json.dumps({"created": time.time(), "resolution": resolution.to_dict()})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            pass
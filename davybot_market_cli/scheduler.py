@@ -0,0 +1,302 @@
+"""Priority scheduling and bandwidth shaping for downloads.
+
+A :class:`DownloadScheduler` shared by a client's downloads decides which
+transfers may use the link:
+
+- Transfers have a priority class: ``urgent``, ``normal`` or ``background``.
+  While a better-ranked transfer is running, worse-ranked ones pause between
+  chunks, so a skill someone is waiting for is not stuck behind a knowledge
+  base that happens to be downloading.
+- Within a class, small artifacts finish first: once a transfer's size is
+  known, one larger than ``large_transfer`` ranks half a class lower.
+- Bandwidth is capped globally (``bandwidth``), for the background class
+  (``background_bandwidth``) and per transfer (``transfer_bandwidth``), using
+  the same token buckets as the request rate limiter.
+
+::
+
+    scheduler = DownloadScheduler(bandwidth=parse_rate("20M"), background_bandwidth=parse_rate("2M"))
+    with DavybotMarketClient(scheduler=scheduler) as client:
+        client.download("skill", "web-scraper", "./skills", priority="urgent")
+
+Transfers are admitted in priority order when ``max_active`` is set; a
+transfer that outranks every running one is admitted immediately.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+from typing import Any, Self
+
+from .ratelimit import TokenBucket
+
+PRIORITIES = {"urgent": 0, "normal": 1, "background": 2}
+# Transfers above this size rank behind smaller ones of the same class
+LARGE_TRANSFER = 16 * 2**20
+# Buckets hold a quarter second of bandwidth, so bursts stay short
+BURST_SECONDS = 0.25
+# How often async transfers re-check whether they may proceed
+POLL_INTERVAL = 0.02
+
+_RATE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?(?:/s)?\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "k": 2**10, "m": 2**20, "g": 2**30}
+
+
+def parse_rate(spec: str) -> float:
+    """Parse a bandwidth such as ``500K``, ``2M``, ``1.5MB/s`` into bytes per second.
+
+    Args:
+        spec: Number with an optional K, M or G (binary) suffix
+
+    Returns:
+        Bytes per second
+
+    Raises:
+        ValueError: If the rate is malformed or not positive
+    """
+    match = _RATE_PATTERN.match(spec)
+    if not match:
+        raise ValueError(f"Invalid rate {spec!r}; use e.g. 500K, 2M or 1G")
+    rate = float(match.group(1)) * _UNITS[match.group(2).lower()]
+    if rate <= 0:
+        raise ValueError("Rate must be positive")
+    return rate
+
+
+def _bucket(rate: float | None) -> TokenBucket | None:
+    return TokenBucket(rate, max(1.0, rate * BURST_SECONDS)) if rate else None
+
+
+class Transfer:
+    """One scheduled download; use as a (sync or async) context manager.
+
+    Attributes:
+        name: Display name
+        priority: Priority class number (see :data:`PRIORITIES`)
+        size: Total size in bytes, once known
+        transferred: Bytes transferred so far
+    """
+
+    def __init__(
+        self,
+        scheduler: "DownloadScheduler",
+        name: str,
+        priority: int,
+        size: int | None,
+        bandwidth: float | None,
+    ):
+        self.scheduler = scheduler
+        self.name = name
+        self.priority = priority
+        self.size = size
+        self.transferred = 0
+        self.started = 0.0
+        self.bucket = _bucket(bandwidth)
+
+    @property
+    def rank(self) -> float:
+        """Scheduling rank; lower runs first."""
+        large = self.size is not None and self.size > self.scheduler.large_transfer
+        return self.priority + (0.5 if large else 0.0)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the transfer was admitted."""
+        return time.monotonic() - self.started if self.started else 0.0
+
+    def set_size(self, size: int | None) -> None:
+        """Record the transfer's total size (e.g. from Content-Length)."""
+        self.scheduler._set_size(self, size)
+
+    def throttle(self, nbytes: int) -> None:
+        """Account for ``nbytes`` received, waiting as the schedule requires."""
+        self.scheduler._throttle(self, nbytes)
+
+    async def athrottle(self, nbytes: int) -> None:
+        """Async counterpart of :meth:`throttle`."""
+        await self.scheduler._athrottle(self, nbytes)
+
+    def __enter__(self) -> Self:
+        """Wait until the transfer is admitted."""
+        self.scheduler._admit(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Release the transfer's slot."""
+        self.scheduler._release(self)
+
+    async def __aenter__(self) -> Self:
+        """Wait asynchronously until the transfer is admitted."""
+        await self.scheduler._aadmit(self)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Release the transfer's slot."""
+        self.scheduler._release(self)
+
+
+class DownloadScheduler:
+    """Share the download link between transfers by priority and bandwidth.
+
+    Thread-safe; async transfers poll instead of blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        max_active: int | None = None,
+        bandwidth: float | None = None,
+        background_bandwidth: float | None = None,
+        transfer_bandwidth: float | None = None,
+        large_transfer: int = LARGE_TRANSFER,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_active: Maximum concurrent transfers (default: unlimited)
+            bandwidth: Global budget in bytes per second (default: unlimited)
+            background_bandwidth: Budget for background transfers in bytes per second
+            transfer_bandwidth: Default cap per transfer in bytes per second
+            large_transfer: Size above which a transfer yields to smaller ones of its class
+        """
+        self.max_active = max_active
+        self.transfer_bandwidth = transfer_bandwidth
+        self.large_transfer = large_transfer
+        self.bucket = _bucket(bandwidth)
+        self.background_bucket = _bucket(background_bandwidth)
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int, int, Transfer]] = []
+        self._active: list[Transfer] = []
+        self._seq = itertools.count()
+
+    def transfer(
+        self,
+        name: str,
+        priority: str = "normal",
+        size: int | None = None,
+        bandwidth: float | None = None,
+    ) -> Transfer:
+        """Create a transfer to run under this scheduler.
+
+        Args:
+            name: Display name
+            priority: 'urgent', 'normal' or 'background'
+            size: Expected size in bytes, if known (orders admission)
+            bandwidth: Cap for this transfer in bytes per second
+                (default: the scheduler's ``transfer_bandwidth``)
+
+        Returns:
+            Transfer, to be entered before downloading
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {priority!r}; use one of {', '.join(PRIORITIES)}")
+        return Transfer(
+            self, name, PRIORITIES[priority], size, bandwidth or self.transfer_bandwidth
+        )
+
+    @property
+    def active(self) -> list[Transfer]:
+        """Transfers currently admitted."""
+        with self._cond:
+            return list(self._active)
+
+    def status(self) -> dict[str, Any]:
+        """Describe the running and queued transfers."""
+        with self._cond:
+            return {
+                "active": [
+                    {"name": t.name, "priority": t.priority, "size": t.size, "bytes": t.transferred}
+                    for t in self._active
+                ],
+                "waiting": len(self._waiting),
+            }
+
+    def _enqueue(self, transfer: Transfer) -> None:
+        entry = (transfer.priority, transfer.size or 0, next(self._seq), transfer)
+        heapq.heappush(self._waiting, entry)
+
+    def _admissible(self, transfer: Transfer) -> bool:
+        if self._waiting[0][3] is not transfer:
+            return False
+        if self.max_active is None or len(self._active) < self.max_active:
+            return True
+        return all(transfer.rank < other.rank for other in self._active)
+
+    def _start(self) -> None:
+        transfer = heapq.heappop(self._waiting)[3]
+        transfer.started = time.monotonic()
+        self._active.append(transfer)
+        self._cond.notify_all()
+
+    def _discard(self, transfer: Transfer) -> None:
+        """Drop a transfer that gave up waiting for admission."""
+        with self._cond:
+            self._waiting = [entry for entry in self._waiting if entry[3] is not transfer]
+            heapq.heapify(self._waiting)
+            self._cond.notify_all()
+
+    def _admit(self, transfer: Transfer) -> None:
+        with self._cond:
+            self._enqueue(transfer)
+            try:
+                self._cond.wait_for(lambda: self._admissible(transfer))
+            except BaseException:
+                self._discard(transfer)
+                raise
+            self._start()
+
+    async def _aadmit(self, transfer: Transfer) -> None:
+        with self._cond:
+            self._enqueue(transfer)
+        try:
+            while True:
+                with self._cond:
+                    if self._admissible(transfer):
+                        self._start()
+                        return
+                await asyncio.sleep(POLL_INTERVAL)
+        except BaseException:
+            self._discard(transfer)
+            raise
+
+    def _release(self, transfer: Transfer) -> None:
+        with self._cond:
+            if transfer in self._active:
+                self._active.remove(transfer)
+            self._cond.notify_all()
+
+    def _set_size(self, transfer: Transfer, size: int | None) -> None:
+        with self._cond:
+            transfer.size = size
+            self._cond.notify_all()
+
+    def _preempted(self, transfer: Transfer) -> bool:
+        rank = transfer.rank
+        return any(other.rank < rank for other in self._active)
+
+    def _reserve(self, transfer: Transfer, nbytes: int) -> float:
+        """Take ``nbytes`` from every bucket that applies; return the longest wait."""
+        transfer.transferred += nbytes
+        buckets = [self.bucket, transfer.bucket]
+        if transfer.priority == PRIORITIES["background"]:
+            buckets.append(self.background_bucket)
+        return max((b.reserve(nbytes) for b in buckets if b is not None), default=0.0)
+
+    def _throttle(self, transfer: Transfer, nbytes: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: not self._preempted(transfer))
+        wait = self._reserve(transfer, nbytes)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def _athrottle(self, transfer: Transfer, nbytes: int) -> None:
+        while True:
+            with self._cond:
+                if not self._preempted(transfer):
+                    break
+            await asyncio.sleep(POLL_INTERVAL)
+        wait = self._reserve(transfer, nbytes)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,271 @@
+"""Stale-while-revalidate cache of search results.
+
+Search responses are stored in SQLite (by default
+``~/.cache/davybot/search.db``), keyed by API URL, a hash of the API key (so
+accounts sharing a machine never see each other's results), normalized query,
+type, tags, limit and offset. A cached response is returned at once:
+
+- younger than ``soft_ttl``: as is;
+- between ``soft_ttl`` and ``hard_ttl``: as is, while a background thread
+  fetches a fresh copy for next time;
+- older than ``hard_ttl``: not at all; the search waits for the API.
+
+At most ``max_entries`` responses are kept, evicting the least recently used::
+
+    with DavybotMarketClient() as client, SearchCache() as cache:
+        result = cache.search(client, "web scraping", resource_type="skill")
+
+Closing the cache waits for pending refreshes, so close it before the client.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from . import _json
+from .exceptions import DavybotMarketError
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+DEFAULT_SOFT_TTL = 300.0
+DEFAULT_HARD_TTL = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 1000
+# Longest wait on close for refreshes still in flight
+REFRESH_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search (
+    key TEXT PRIMARY KEY,
+    response BLOB NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_by_access ON search (accessed);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Query in its cache key form: case-folded with single spaces."""
+    return " ".join(query.casefold().split())
+
+
+def cache_key(
+    base_url: str,
+    api_key: str | None,
+    query: str,
+    resource_type: str | None,
+    tags: list[str] | None,
+    limit: int,
+    offset: int,
+) -> str:
+    """Cache key of one search request, specific to the API key (or its absence)."""
+    identity = hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+    parts = [
+        base_url,
+        identity,
+        normalize_query(query),
+        resource_type,
+        sorted(tags or []),
+        limit,
+        offset,
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """SQLite search result cache with soft and hard TTLs and LRU eviction.
+
+    Attributes:
+        stats: Counters: hits, stale_hits, misses, refreshes, refresh_errors
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        soft_ttl: float = DEFAULT_SOFT_TTL,
+        hard_ttl: float = DEFAULT_HARD_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Database file (defaults to search.db in the cache directory)
+            soft_ttl: Seconds after which a hit triggers a background refresh
+            hard_ttl: Seconds after which a cached response is not used
+            max_entries: Responses kept
+        """
+        if path is None:
+            from .utils import get_cache_dir
+
+            path = get_cache_dir() / "search.db"
+        self.path = path
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+        self._conn: sqlite3.Connection | None = None
+        # Refresh threads share the connection
+        self._lock = threading.Lock()
+        self._refreshing: dict[str, threading.Thread] = {}
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def close(self, timeout: float = REFRESH_TIMEOUT) -> None:
+        """Wait for background refreshes, then close the database.
+
+        Args:
+            timeout: Maximum seconds to wait for refreshes
+        """
+        deadline = time.monotonic() + timeout
+        for thread in list(self._refreshing.values()):
+            thread.join(max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema on first use (the lock must be held)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """A cached response and its age in seconds, if younger than the hard TTL."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, created FROM search WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            age = now - row[1]
+            if age >= self.hard_ttl:
+                with conn:
+                    conn.execute("DELETE FROM search WHERE key = ?", (key,))
+                return None
+            with conn:
+                conn.execute("UPDATE search SET accessed = ? WHERE key = ?", (now, key))
+        return _json.loads(row[0]), age
+
+    def put(self, key: str, response: dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used beyond ``max_entries``."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search VALUES (?, ?, ?, ?)",
+                    (key, _json.dumps(response), now, now),
+                )
+                conn.execute(
+                    "DELETE FROM search WHERE key IN "
+                    "(SELECT key FROM search ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM search")
+
+    def search(
+        self,
+        client: "DavybotMarketClient",
+        query: str,
+        resource_type: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        fresh: bool = False,
+    ) -> dict[str, Any]:
+        """Search, answering from the cache when possible.
+
+        Args:
+            client: Open market client
+            query: Search query
+            resource_type: Optional resource type filter
+            tags: Optional list of tags to filter
+            limit: Maximum number of results
+            offset: Number of results to skip
+            fresh: Skip the cache lookup and wait for the API (the result is still stored)
+
+        Returns:
+            Search results with 'results' and 'total' keys
+        """
+        key = cache_key(client.base_url, client.api_key, query, resource_type, tags, limit, offset)
+        with client.tracer.span("search cache", kind="cache", query=query) as span:
+            span.method, span.route = "POST", "/search"
+            cached = None if fresh else self._get_quietly(key)
+            span.cache_hit = cached is not None
+            if cached is None:
+                # The request itself gets its own span; this one is not a served call
+                span.kind = "internal"
+            else:
+                span.status = 200
+                response, age = cached
+                if age < self.soft_ttl:
+                    self.stats["hits"] += 1
+                else:
+                    self.stats["stale_hits"] += 1
+                    span.attributes["stale"] = True
+                    self._refresh(client, key, (query, resource_type, tags, limit, offset))
+                return response
+        self.stats["misses"] += 1
+        response = client.search(query, resource_type, tags, limit, offset)
+        try:
+            self.put(key, response)
+        except (sqlite3.Error, OSError):
+            pass
+        return response
+
+    def _get_quietly(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """Like :meth:`get`, but an unusable cache is a miss."""
+        try:
+            return self.get(key)
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def _refresh(
+        self,
+        client: "DavybotMarketClient",
+        key: str,
+        arguments: tuple[str, str | None, list[str] | None, int, int],
+    ) -> None:
+        """Fetch a fresh copy of a stale response in the background."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+
+            def run() -> None:
+                try:
+                    self.put(key, client.search(*arguments))
+                    self.stats["refreshes"] += 1
+                except (DavybotMarketError, httpx.HTTPError, sqlite3.Error, OSError):
+                    # The stale copy stays until it expires
+                    self.stats["refresh_errors"] += 1
+                finally:
+                    with self._lock:
+                        self._refreshing.pop(key, None)
+
+            thread = threading.Thread(target=run, name="davybot-search-refresh", daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
@@ -0,0 +1,445 @@
+"""Compact binary catalog snapshots loaded with mmap.
+
+A snapshot stores the catalog so a CLI process can query it without parsing
+JSON or decoding every resource. Opening one maps the file and reads a fixed
+header; records, strings and bitmaps are read on demand.
+
+Layout (little-endian, every section 8-byte aligned)::
+
+    header        magic, format version, counts, build time, section offsets
+    strings       (string_count + 1) uint32 offsets, then one UTF-8 blob;
+                  every distinct string is stored once
+    records       record_count fixed-width records: uint32 string indices for
+                  id, name, version, type and author, float32 rating,
+                  uint64 downloads
+    types, tags   uint32 string indices of the distinct types and tags
+    bitmaps       one bitmap per type, then one per tag; bit i is set when
+                  record i has that type or tag
+    name index    uint32 record indices sorted by name, for binary search
+    record tags   (record_count + 1) uint32 offsets, then the uint32 tag slots
+                  of every record, so a record's tags decode without a scan
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Self
+
+from .exceptions import SnapshotError
+
+MAGIC = b"DAVYSNAP"
+FORMAT_VERSION = 2
+SNAPSHOT_NAME = "catalog.snap"
+
+_HEADER = struct.Struct("<8sHHIIIIQ7Q")
+_RECORD = struct.Struct("<5IfQ")
+_U32 = struct.Struct("<I")
+_F32 = struct.Struct("<f")
+_ID, _NAME, _VERSION, _TYPE, _AUTHOR, _RATING, _DOWNLOADS = range(7)
+
+
+def default_snapshot_path() -> Path:
+    """Get the default snapshot location inside the cache directory."""
+    # Imported here so querying a snapshot does not load the HTTP client
+    from .utils import get_cache_dir
+
+    return get_cache_dir() / SNAPSHOT_NAME
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+@dataclass
+class SnapshotRecord:
+    """One resource decoded from a snapshot."""
+
+    id: str
+    name: str
+    type: str
+    version: str
+    author: str | None
+    downloads: int
+    rating: float
+    tags: list[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to an API-style resource dictionary."""
+        return asdict(self)
+
+
+def write_snapshot(items: Iterable[dict[str, Any]], path: str | Path | None = None) -> Path:
+    """Write resources to a snapshot file, replacing it atomically.
+
+    Args:
+        items: Resources as returned by list or search calls
+        path: Output file (default: :func:`default_snapshot_path`)
+
+    Returns:
+        Path written
+    """
+    path = Path(path) if path else default_snapshot_path()
+    strings: dict[str, int] = {}
+    types: dict[int, list[int]] = {}
+    tags: dict[int, list[int]] = {}
+    records = bytearray()
+    names: list[bytes] = []
+    tag_slots: dict[int, int] = {}
+    # Tag slots of every record's tags, in record order
+    record_tags: list[int] = []
+    record_tag_offsets = [0]
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    count = 0
+    for item in items:
+        type_index = intern(str(item.get("type", "")))
+        records += _RECORD.pack(
+            intern(str(item.get("id", ""))),
+            intern(str(item.get("name", ""))),
+            intern(str(item.get("version", "1.0.0"))),
+            type_index,
+            intern(str(item.get("author") or "")),
+            float(item.get("rating") or 0.0),
+            int(item.get("downloads") or 0),
+        )
+        names.append(str(item.get("name", "")).encode("utf-8"))
+        types.setdefault(type_index, []).append(count)
+        for tag in dict.fromkeys(str(tag) for tag in item.get("tags") or []):
+            tag_index = intern(tag)
+            if tag_index not in tags:
+                tag_slots[tag_index] = len(tags)
+                tags[tag_index] = []
+            record_tags.append(tag_slots[tag_index])
+            tags[tag_index].append(count)
+        record_tag_offsets.append(len(record_tags))
+        count += 1
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    string_section = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+    stride = _align((count + 7) // 8)
+    bitmaps = bytearray()
+    for members in [*types.values(), *tags.values()]:
+        bitmap = bytearray(stride)
+        for row in members:
+            bitmap[row >> 3] |= 1 << (row & 7)
+        bitmaps += bitmap
+
+    name_index = sorted(range(count), key=names.__getitem__)
+
+    sections = [
+        string_section,
+        bytes(records),
+        struct.pack(f"<{len(types)}I", *types),
+        struct.pack(f"<{len(tags)}I", *tags),
+        bytes(bitmaps),
+        struct.pack(f"<{count}I", *name_index),
+        struct.pack(f"<{len(record_tag_offsets)}I", *record_tag_offsets)
+        + struct.pack(f"<{len(record_tags)}I", *record_tags),
+    ]
+    section_offsets = []
+    position = _HEADER.size
+    for section in sections:
+        section_offsets.append(position)
+        position = _align(position + len(section))
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        count,
+        len(strings),
+        len(types),
+        len(tags),
+        int(time.time()),
+        *section_offsets,
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for offset, section in zip(section_offsets, sections):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(section)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Example usage:
+
+        with CatalogSnapshot.open() as snapshot:
+            for record in snapshot.query(resource_type="skill", tags=["web"], limit=10):
+                print(record.name, record.downloads)
+    """
+
+    def __init__(self, path: Path, buffer: mmap.mmap):
+        """Wrap a mapped snapshot; use :meth:`open` instead."""
+        self.path = path
+        self._buffer = buffer
+        if len(buffer) < _HEADER.size:
+            raise SnapshotError(f"{path} is not a catalog snapshot")
+        (
+            magic,
+            version,
+            _flags,
+            self.record_count,
+            self.string_count,
+            self.type_count,
+            self.tag_count,
+            self.built_at,
+            self._strings_offset,
+            self._records_offset,
+            self._types_offset,
+            self._tags_offset,
+            self._bitmaps_offset,
+            self._name_index_offset,
+            self._record_tags_offset,
+        ) = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise SnapshotError(f"{path} is not a catalog snapshot")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(
+                f"{path} uses snapshot format {version}, expected {FORMAT_VERSION}; rebuild it"
+            )
+        self._view = memoryview(buffer)
+        self._blob_offset = self._strings_offset + (self.string_count + 1) * 4
+        self._stride = _align((self.record_count + 7) // 8)
+        self._strings: dict[int, str] = {}
+        self._types = self._load_labels(self._types_offset, self.type_count)
+        self._tags = self._load_labels(self._tags_offset, self.tag_count)
+        self._tag_names = list(self._tags)
+        self._record_tag_slots = self._record_tags_offset + (self.record_count + 1) * 4
+
+    @classmethod
+    def open(cls, path: str | Path | None = None) -> "CatalogSnapshot":
+        """Memory-map a snapshot file.
+
+        Args:
+            path: Snapshot file (default: :func:`default_snapshot_path`)
+
+        Returns:
+            CatalogSnapshot instance
+
+        Raises:
+            SnapshotError: If the file is missing, empty or not a snapshot
+        """
+        path = Path(path) if path else default_snapshot_path()
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Cannot open catalog snapshot {path}: {e}") from e
+        try:
+            return cls(path, buffer)
+        except SnapshotError:
+            buffer.close()
+            raise
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._view.release()
+        self._buffer.close()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return int(self.record_count)
+
+    def string(self, index: int) -> str:
+        """Decode one string from the string table."""
+        value = self._strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from("<2I", self._buffer, self._strings_offset + index * 4)
+            value = str(self._view[self._blob_offset + start : self._blob_offset + end], "utf-8")
+            self._strings[index] = value
+        return value
+
+    def _load_labels(self, offset: int, count: int) -> dict[str, int]:
+        """Map type or tag names to their bitmap slot."""
+        indices = struct.unpack_from(f"<{count}I", self._buffer, offset)
+        return {self.string(index): slot for slot, index in enumerate(indices)}
+
+    @property
+    def types(self) -> list[str]:
+        """Distinct resource types in the snapshot."""
+        return list(self._types)
+
+    @property
+    def tags(self) -> list[str]:
+        """Distinct tags in the snapshot."""
+        return list(self._tags)
+
+    def _raw(self, row: int) -> tuple[Any, ...]:
+        return _RECORD.unpack_from(self._buffer, self._records_offset + row * _RECORD.size)
+
+    def _bitmap(self, slot: int) -> int:
+        start = self._bitmaps_offset + slot * self._stride
+        return int.from_bytes(self._view[start : start + self._stride], "little")
+
+    def record(self, row: int) -> SnapshotRecord:
+        """Decode one record.
+
+        Args:
+            row: Record position
+
+        Returns:
+            SnapshotRecord instance
+        """
+        if not 0 <= row < self.record_count:
+            raise IndexError(row)
+        raw = self._raw(row)
+        author = self.string(raw[_AUTHOR])
+        return SnapshotRecord(
+            id=self.string(raw[_ID]),
+            name=self.string(raw[_NAME]),
+            type=self.string(raw[_TYPE]),
+            version=self.string(raw[_VERSION]),
+            author=author or None,
+            downloads=raw[_DOWNLOADS],
+            rating=round(raw[_RATING], 4),
+            tags=self._record_tags(row),
+        )
+
+    def _record_tags(self, row: int) -> list[str]:
+        """Tags of one record, read from its slice of the record tags section."""
+        start, end = struct.unpack_from("<2I", self._buffer, self._record_tags_offset + row * 4)
+        slots = struct.unpack_from(
+            f"<{end - start}I", self._buffer, self._record_tag_slots + start * 4
+        )
+        return [self._tag_names[slot] for slot in slots]
+
+    def __iter__(self) -> Iterator[SnapshotRecord]:
+        """Iterate over all records in file order."""
+        return (self.record(row) for row in range(self.record_count))
+
+    def find(self, name: str, resource_type: str | None = None) -> SnapshotRecord | None:
+        """Look up a resource by name with a binary search over the name index.
+
+        Args:
+            name: Resource name
+            resource_type: Disambiguate names shared across types
+
+        Returns:
+            SnapshotRecord, or None if not found
+        """
+        target = name.encode("utf-8")
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_at(middle).encode("utf-8") < target:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self.record_count and self._name_at(low) == name:
+            row = self._row_at(low)
+            if resource_type is None or self.string(self._raw(row)[_TYPE]) == resource_type:
+                return self.record(row)
+            low += 1
+        return None
+
+    def _row_at(self, position: int) -> int:
+        row: int = _U32.unpack_from(self._buffer, self._name_index_offset + position * 4)[0]
+        return row
+
+    def _name_at(self, position: int) -> str:
+        return self.string(self._raw(self._row_at(position))[_NAME])
+
+    def _candidates(self, resource_type: str | None, tags: Sequence[str]) -> Iterator[int]:
+        """Rows matching the type and all tags, found by ANDing bitmaps."""
+        if resource_type is None and not tags:
+            yield from range(self.record_count)
+            return
+        mask = -1
+        if resource_type is not None:
+            if resource_type not in self._types:
+                return
+            mask &= self._bitmap(self._types[resource_type])
+        for tag in tags:
+            if tag not in self._tags:
+                return
+            mask &= self._bitmap(self.type_count + self._tags[tag])
+        for index, byte in enumerate(mask.to_bytes(self._stride, "little")):
+            while byte:
+                low = byte & -byte
+                yield index * 8 + low.bit_length() - 1
+                byte ^= low
+
+    def query(
+        self,
+        resource_type: str | None = None,
+        tags: Sequence[str] = (),
+        min_rating: float | None = None,
+        min_downloads: int | None = None,
+        sort_by: str | None = None,
+        limit: int | None = None,
+    ) -> list[SnapshotRecord]:
+        """Filter and rank records, decoding only the ones returned.
+
+        Args:
+            resource_type: Keep only this resource type
+            tags: Tags every returned record must have
+            min_rating: Minimum average rating
+            min_downloads: Minimum download count
+            sort_by: 'downloads' or 'rating' to rank largest first; file order otherwise
+            limit: Maximum number of records
+
+        Returns:
+            List of SnapshotRecord
+        """
+        if sort_by not in (None, "downloads", "rating"):
+            raise ValueError(f"Cannot sort snapshot records by {sort_by!r}")
+        rows: Iterable[int] = self._candidates(resource_type, tags)
+        if min_rating is not None:
+            # Ratings are stored as float32: compare at that precision, so 4.7 >= 4.7
+            (min_rating,) = _F32.unpack(_F32.pack(min_rating))
+        if min_rating is not None or min_downloads is not None or sort_by:
+            raws = ((row, self._raw(row)) for row in rows)
+            matching = [
+                (row, raw)
+                for row, raw in raws
+                if (min_rating is None or raw[_RATING] >= min_rating)
+                and (min_downloads is None or raw[_DOWNLOADS] >= min_downloads)
+            ]
+            if sort_by:
+                column = _DOWNLOADS if sort_by == "downloads" else _RATING
+                if limit is not None:
+                    matching = heapq.nlargest(limit, matching, key=lambda entry: entry[1][column])
+                else:
+                    matching.sort(key=lambda entry: entry[1][column], reverse=True)
+            rows = [row for row, _ in matching]
+
+        selected: list[SnapshotRecord] = []
+        for row in rows:
+            if limit is not None and len(selected) >= limit:
+                break
+            selected.append(self.record(row))
+        return selected
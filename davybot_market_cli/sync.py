@@ -0,0 +1,290 @@
+"""Delta synchronisation of the user's SyncConfiguration.
+
+The configuration is flattened into key paths (``/preferences/theme``), and a
+hash of each value is remembered from the last successful sync. A sync sends
+only the key paths whose hash changed, as JSON-patch operations carrying the
+time of the local change. The server replies with the operations other devices
+made since ``lastSyncTime``. When both sides changed the same key path, the
+change with the later timestamp wins and a :class:`SyncConflict` is reported.
+If nothing changed locally, no request is made at all::
+
+    engine = SyncEngine(client)
+    result = engine.sync(configuration)
+    configuration = result.configuration
+
+The per-key state lives in a small JSON file (by default
+``~/.local/share/davybot/sync-state.json``).
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .exceptions import DavybotMarketError
+from .types.sync import SyncConfiguration, SyncConflict, SyncStatus
+
+if TYPE_CHECKING:
+    from .client import DavybotMarketClient
+
+# Metadata fields that are not synchronised as settings
+_METADATA = frozenset({"lastSyncTime", "version"})
+
+
+def now() -> str:
+    """Current UTC time as an ISO 8601 timestamp."""
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _escape(part: str) -> str:
+    return part.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(part: str) -> str:
+    return part.replace("~1", "/").replace("~0", "~")
+
+
+def split_path(path: str) -> list[str]:
+    """Split a JSON pointer into its unescaped parts."""
+    return [_unescape(part) for part in path.split("/")[1:]]
+
+
+def dotted(path: str) -> str:
+    """A JSON pointer written as a dotted key (``preferences.theme``)."""
+    return ".".join(split_path(path))
+
+
+def flatten(configuration: SyncConfiguration) -> dict[str, Any]:
+    """Map every settings key path (JSON pointer) to its leaf value."""
+    leaves: dict[str, Any] = {}
+
+    def walk(prefix: str, value: Any) -> None:
+        if isinstance(value, dict) and value:
+            for key, item in value.items():
+                walk(f"{prefix}/{_escape(str(key))}", item)
+        else:
+            leaves[prefix] = value
+
+    for name, value in configuration.model_dump(exclude=set(_METADATA)).items():
+        walk(f"/{name}", value)
+    return leaves
+
+
+def value_hash(value: Any) -> str:
+    """Stable hash of a JSON value."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def apply_patch(configuration: SyncConfiguration, patch: list[dict[str, Any]]) -> SyncConfiguration:
+    """Apply JSON-patch ``add``/``replace``/``remove`` operations to a copy.
+
+    Args:
+        configuration: Configuration to start from
+        patch: Operations on settings key paths
+
+    Returns:
+        The patched configuration
+    """
+    data = configuration.model_dump(exclude=set(_METADATA))
+    for operation in patch:
+        parts = split_path(operation["path"])
+        if not parts or parts[0] not in data:
+            continue
+        parent = data
+        for part in parts[:-1]:
+            child = parent.get(part)
+            if not isinstance(child, dict):
+                child = parent[part] = {}
+            parent = child
+        if operation["op"] == "remove":
+            parent.pop(parts[-1], None)
+        else:
+            parent[parts[-1]] = operation["value"]
+    return configuration.model_copy(update=data)
+
+
+def _later(left: str, right: str) -> bool:
+    """Whether timestamp ``left`` is later than ``right``."""
+    try:
+        return datetime.fromisoformat(left) > datetime.fromisoformat(right)
+    except ValueError:
+        return left > right
+
+
+def _overlaps(left: str, right: str) -> bool:
+    """Whether two key paths are equal or one contains the other."""
+    return left == right or left.startswith(right + "/") or right.startswith(left + "/")
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one sync."""
+
+    configuration: SyncConfiguration
+    sent: list[dict[str, Any]] = field(default_factory=list)
+    received: list[dict[str, Any]] = field(default_factory=list)
+    conflicts: list[SyncConflict] = field(default_factory=list)
+    skipped: bool = False
+
+
+class SyncState:
+    """Per-key hashes and change times, kept between syncs.
+
+    Attributes:
+        synced: Key path -> value hash at the last successful sync
+        changed: Key path -> [value hash, time it was first seen locally]
+        last_sync_time: ``lastSyncTime`` of the last successful sync
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Load the state file, starting empty if it is missing or unreadable.
+
+        Args:
+            path: State file (default: ``sync-state.json`` in the data directory)
+        """
+        if path is None:
+            from .utils import get_data_dir
+
+            path = get_data_dir() / "sync-state.json"
+        self.path = path
+        self.synced: dict[str, str] = {}
+        self.changed: dict[str, list[str]] = {}
+        self.last_sync_time: str | None = None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.synced = data["synced"]
+            self.changed = data["changed"]
+            self.last_sync_time = data.get("lastSyncTime")
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self) -> None:
+        """Write the state file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(
+            json.dumps(
+                {
+                    "synced": self.synced,
+                    "changed": self.changed,
+                    "lastSyncTime": self.last_sync_time,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, self.path)
+
+
+class SyncEngine:
+    """Synchronise a SyncConfiguration with the market API by key-path deltas."""
+
+    def __init__(self, client: "DavybotMarketClient", state_path: Path | None = None):
+        """Initialize the engine.
+
+        Args:
+            client: Open market client
+            state_path: Where per-key sync state is kept
+        """
+        self.client = client
+        self.state = SyncState(state_path)
+        self._error: str | None = None
+
+    def diff(self, configuration: SyncConfiguration) -> list[dict[str, Any]]:
+        """JSON-patch operations for the keys changed since the last sync.
+
+        Each operation carries a ``timestamp``: when the change was first seen
+        locally, which stays the same until it has been synced.
+
+        Args:
+            configuration: Current local configuration
+
+        Returns:
+            Operations, ordered by key path
+        """
+        leaves = flatten(configuration)
+        synced, changed = self.state.synced, self.state.changed
+        stamp = now()
+        patch = []
+        for path in sorted(leaves.keys() | synced.keys()):
+            hashed = value_hash(leaves[path]) if path in leaves else ""
+            if hashed == synced.get(path, ""):
+                changed.pop(path, None)
+                continue
+            seen = changed.get(path)
+            if seen is None or seen[0] != hashed:
+                seen = changed[path] = [hashed, stamp]
+            if path not in leaves:
+                patch.append({"op": "remove", "path": path, "timestamp": seen[1]})
+            else:
+                op = "replace" if path in synced else "add"
+                patch.append({"op": op, "path": path, "value": leaves[path], "timestamp": seen[1]})
+        return patch
+
+    def sync(self, configuration: SyncConfiguration, pull: bool = False) -> SyncResult:
+        """Exchange changed keys with the server.
+
+        Args:
+            configuration: Current local configuration
+            pull: Ask the server for remote changes even if nothing changed locally
+
+        Returns:
+            SyncResult with the merged configuration
+        """
+        patch = self.diff(configuration)
+        if not patch and not pull and self.state.last_sync_time is not None:
+            self.state.save()
+            return SyncResult(configuration, skipped=True)
+
+        try:
+            response = self.client.patch_sync_configuration(patch, since=self.state.last_sync_time)
+        except (DavybotMarketError, httpx.HTTPError) as e:
+            self._error = str(e)
+            self.state.save()
+            raise
+        self._error = None
+        remote: list[dict[str, Any]] = response.get("patch", [])
+
+        local = {operation["path"]: operation for operation in patch}
+        applied: list[dict[str, Any]] = []
+        conflicts: list[SyncConflict] = []
+        for operation in remote:
+            rivals = [mine for path, mine in local.items() if _overlaps(path, operation["path"])]
+            remote_time = operation.get("timestamp", "")
+            if rivals:
+                conflicts.extend(
+                    SyncConflict(
+                        key=dotted(mine["path"]),
+                        localValue=mine.get("value"),
+                        remoteValue=operation.get("value"),
+                        localTimestamp=mine["timestamp"],
+                        remoteTimestamp=remote_time,
+                    )
+                    for mine in rivals
+                )
+                if any(not _later(remote_time, mine["timestamp"]) for mine in rivals):
+                    continue
+            applied.append(operation)
+
+        merged = apply_patch(configuration, applied)
+        last_sync_time = response.get("lastSyncTime") or now()
+        merged = merged.model_copy(update={"lastSyncTime": last_sync_time})
+        self.state.synced = {path: value_hash(value) for path, value in flatten(merged).items()}
+        self.state.changed = {}
+        self.state.last_sync_time = last_sync_time
+        self.state.save()
+        return SyncResult(merged, sent=patch, received=applied, conflicts=conflicts)
+
+    def status(self) -> SyncStatus:
+        """Sync status from the local state (no request is made)."""
+        return SyncStatus(
+            enabled=True,
+            lastSyncTime=self.state.last_sync_time,
+            status="error" if self._error else "synced",
+            errorMessage=self._error,
+        )
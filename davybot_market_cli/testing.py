@@ -0,0 +1,260 @@
+"""Local stand-in for the market API.
+
+:class:`FakeMarketServer` serves a synthetic catalog over real HTTP on
+localhost, so benchmarks and tests can exercise the client, its connection
+pool and the CLI without a market deployment::
+
+    with FakeMarketServer(resources=500, latency=0.002) as server:
+        with DavybotMarketClient(base_url=server.base_url) as client:
+            client.search("resource")
+
+It implements the read-only endpoints the client uses (health, search,
+listing, resource details, downloads, ratings and version checks).
+"""
+
+import io
+import json
+import threading
+import time
+import urllib.parse
+import zipfile
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+
+RESOURCE_TYPES = ("skill", "agent", "mcp", "knowledge")
+API_PREFIX = "/api/v1"
+
+
+def make_catalog(resources: int) -> dict[str, list[dict[str, Any]]]:
+    """Build a deterministic synthetic catalog.
+
+    Args:
+        resources: Number of resources per type
+
+    Returns:
+        Dict of resource type to resources
+    """
+    return {
+        resource_type: [
+            {
+                "id": f"{resource_type}-{i:05d}",
+                "name": f"{resource_type}-resource-{i}",
+                "type": resource_type,
+                "description": f"Synthetic {resource_type} number {i}",
+                "author": f"author-{i % 17}",
+                "version": f"1.{i % 5}.0",
+                "tags": ["synthetic", f"group-{i % 7}"],
+                "metadata": {},
+                "downloads": (i * 7919) % 10_007,
+                "rating": (i % 50) / 10,
+                "created_at": "2025-01-22T10:00:00Z",
+                "updated_at": "2025-02-01T08:30:00Z",
+            }
+            for i in range(resources)
+        ]
+        for resource_type in RESOURCE_TYPES
+    }
+
+
+def make_archive(size: int) -> bytes:
+    """Build a zip archive holding roughly ``size`` bytes of content."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("README.md", "Synthetic resource\n")
+        archive.writestr("payload.bin", bytes(i % 251 for i in range(size)))
+    return buffer.getvalue()
+
+
+class FakeMarketServer:
+    """Threaded HTTP server that imitates the market API.
+
+    Attributes:
+        catalog: Resources served, by type
+        hits: Number of requests per route template
+    """
+
+    def __init__(
+        self,
+        resources: int = 100,
+        latency: float = 0.0,
+        archive_size: int = 64 * 1024,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server (it starts on :meth:`start` or ``with``).
+
+        Args:
+            resources: Number of resources per type
+            latency: Seconds to wait before answering each request
+            archive_size: Approximate size of downloadable archives in bytes
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.catalog = make_catalog(resources)
+        self.latency = latency
+        self.archive = make_archive(archive_size)
+        self.hits: Counter[str] = Counter()
+        self._index = {
+            (item["type"], item["id"]): item for items in self.catalog.values() for item in items
+        }
+        self._index.update(
+            {
+                (item["type"], item["name"]): item
+                for items in self.catalog.values()
+                for item in items
+            }
+        )
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """API base URL to pass to the client."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}{API_PREFIX}"
+
+    def start(self) -> Self:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def route(
+        self, method: str, path: str, query: dict[str, str], body: Any
+    ) -> tuple[str, int, Any]:
+        """Answer one request.
+
+        Args:
+            method: HTTP method
+            path: URL path below the API prefix, still percent-encoded
+            query: Query parameters
+            body: Decoded JSON request body, if any
+
+        Returns:
+            Route template, status code, and a JSON-serializable body or raw bytes
+        """
+        parts = [urllib.parse.unquote(part) for part in path.strip("/").split("/")]
+        if method == "POST" and parts == ["search"]:
+            return "/search", 200, self._search(body or {})
+        if method == "POST" and parts == ["resources", "versions"]:
+            return "/resources/versions", 200, self._versions(body or {})
+        if method == "GET" and len(parts) >= 3 and parts[0] == "resources":
+            if parts[2:] == ["ratings"]:
+                return "/resources/{id}/ratings", 200, []
+            if parts[2:] == ["ratings", "avg"]:
+                average = {"resource_id": parts[1], "average_rating": 0.0, "total_ratings": 0}
+                return "/resources/{id}/ratings/avg", 200, average
+        if method == "GET" and parts and parts[0].endswith("s"):
+            resource_type = parts[0][:-1]
+            if resource_type in self.catalog:
+                if len(parts) == 1:
+                    return "/{type}s", 200, self._list(resource_type, query)
+                item = self._index.get((resource_type, parts[1]))
+                if len(parts) == 2:
+                    return "/{type}s/{id}", (200 if item else 404), item or {"detail": "Not found"}
+                if parts[2:] == ["download"] and item:
+                    return "/{type}s/{id}/download", 200, self.archive
+        return path, 404, {"detail": "Not found"}
+
+    def _search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        query = str(payload.get("query", "")).lower()
+        types = [payload["type"]] if payload.get("type") else list(self.catalog)
+        tags = set(payload.get("tags") or [])
+        matches = [
+            item
+            for resource_type in types
+            for item in self.catalog.get(resource_type, [])
+            if (query in item["name"] or query in item["description"].lower())
+            and tags <= set(item["tags"])
+        ]
+        offset, limit = int(payload.get("offset", 0)), int(payload.get("limit", 20))
+        return {"results": matches[offset : offset + limit], "total": len(matches), "query": query}
+
+    def _list(self, resource_type: str, query: dict[str, str]) -> dict[str, Any]:
+        items = self.catalog[resource_type]
+        skip, limit = int(query.get("skip", 0)), int(query.get("limit", 100))
+        return {
+            "items": items[skip : skip + limit],
+            "total": len(items),
+            "page": skip // max(limit, 1) + 1,
+            "page_size": limit,
+        }
+
+    def _versions(self, payload: dict[str, Any]) -> dict[str, Any]:
+        found = (
+            self._index.get((entry.get("type"), entry.get("id")))
+            for entry in payload.get("resources", [])
+        )
+        return {
+            "items": [
+                {"type": item["type"], "id": item["id"], "version": item["version"]}
+                for item in found
+                if item
+            ]
+        }
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _serve(self, method: str) -> None:
+                url = urllib.parse.urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if url.path == "/health":
+                    route, status, body = "/health", 200, {"status": "healthy", "database": "ok"}
+                elif url.path.startswith(API_PREFIX):
+                    query = dict(urllib.parse.parse_qsl(url.query))
+                    payload = json.loads(raw) if raw else None
+                    route, status, body = server.route(
+                        method, url.path[len(API_PREFIX) :], query, payload
+                    )
+                else:
+                    route, status, body = url.path, 404, {"detail": "Not found"}
+                with server._lock:
+                    server.hits[route] += 1
+
+                if isinstance(body, bytes):
+                    content, content_type = body, "application/zip"
+                else:
+                    content, content_type = json.dumps(body).encode(), "application/json"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self) -> None:
+                self._serve("GET")
+
+            def do_POST(self) -> None:
+                self._serve("POST")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,368 @@
+"""Client-side request spans and instrumentation hooks.
+
+Every request made by :class:`~davybot_market_cli.client.DavybotMarketClient`
+produces a :class:`Span` with its method, route template, status, byte counts
+and connection phase timings (taken from httpcore's ``trace`` extension).
+Local work such as archive extraction is recorded as internal spans.
+
+Spans are handed to :class:`TraceHook` plug-ins registered on the client::
+
+    recorder = SpanRecorder()
+    with DavybotMarketClient(hooks=[recorder, PrometheusHook()]) as client:
+        client.search("web")
+    print(format_waterfall(recorder.spans))
+
+Hooks are only called when at least one is registered; a client without hooks
+does no tracing work.
+"""
+
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# httpcore trace event prefixes -> span phase. httpcore resolves DNS inside
+# connect_tcp, so name resolution is part of the "connect" phase.
+PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http11.receive_response_headers": "wait",
+    "http11.receive_response_body": "transfer",
+    "http2.send_connection_init": "connect",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http2.receive_response_headers": "wait",
+    "http2.receive_response_body": "transfer",
+}
+PHASE_ORDER = ("connect", "tls", "send", "wait", "transfer")
+
+
+@dataclass
+class Span:
+    """One timed request or unit of local work.
+
+    Attributes:
+        name: Display name, e.g. ``GET /skills/{resource_id}`` or ``extract``
+        kind: ``http`` for market requests, ``daemon`` for calls served by the
+            warm-up daemon, ``cache`` for calls answered by a local cache,
+            ``internal`` for local work
+        method: HTTP method (empty for internal spans)
+        route: Route template with placeholders instead of IDs
+        url: Full request URL
+        status: HTTP status code, if a response arrived
+        request_bytes: Request body size as sent on the wire (0 if sent chunked)
+        request_decoded_bytes: Request body size before compression
+        response_bytes: Response body size as received on the wire
+        response_decoded_bytes: Response body size after decompression (for
+            streamed responses, only known when the body is not compressed)
+        started_at: Wall-clock start time (seconds since the epoch)
+        start: Monotonic start time, for ordering spans
+        duration: Elapsed seconds
+        phases: Seconds spent per connection phase (connect, tls, send, wait, transfer)
+        retries: Number of times the request was retried
+        cache_hit: Whether a cache answered the request, if a cache was consulted
+        error: Error message if the request failed
+        attributes: Extra key/value pairs
+    """
+
+    name: str
+    kind: str = "http"
+    method: str = ""
+    route: str = ""
+    url: str = ""
+    status: int | None = None
+    request_bytes: int = 0
+    request_decoded_bytes: int = 0
+    response_bytes: int = 0
+    response_decoded_bytes: int = 0
+    started_at: float = field(default_factory=time.time)
+    start: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    retries: int = 0
+    cache_hit: bool | None = None
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def finish(self) -> None:
+        """Record the span's duration."""
+        self.duration = time.perf_counter() - self.start
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class _PhaseTimer:
+    """Accumulate httpcore trace events into a span's phases."""
+
+    def __init__(self, span: Span):
+        self.span = span
+        self._started: dict[str, float] = {}
+
+    def event(self, name: str) -> None:
+        prefix, _, stage = name.rpartition(".")
+        phase = PHASES.get(prefix)
+        if phase is None:
+            return
+        if stage == "started":
+            self._started[prefix] = time.perf_counter()
+        elif prefix in self._started:
+            elapsed = time.perf_counter() - self._started.pop(prefix)
+            self.span.phases[phase] = self.span.phases.get(phase, 0.0) + elapsed
+
+    def sync_callback(self) -> Callable[[str, dict[str, Any]], None]:
+        """Callback for httpx's sync ``trace`` extension."""
+
+        def trace(name: str, info: dict[str, Any]) -> None:
+            self.event(name)
+
+        return trace
+
+    def async_callback(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """Callback for httpx's async ``trace`` extension."""
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            self.event(name)
+
+        return trace
+
+
+class TraceHook:
+    """Base class for span consumers; override the methods you need.
+
+    Hooks may be called from several threads at once and must not raise.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts."""
+
+    def on_end(self, span: Span) -> None:
+        """Called when a span ends, with all fields filled in."""
+
+
+class SpanRecorder(TraceHook):
+    """Keep finished spans in memory."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        """Store the span."""
+        with self._lock:
+            self.spans.append(span)
+
+
+class OpenTelemetryHook(TraceHook):
+    """Forward spans to OpenTelemetry.
+
+    Requires ``opentelemetry-api``; spans go to whatever tracer provider the
+    application configured.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Initialize the hook.
+
+        Args:
+            tracer: OpenTelemetry tracer (default: ``trace.get_tracer("davybot_market_cli")``)
+        """
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetryHook requires opentelemetry-api: pip install opentelemetry-api"
+                ) from e
+            tracer = trace.get_tracer("davybot_market_cli")
+        self.tracer = tracer
+
+    def on_end(self, span: Span) -> None:
+        """Emit the finished span with its start and end times."""
+        start_ns = int(span.started_at * 1e9)
+        attributes: dict[str, Any] = {
+            "davybot.kind": span.kind,
+            "davybot.retries": span.retries,
+            **{f"davybot.phase.{phase}": seconds for phase, seconds in span.phases.items()},
+            **{f"davybot.{key}": value for key, value in span.attributes.items()},
+        }
+        if span.method:
+            attributes["http.request.method"] = span.method
+            attributes["http.route"] = span.route
+            attributes["url.full"] = span.url
+            attributes["http.request.body.size"] = span.request_bytes
+            attributes["http.response.body.size"] = span.response_bytes
+            attributes["davybot.request.decoded_size"] = span.request_decoded_bytes
+            attributes["davybot.response.decoded_size"] = span.response_decoded_bytes
+        if span.status is not None:
+            attributes["http.response.status_code"] = span.status
+        if span.cache_hit is not None:
+            attributes["davybot.cache_hit"] = span.cache_hit
+        if span.error:
+            attributes["error.type"] = span.error
+        otel_span = self.tracer.start_span(span.name, start_time=start_ns, attributes=attributes)
+        otel_span.end(end_time=start_ns + int(span.duration * 1e9))
+
+
+class PrometheusHook(TraceHook):
+    """Export request metrics with ``prometheus_client``.
+
+    Metrics: ``davybot_client_request_seconds`` (histogram by method, route and
+    status), ``davybot_client_phase_seconds`` (histogram by phase),
+    ``davybot_client_response_bytes_total`` (on the wire),
+    ``davybot_client_response_decoded_bytes_total`` (after decompression) and
+    ``davybot_client_cache_hits_total``.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "davybot_client"):
+        """Initialize the hook.
+
+        Args:
+            registry: Prometheus collector registry (default: the global registry)
+            namespace: Metric name prefix
+        """
+        try:
+            import prometheus_client as prom
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusHook requires prometheus_client: pip install prometheus-client"
+            ) from e
+        kwargs: dict[str, Any] = {"registry": registry} if registry is not None else {}
+        self.requests = prom.Histogram(
+            f"{namespace}_request_seconds",
+            "Market request duration",
+            ["method", "route", "status"],
+            **kwargs,
+        )
+        self.phases = prom.Histogram(
+            f"{namespace}_phase_seconds", "Market request phase duration", ["phase"], **kwargs
+        )
+        self.response_bytes = prom.Counter(
+            f"{namespace}_response_bytes_total", "Response bytes received", ["route"], **kwargs
+        )
+        self.response_decoded_bytes = prom.Counter(
+            f"{namespace}_response_decoded_bytes_total",
+            "Response bytes after decompression",
+            ["route"],
+            **kwargs,
+        )
+        self.cache_hits = prom.Counter(
+            f"{namespace}_cache_hits_total", "Requests answered from a cache", ["route"], **kwargs
+        )
+
+    def on_end(self, span: Span) -> None:
+        """Record the span's metrics."""
+        if span.kind == "internal":
+            return
+        route = span.route or span.name
+        status = str(span.status) if span.status is not None else "error"
+        self.requests.labels(span.method, route, status).observe(span.duration)
+        for phase, seconds in span.phases.items():
+            self.phases.labels(phase).observe(seconds)
+        self.response_bytes.labels(route).inc(span.response_bytes)
+        self.response_decoded_bytes.labels(route).inc(span.response_decoded_bytes)
+        if span.cache_hit:
+            self.cache_hits.labels(route).inc()
+
+
+class Tracer:
+    """Create spans and deliver them to hooks."""
+
+    def __init__(self, hooks: Sequence[TraceHook] = ()):
+        """Initialize the tracer.
+
+        Args:
+            hooks: Span consumers
+        """
+        self.hooks = list(hooks)
+
+    def __bool__(self) -> bool:
+        """Whether any hook is registered."""
+        return bool(self.hooks)
+
+    def start(self, span: Span) -> Span:
+        """Announce a started span to the hooks."""
+        for hook in self.hooks:
+            hook.on_start(span)
+        return span
+
+    def end(self, span: Span) -> None:
+        """Finish a span and hand it to the hooks."""
+        span.finish()
+        for hook in self.hooks:
+            hook.on_end(span)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+        """Time a block of work as a span.
+
+        Args:
+            name: Span name
+            kind: Span kind
+            **attributes: Extra span attributes
+
+        Yields:
+            The running span, so callers can add attributes
+        """
+        span = self.start(Span(name=name, kind=kind, attributes=attributes))
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            if self.hooks:
+                self.end(span)
+
+    @staticmethod
+    def phase_timer(span: Span) -> _PhaseTimer:
+        """Create a collector for httpcore trace events."""
+        return _PhaseTimer(span)
+
+
+def format_waterfall(spans: Sequence[Span], width: int = 40) -> str:
+    """Render spans as a text timing waterfall.
+
+    Each line shows a span's offset and duration as a bar on a shared time axis;
+    HTTP bars are split into phases (``c`` connect, ``t`` TLS, ``s`` send,
+    ``w`` waiting for the first byte, ``=`` transfer).
+
+    Args:
+        spans: Finished spans
+        width: Bar width in characters
+
+    Returns:
+        Multi-line text
+    """
+    if not spans:
+        return "No requests were made."
+    ordered = sorted(spans, key=lambda span: span.start)
+    origin = ordered[0].start
+    total = max(span.start + span.duration for span in ordered) - origin or 1e-9
+    scale = width / total
+    name_width = min(48, max(len(span.name) for span in ordered))
+    symbols = {"connect": "c", "tls": "t", "send": "s", "wait": "w", "transfer": "="}
+
+    lines = []
+    for span in ordered:
+        offset = int((span.start - origin) * scale)
+        length = max(1, round(span.duration * scale))
+        bar = ""
+        for phase in PHASE_ORDER:
+            bar += symbols[phase] * round(span.phases.get(phase, 0.0) * scale)
+        bar = (bar or "#")[:length].ljust(length, "#" if not span.phases else "=")
+        status = str(span.status) if span.status is not None else (span.error or "")
+        if span.cache_hit:
+            status = f"{status} cached".strip()
+        lines.append(
+            f"{span.name[:name_width]:<{name_width}}  {status:>7}  "
+            f"{span.duration * 1000:8.1f} ms  |{' ' * offset}{bar}"
+        )
+    lines.append(f"{'total':<{name_width}}  {'':>7}  {total * 1000:8.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,283 @@
+"""Record and replay transports for hermetic tests and load tests.
+
+:class:`RecordingTransport` forwards requests to the market and captures each
+request/response pair; :class:`ReplayTransport` answers from those captures
+in-process, without sockets. Captures live in a cassette file: gzip-compressed
+JSON lines, one interaction per line, response bodies stored as text when they
+are UTF-8 and base64 otherwise.
+
+    transport = cassette_transport("tests/cassettes/search.jsonl.gz")
+    with DavybotMarketClient(transport=transport, async_transport=transport) as client:
+        client.search("web")   # recorded the first time, replayed afterwards
+
+Both transports work with sync and async clients. Setting ``DAVYBOT_CASSETTE``
+makes the CLI use :func:`cassette_transport` too.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .exceptions import CassetteError
+
+CASSETTE_VERSION = 1
+MODES = ("record", "replay", "auto")
+
+# Hop-by-hop and size headers are recomputed on replay
+_SKIPPED_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-length"}
+
+
+def request_key(request: httpx.Request, body: bytes) -> str:
+    """Identify a request by method, path, query and body, ignoring the host."""
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else ""
+    return f"{request.method} {request.url.raw_path.decode('ascii')} {digest}".rstrip()
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair."""
+
+    key: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Encode for the cassette file."""
+        data: dict[str, Any] = {
+            "key": self.key,
+            "status": self.status,
+            "headers": self.headers,
+            "elapsed": round(self.elapsed, 6),
+        }
+        try:
+            data["text"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            data["b64"] = base64.b64encode(self.body).decode("ascii")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Interaction":
+        """Decode from the cassette file."""
+        if "b64" in data:
+            body = base64.b64decode(data["b64"])
+        else:
+            body = str(data.get("text", "")).encode("utf-8")
+        return cls(
+            key=data["key"],
+            status=int(data["status"]),
+            headers=[(str(k), str(v)) for k, v in data.get("headers", [])],
+            body=body,
+            elapsed=float(data.get("elapsed", 0.0)),
+        )
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Build the httpx response for a replayed request."""
+        return httpx.Response(self.status, headers=self.headers, content=self.body, request=request)
+
+
+@dataclass
+class Cassette:
+    """Recorded interactions, in recording order."""
+
+    interactions: list[Interaction] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette file.
+
+        Raises:
+            CassetteError: If the file is missing or not a cassette
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("cassette") != CASSETTE_VERSION:
+                    raise CassetteError(f"{path} is not a version {CASSETTE_VERSION} cassette")
+                return cls([Interaction.from_dict(json.loads(line)) for line in f if line.strip()])
+        except (OSError, ValueError, KeyError) as e:
+            raise CassetteError(f"Cannot read cassette {path}: {e}") from e
+
+    def save(self, path: str | Path) -> Path:
+        """Write the cassette file atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                f.write(json.dumps({"cassette": CASSETTE_VERSION}) + "\n")
+                for interaction in self.interactions:
+                    f.write(json.dumps(interaction.to_dict(), separators=(",", ":")) + "\n")
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Forward requests and record every exchange.
+
+    The cassette is written when the transport is closed, which happens when
+    the client using it exits, or explicitly with :meth:`save`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            path: Cassette file to write
+            transport: Transport for sync requests (default: a new HTTPTransport)
+            async_transport: Transport for async requests (default: a new AsyncHTTPTransport)
+        """
+        self.path = Path(path)
+        self.cassette = Cassette()
+        self._transport = transport
+        self._async_transport = async_transport
+        self._lock = threading.Lock()
+
+    def _record(
+        self, request: httpx.Request, response: httpx.Response, body: bytes, elapsed: float
+    ) -> httpx.Response:
+        interaction = Interaction(
+            key=request_key(request, request.content),
+            status=response.status_code,
+            headers=[
+                (k, v) for k, v in response.headers.multi_items() if k not in _SKIPPED_HEADERS
+            ],
+            body=body,
+            elapsed=elapsed,
+        )
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+        return interaction.to_response(request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a sync request and record it."""
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        request.read()
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            body = b"".join(response.iter_raw())
+        finally:
+            response.close()
+        return self._record(request, response, body, time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send an async request and record it."""
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        await request.aread()
+        started = time.perf_counter()
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        return self._record(request, response, body, time.perf_counter() - started)
+
+    def save(self) -> Path:
+        """Write the cassette recorded so far."""
+        with self._lock:
+            return self.cassette.save(self.path)
+
+    def close(self) -> None:
+        """Save the cassette and close the wrapped sync transport."""
+        self.save()
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Save the cassette and close the wrapped async transport."""
+        self.save()
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answer requests from a cassette, without network access.
+
+    Identical requests are answered with their recorded responses in order;
+    once those run out the last one is repeated, so a short recording can
+    drive a long load test.
+    """
+
+    def __init__(self, cassette: Cassette | str | Path, latency: bool = False):
+        """Initialize the transport.
+
+        Args:
+            cassette: Cassette or cassette file
+            latency: Sleep for each interaction's recorded duration before answering
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.latency = latency
+        self._queues: dict[str, deque[Interaction]] = {}
+        for interaction in cassette.interactions:
+            self._queues.setdefault(interaction.key, deque()).append(interaction)
+        self._lock = threading.Lock()
+
+    def _match(self, request: httpx.Request) -> Interaction:
+        key = request_key(request, request.content)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded response for {key}")
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a sync request from the cassette."""
+        request.read()
+        interaction = self._match(request)
+        if self.latency:
+            time.sleep(interaction.elapsed)
+        return interaction.to_response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer an async request from the cassette."""
+        await request.aread()
+        interaction = self._match(request)
+        if self.latency:
+            await asyncio.sleep(interaction.elapsed)
+        return interaction.to_response(request)
+
+
+def cassette_transport(
+    path: str | Path, mode: str = "auto"
+) -> RecordingTransport | ReplayTransport:
+    """Create a transport for a cassette file.
+
+    Args:
+        path: Cassette file
+        mode: 'record' to capture real traffic, 'replay' to answer from the file,
+            or 'auto' to replay if the file exists and record otherwise
+
+    Returns:
+        RecordingTransport or ReplayTransport
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown cassette mode {mode!r}; use one of {', '.join(MODES)}")
+    if mode == "replay" or (mode == "auto" and Path(path).exists()):
+        return ReplayTransport(path)
+    return RecordingTransport(path)
@@ -1,31 +1,71 @@
 """
 Shared Type Definitions
 共享类型定义模块
+
+The type modules depend on pydantic, so they are imported on first access.
 """
 
-# Analytics Types
-from .analytics import (
-    AnalyticsEvent,
-    SystemMetrics,
-    AnalyticsSettings,
-    AnalyticsSummary,
-)
-
-# Feedback Types
-from .feedback import (
-    FeedbackType,
-    FeedbackStatus,
-    Feedback,
-    FeedbackResponse,
-    FeedbackListResponse,
-)
-
-# Sync Types
-from .sync import (
-    SyncConfiguration,
-    SyncStatus,
-    SyncConflict,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY_IMPORTS: dict[str, str] = {
+    # Analytics Types
+    "AnalyticsEvent": ".analytics",
+    "SystemMetrics": ".analytics",
+    "AnalyticsSettings": ".analytics",
+    "AnalyticsSummary": ".analytics",
+    # Feedback Types
+    "FeedbackType": ".feedback",
+    "FeedbackStatus": ".feedback",
+    "Feedback": ".feedback",
+    "FeedbackResponse": ".feedback",
+    "FeedbackListResponse": ".feedback",
+    # Sync Types
+    "SyncConfiguration": ".sync",
+    "SyncStatus": ".sync",
+    "SyncConflict": ".sync",
+}
+
+if TYPE_CHECKING:
+    # Analytics Types
+    from .analytics import (
+        AnalyticsEvent,
+        SystemMetrics,
+        AnalyticsSettings,
+        AnalyticsSummary,
+    )
+
+    # Feedback Types
+    from .feedback import (
+        FeedbackType,
+        FeedbackStatus,
+        Feedback,
+        FeedbackResponse,
+        FeedbackListResponse,
+    )
+
+    # Sync Types
+    from .sync import (
+        SyncConfiguration,
+        SyncStatus,
+        SyncConflict,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import shared types on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported types."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     # Analytics
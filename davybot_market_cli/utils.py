@@ -1,18 +1,97 @@
 """Utility functions for CLI."""
 
+import click
 import os
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import Any, Tuple, Optional
 from .client import DavybotMarketClient
+from .tracing import TraceHook
 
 
 def get_api_client() -> DavybotMarketClient:
     """Get configured API client.
 
+    When a ``davy daemon`` is running (and ``DAVYBOT_NO_DAEMON`` is not set),
+    the returned client routes read-only calls through it and falls back to
+    direct requests if the daemon goes away. Under ``davy --trace`` the client
+    reports its requests to the command's span recorder. If ``DAVYBOT_CASSETTE``
+    names a cassette file, requests are recorded to or replayed from it
+    (``DAVYBOT_CASSETTE_MODE``: record, replay or auto) and the daemon is not used.
+    ``DAVYBOT_RATE_LIMIT`` (e.g. ``search=5,download=2``, requests per second)
+    enables the client-side rate limiter. Downloads share a scheduler whose
+    bandwidth budgets come from ``DAVYBOT_LIMIT_RATE`` and
+    ``DAVYBOT_BACKGROUND_RATE`` (e.g. ``5M``, bytes per second).
+    ``DAVYBOT_COMPRESS_REQUESTS`` (e.g. ``1024``, bytes) gzips JSON request
+    bodies of at least that size, for servers that accept compressed requests.
+
     Returns:
         Configured DavybotMarketClient instance
     """
     base_url = os.environ.get("DAVYBOT_API_URL", "http://localhost:8000/api/v1")
-    return DavybotMarketClient(base_url=base_url)
+    hooks: list[TraceHook] = []
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and isinstance(ctx.find_root().obj, dict):
+        recorder = ctx.find_root().obj.get("trace")
+        if recorder is not None:
+            hooks.append(recorder)
+    from .scheduler import DownloadScheduler, parse_rate
+
+    limit_rate = os.environ.get("DAVYBOT_LIMIT_RATE")
+    background_rate = os.environ.get("DAVYBOT_BACKGROUND_RATE")
+    scheduler = DownloadScheduler(
+        bandwidth=parse_rate(limit_rate) if limit_rate else None,
+        background_bandwidth=parse_rate(background_rate) if background_rate else None,
+    )
+    kwargs: dict[str, Any] = {"base_url": base_url, "hooks": hooks, "scheduler": scheduler}
+    if os.environ.get("DAVYBOT_COMPRESS_REQUESTS"):
+        kwargs["compression_threshold"] = int(os.environ["DAVYBOT_COMPRESS_REQUESTS"])
+    if os.environ.get("DAVYBOT_RATE_LIMIT"):
+        from .ratelimit import RateLimiter, parse_rates
+
+        kwargs["rate_limiter"] = RateLimiter(parse_rates(os.environ["DAVYBOT_RATE_LIMIT"]))
+    if os.environ.get("DAVYBOT_CASSETTE"):
+        from .transport import cassette_transport
+
+        transport = cassette_transport(
+            os.environ["DAVYBOT_CASSETTE"], os.environ.get("DAVYBOT_CASSETTE_MODE", "auto")
+        )
+        return DavybotMarketClient(transport=transport, async_transport=transport, **kwargs)
+    if not os.environ.get("DAVYBOT_NO_DAEMON"):
+        from .daemon import DaemonClient, daemon_available
+
+        if daemon_available():
+            return DaemonClient(**kwargs)
+    return DavybotMarketClient(**kwargs)
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for disposable local caches.
+
+    Uses ``DAVYBOT_CACHE_DIR`` if set, otherwise ``$XDG_CACHE_HOME/davybot``
+    (``~/.cache/davybot`` by default).
+
+    Returns:
+        Cache directory path (not created)
+    """
+    if os.environ.get("DAVYBOT_CACHE_DIR"):
+        return Path(os.environ["DAVYBOT_CACHE_DIR"])
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(xdg_cache) / "davybot"
+
+
+def get_data_dir() -> Path:
+    """Get the directory for persistent local state.
+
+    Uses ``DAVYBOT_DATA_DIR`` if set, otherwise ``$XDG_DATA_HOME/davybot``
+    (``~/.local/share/davybot`` by default).
+
+    Returns:
+        Data directory path (not created)
+    """
+    if os.environ.get("DAVYBOT_DATA_DIR"):
+        return Path(os.environ["DAVYBOT_DATA_DIR"])
+    xdg_data = os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+    return Path(xdg_data) / "davybot"
 
 
 def parse_resource_uri(uri: str) -> Tuple[Optional[str], str]:
@@ -42,6 +121,30 @@ def parse_resource_uri(uri: str) -> Tuple[Optional[str], str]:
         return None, uri
 
 
+def collect_files(path: Path) -> dict[str, str]:
+    """Read the text files of a resource directory for publishing.
+
+    Hidden files and directories are skipped, as are files that cannot be
+    read as text.
+
+    Args:
+        path: Resource directory
+
+    Returns:
+        Dictionary of relative file path to content
+    """
+    files: dict[str, str] = {}
+    for file_path in path.rglob("*"):
+        if file_path.is_file() and not any(part.startswith(".") for part in file_path.parts):
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                # Skip files that cannot be read
+                continue
+            files[str(file_path.relative_to(path))] = content
+    return files
+
+
 def format_resource(resource: dict) -> str:
     """Format a resource for display.
 
@@ -0,0 +1,23 @@
+"""Shared test fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def make_client() -> Callable[..., DavybotMarketClient]:
+    """Build clients whose requests are answered by a handler instead of the network."""
+
+    def make(handler: Handler, **kwargs: Any) -> DavybotMarketClient:
+        return DavybotMarketClient(
+            base_url="http://market/api/v1", transport=httpx.MockTransport(handler), **kwargs
+        )
+
+    return make
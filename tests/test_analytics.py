@@ -0,0 +1,294 @@
+"""Tests for the analytics event pipeline."""
+
+import gzip
+import json
+import pickle
+import threading
+import time
+
+import httpx
+import pytest
+
+from davybot_market_cli.analytics import (
+    AnalyticsAggregator,
+    AnalyticsEmitter,
+    HyperLogLog,
+    SampledEmitter,
+    SamplingPolicy,
+    SamplingRule,
+    SpaceSaving,
+)
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import APIError
+from davybot_market_cli.types import AnalyticsEvent, AnalyticsSettings
+
+
+def make_event(i: int) -> AnalyticsEvent:
+    return AnalyticsEvent(
+        eventType="feature_use",
+        timestamp="2025-01-22T10:00:00Z",
+        sessionId=f"sess_{i % 3}",
+        data={"n": i},
+    )
+
+
+def test_batches_are_compressed_and_sized(tmp_path):
+    """Test that events arrive gzip-compressed in batches of at most batch_size."""
+    batches: list[list[dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/analytics/events"
+        assert request.headers["Content-Encoding"] == "gzip"
+        batches.append(json.loads(gzip.decompress(request.content))["events"])
+        return httpx.Response(202)
+
+    with (
+        DavybotMarketClient(
+            base_url="http://market/api/v1", transport=httpx.MockTransport(handler)
+        ) as client,
+        AnalyticsEmitter(
+            client, batch_size=10, flush_interval=60, spill_path=tmp_path / "spill.gz"
+        ) as emitter,
+    ):
+        for i in range(25):
+            assert emitter.emit(make_event(i))
+        assert emitter.flush(timeout=5)
+        assert sum(len(b) for b in batches) == 25
+        emitter.emit({"eventType": "raw", "timestamp": "t", "sessionId": "s"})
+
+    assert all(1 <= len(batch) <= 10 for batch in batches)
+    assert batches[0][0] == {
+        "eventType": "feature_use",
+        "timestamp": "2025-01-22T10:00:00Z",
+        "sessionId": "sess_0",
+        "data": {"n": 0},
+    }
+    assert emitter.stats["sent"] == 26 and emitter.stats["dropped"] == 0
+
+
+def test_spill_when_backend_is_down(tmp_path):
+    """Test that failed batches are spilled and resent once the backend is back."""
+    delivered: list[dict] = []
+    down = True
+
+    def send(batch):
+        if down:
+            raise APIError("API error: 503")
+        delivered.extend(batch)
+
+    spill = tmp_path / "spill.jsonl.gz"
+    emitter = AnalyticsEmitter(send=send, batch_size=5, flush_interval=60, spill_path=spill)
+    for i in range(12):
+        emitter.emit(make_event(i))
+    emitter.flush(timeout=5)
+    assert delivered == [] and spill.exists()
+    assert emitter.stats["spilled"] == 12
+
+    down = False
+    emitter._retry_at = 0.0
+    emitter.emit(make_event(12))
+    emitter.close()
+    assert sorted(event["data"]["n"] for event in delivered) == list(range(13))
+    assert not spill.exists()
+
+
+def test_unexpected_send_errors_do_not_stop_delivery(tmp_path):
+    """Test that a batch failing with an unexpected error is dropped, not fatal."""
+    delivered: list[dict] = []
+    calls = 0
+
+    def send(batch):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("client closed")
+        delivered.extend(batch)
+
+    emitter = AnalyticsEmitter(send=send, flush_interval=60, spill_path=tmp_path / "s")
+    emitter.emit(make_event(0))
+    assert emitter.flush(timeout=5)
+    emitter.emit(make_event(1))
+    assert emitter.flush(timeout=5)
+    emitter.close()
+
+    assert [event["data"]["n"] for event in delivered] == [1]
+    assert emitter.stats["failures"] == 1 and emitter.stats["dropped"] == 1
+    with pytest.raises(TypeError):
+        emitter.emit({"eventType": "bad", "data": object()})
+
+
+def test_emit_never_blocks(tmp_path):
+    """Test that a full queue drops events instead of blocking the caller."""
+    release = threading.Event()
+
+    def slow_send(batch):
+        release.wait(5)
+
+    emitter = AnalyticsEmitter(
+        send=slow_send, max_queue=10, batch_size=5, flush_interval=0.01, spill_path=tmp_path / "s"
+    )
+    started = time.perf_counter()
+    results = [emitter.emit(make_event(i)) for i in range(1000)]
+    assert time.perf_counter() - started < 0.5
+    assert results.count(False) > 0
+    assert emitter.stats["dropped"] == results.count(False)
+    release.set()
+    emitter.close()
+
+
+def test_hyperloglog_estimates_and_merges():
+    """Test cardinality estimates and that merged sketches count the union."""
+    left, right = HyperLogLog(), HyperLogLog()
+    for i in range(60_000):
+        left.add(f"session-{i}")
+    for i in range(40_000, 100_000):
+        right.add(f"session-{i}")
+    assert abs(left.count() - 60_000) / 60_000 < 0.03
+    left.merge(right)
+    assert abs(left.count() - 100_000) / 100_000 < 0.03
+    assert HyperLogLog().count() == 0
+
+
+def test_space_saving_keeps_heavy_hitters():
+    """Test that frequent keys survive a stream of rare ones."""
+    sketch = SpaceSaving(capacity=8)
+    for i in range(5000):
+        sketch.add("view" if i % 2 else "click")
+        sketch.add(f"rare-{i}")
+    assert list(sketch.top(2)) == ["click", "view"]
+    other = SpaceSaving(capacity=8)
+    for _ in range(3000):
+        other.add("view")
+    sketch.merge(other)
+    assert list(sketch.top(1)) == ["view"]
+
+
+def test_aggregator_summary_and_merge():
+    """Test summary fields and that partial aggregates merge into the same totals."""
+    events = [
+        {"eventType": kind, "sessionId": session, "timestamp": f"2025-01-22T10:00:{second:02d}Z"}
+        for session, kind, second in [
+            ("a", "session_start", 0),
+            ("a", "feature_use", 10),
+            ("b", "session_start", 5),
+            ("a", "error", 30),
+            ("b", "feature_use", 25),
+        ]
+    ]
+    whole = AnalyticsAggregator()
+    whole.add_many(events)
+    summary = whole.summary()
+    assert summary.totalEvents == 5
+    assert summary.uniqueSessions == 2
+    assert summary.topEvents == {"feature_use": 2, "session_start": 2, "error": 1}
+    assert summary.errorRate == 0.2
+    assert summary.avgSessionDuration == 25.0
+
+    first, second = AnalyticsAggregator(), AnalyticsAggregator()
+    first.add_many(events[:2])
+    second.add_many(events[2:])
+    merged = pickle.loads(pickle.dumps(first))
+    merged.merge(second)
+    assert merged.summary() == summary
+
+
+def test_sessions_reopen_after_being_folded():
+    """Test that a session active again after it was folded is not counted twice."""
+    events = [
+        {"eventType": "view", "sessionId": session, "timestamp": f"2025-01-22T10:00:{second:02d}Z"}
+        for second in (0, 10, 20)
+        for session in "abcde"
+    ]
+    whole = AnalyticsAggregator(max_open_sessions=2)
+    whole.add_many(events)
+    assert whole.summary().avgSessionDuration == 20.0
+
+    first, second = AnalyticsAggregator(max_open_sessions=2), AnalyticsAggregator()
+    first.add_many(events[:10])
+    second.add_many(events[10:])
+    first.merge(second)
+    assert first.summary().avgSessionDuration == 20.0
+
+
+class ListEmitter:
+    """Stand-in for AnalyticsEmitter that keeps emitted events."""
+
+    def __init__(self):
+        self.events: list[dict] = []
+
+    def emit(self, event):
+        self.events.append(event)
+        return True
+
+    def flush(self, timeout=None):
+        return True
+
+    def close(self):
+        pass
+
+
+def test_policy_follows_settings():
+    """Test that AnalyticsSettings flags select the sampling rules."""
+    off = SamplingPolicy.from_settings(AnalyticsSettings())
+    assert off.rule_for("error").rate == 0 and off.rule_for("feature_use").rate == 0
+
+    usage = SamplingPolicy.from_settings(AnalyticsSettings(enabled=True, usageTracking=True))
+    assert usage.rule_for("error").rate == 1
+    assert usage.rule_for("feature_use") == SamplingRule(
+        rate=0.0, rollup=True, dimensions=("feature", "action")
+    )
+    assert usage.rule_for("performance").rate == 0
+
+    detailed = SamplingPolicy.from_settings(
+        AnalyticsSettings(enabled=True, usageTracking=True, performanceMonitoring=True),
+        sample_rate=0.1,
+    )
+    rule = detailed.rule_for("feature_use")
+    assert rule.rate == 0.1 and rule.rollup and rule.keep_above is not None
+    assert detailed.rule_for("performance").rate == 0.1
+
+
+def test_sampling_keeps_tail_and_rolls_up():
+    """Test sampling rate, tail keeping, roll-up counters and re-weighted totals."""
+    policy = SamplingPolicy(
+        {
+            "feature_use": SamplingRule(rate=0.0, keep_above=500, rollup=True, dimensions=("f",)),
+            "search": SamplingRule(rate=0.25),
+        }
+    )
+    emitter = ListEmitter()
+    recorder = SampledEmitter(emitter, policy, seed=1)  # type: ignore[arg-type]
+    for i in range(1000):
+        event = {
+            "eventType": "feature_use",
+            "timestamp": "2025-01-22T10:00:00Z",
+            "sessionId": "s",
+            "data": {"f": "install" if i % 2 else "search", "duration": 900 if i == 7 else 10},
+        }
+        recorder.record(event)
+    for _ in range(2000):
+        recorder.record(
+            {"eventType": "search", "timestamp": "2025-01-22T10:00:00Z", "sessionId": "s"}
+        )
+    recorder.flush()
+
+    singles = [e for e in emitter.events if e["eventType"] == "feature_use"]
+    assert len(singles) == 1 and singles[0]["data"]["duration"] == 900
+    assert singles[0]["data"]["rolledUp"] is True
+    rollups = {
+        e["data"]["dimensions"]["f"]: e["data"]
+        for e in emitter.events
+        if e["eventType"] == "rollup"
+    }
+    assert rollups["install"]["count"] == 500 and rollups["search"]["count"] == 500
+    assert rollups["install"]["duration"] == {"sum": 5890.0, "max": 900.0}
+    searches = [e for e in emitter.events if e["eventType"] == "search"]
+    assert 400 < len(searches) < 600
+    assert all(e["data"]["sampleRate"] == 0.25 for e in searches)
+    assert recorder.stats["recorded"] == 3000 and recorder.stats["rolled_up"] == 1000
+
+    aggregator = AnalyticsAggregator()
+    aggregator.add_many(emitter.events)
+    top = aggregator.summary().topEvents
+    assert top["feature_use"] == 1000
+    assert abs(top["search"] - 2000) < 400
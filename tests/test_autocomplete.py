@@ -0,0 +1,82 @@
+"""Tests for search-as-you-type."""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from davybot_market_cli.autocomplete import Autocomplete
+from davybot_market_cli.client import DavybotMarketClient
+
+CATALOG = [
+    {"name": name, "type": "skill", "description": f"{name} helper", "tags": []}
+    for name in ["database", "data-viz", "date-utils", "docker", "dashboard", "deploy"]
+] + [
+    {"name": f"misc-{i}", "type": "skill", "description": "other", "tags": ["d"]}
+    for i in range(100)
+]
+
+
+def search(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    hits = [r for r in CATALOG if body["query"].lower() in (r["name"] + " " + r["description"])]
+    return httpx.Response(200, json={"results": hits[: body["limit"]], "total": len(hits)})
+
+
+def test_longer_queries_filtered_locally():
+    """Test that narrowing a complete result set needs no request and is fast."""
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(json.loads(request.content)["query"])
+        return search(request)
+
+    with DavybotMarketClient(
+        base_url="http://market/api/v1", transport=httpx.MockTransport(handler)
+    ) as client:
+        completer = Autocomplete(client, debounce=0)
+        assert completer.complete("da")["total"] == 4
+        started = time.perf_counter()
+        result = completer.complete("dat")
+        assert time.perf_counter() - started < 0.05
+        assert [r["name"] for r in result["results"]] == ["database", "data-viz", "date-utils"]
+        assert completer.complete("DATA ")["total"] == 2
+        assert queries == ["da"]
+
+        # "o" matches more than one fetch holds, so "ot" must ask the API
+        assert completer.complete("o")["total"] > completer.fetch_size
+        completer.complete("ot")
+        assert queries == ["da", "o", "ot"]
+    assert completer.stats == {"requests": 3, "cached": 2, "stale": 0}
+
+
+def test_async_keystroke_burst_cancels_stale_requests():
+    """Test that a newer keystroke cancels the older request and debounces the burst."""
+    started, finished = [], []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        started.append(query)
+        await asyncio.sleep(0.05)
+        finished.append(query)
+        return search(request)
+
+    async def main() -> list:
+        async with DavybotMarketClient(
+            base_url="http://market/api/v1", async_transport=httpx.MockTransport(handler)
+        ) as client:
+            completer = Autocomplete(client, debounce=0.02)
+
+            async def type_key(text: str, after: float):
+                await asyncio.sleep(after)
+                return await completer.acomplete(text)
+
+            return await asyncio.gather(
+                type_key("d", 0), type_key("do", 0.005), type_key("doc", 0.01)
+            )
+
+    first, second, third = asyncio.run(main())
+    assert first is None and second is None
+    assert [r["name"] for r in third["results"]] == ["docker"]
+    assert started == ["d", "doc"] and finished == ["doc"]
@@ -0,0 +1,49 @@
+"""Tests for the benchmark runner and the local stand-in server."""
+
+import asyncio
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from davybot_market_cli.bench import parse_mix, percentile, run_benchmark
+from davybot_market_cli.cli import cli
+from davybot_market_cli.testing import FakeMarketServer
+
+
+def test_parse_mix_and_percentile():
+    """Test mix parsing and nearest-rank percentiles."""
+    assert parse_mix("search=3, download") == {"search": 3.0, "download": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("upload=1")
+    with pytest.raises(ValueError):
+        parse_mix("search=0")
+    values = [float(i) for i in range(1, 101)]
+    assert (percentile(values, 0.5), percentile(values, 0.99), percentile(values, 0.999)) == (
+        50.0,
+        99.0,
+        100.0,
+    )
+
+
+def test_benchmark_against_local_server():
+    """Test that every operation runs against the stand-in server."""
+    with FakeMarketServer(resources=10, archive_size=1024) as server:
+        result = asyncio.run(run_benchmark(server.base_url, requests=60, concurrency=4, warmup=4))
+
+    summary = result.to_dict()
+    assert summary["requests"] == 60
+    assert summary["total"]["errors"] == 0
+    assert set(summary["operations"]) == {"search", "get_resource", "list", "download"}
+    assert server.hits["/{type}s/{id}/download"] > 0
+    assert summary["total"]["p50_ms"] <= summary["total"]["p999_ms"]
+
+
+def test_bench_command_json():
+    """Test that `davy bench --local` emits machine-readable JSON."""
+    result = CliRunner().invoke(
+        cli, ["bench", "--local", "-n", "20", "-c", "2", "--warmup", "0", "-o", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["requests"] == 20
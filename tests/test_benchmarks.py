@@ -0,0 +1,35 @@
+"""Smoke test for the SDK micro-benchmark suite."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_sdk_suite_runs_quick():
+    """Test that every benchmark case runs and reports a rate."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "benchmarks" / "bench_sdk.py"), "--quick", "--repeat", "1"]
+        + ["--json"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout)
+    assert report["regressions"] == []
+    assert set(report["results"]) == {
+        "request_overhead",
+        "parse_response",
+        "decode_models",
+        "decode_views",
+        "parse_uri",
+        "download_stream",
+        "publish_pack",
+    }
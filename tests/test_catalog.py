@@ -0,0 +1,45 @@
+"""Tests for columnar catalog tables."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from davybot_market_cli.catalog import CatalogTable
+
+ITEMS = [
+    {"id": "1", "name": "a", "type": "skill", "downloads": 10, "rating": 4.5, "tags": ["web"]},
+    {"id": "2", "name": "b", "type": "agent", "downloads": 50, "rating": 3.0, "tags": []},
+    {
+        "id": "3",
+        "name": "c",
+        "type": "skill",
+        "downloads": 30,
+        "rating": 4.9,
+        "tags": ["web", "ai"],
+    },
+    {"id": "4", "name": "d", "type": "skill", "downloads": 5, "tags": ["ai"]},
+]
+
+
+def test_filter_and_top_k():
+    """Test vectorized filtering and ranking keep tags aligned with rows."""
+    table = CatalogTable.from_responses([{"items": ITEMS[:2]}, {"results": ITEMS[2:]}])
+
+    skills = table.where(resource_type="skill", tags_any=["web", "ai"])
+    top = skills.top_k("downloads", 2).to_records()
+
+    assert [r["id"] for r in top] == ["3", "1"]
+    assert top[0]["tags"] == ["web", "ai"]
+    assert [r["id"] for r in table.where(tags_all=["web", "ai"]).to_records()] == ["3"]
+    assert len(table.where(resource_type="mcp")) == 0
+    assert list(table.sort_by("rating", descending=False).ids) == ["4", "2", "1", "3"]
+
+
+def test_arrow_export(tmp_path):
+    """Test that Parquet export round-trips tags."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = CatalogTable.from_items(ITEMS).write_parquet(tmp_path / "catalog.parquet")
+
+    data = pq.read_table(path).to_pydict()
+    assert data["id"] == ["1", "2", "3", "4"]
+    assert data["tags"][2] == ["web", "ai"]
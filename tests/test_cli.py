@@ -36,3 +36,18 @@ def test_health_command_help(runner):
     result = runner.invoke(cli, ["health", "--help"])
     assert result.exit_code == 0
     assert "Check API health status" in result.output
+
+
+def test_list_installed_empty(runner, tmp_path, monkeypatch):
+    """Test listing installed resources with an empty registry."""
+    monkeypatch.setenv("DAVYBOT_DATA_DIR", str(tmp_path))
+    result = runner.invoke(cli, ["list", "--installed"])
+    assert result.exit_code == 0
+    assert "No resources installed" in result.output
+
+
+def test_upgrade_requires_target(runner):
+    """Test that upgrade refuses to run without resources or --all."""
+    result = runner.invoke(cli, ["upgrade"])
+    assert result.exit_code != 0
+    assert "--all" in result.output
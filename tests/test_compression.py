@@ -0,0 +1,101 @@
+"""Tests for response encoding negotiation and request body compression."""
+
+import gzip
+import json
+
+import httpx
+
+from davybot_market_cli import _json
+from davybot_market_cli.compression import accept_encoding, compress_body
+from davybot_market_cli.tracing import SpanRecorder
+
+RESOURCES = [{"id": str(i), "name": f"web-scraper-{i}", "type": "skill"} for i in range(200)]
+
+
+class CompressingServer:
+    """Gzip responses when asked to, and record what the client sent."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            body = request.content
+            if request.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return httpx.Response(201, json=json.loads(body))
+        data = json.dumps({"items": RESOURCES, "total": len(RESOURCES)}).encode()
+        headers = {}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        # An iterator body is read through the client, like one from the network
+        return httpx.Response(200, content=iter([data]), headers=headers)
+
+
+def test_accept_encoding_lists_decodable_codings():
+    """Test that gzip is always offered and deflate never is."""
+    offered = [coding.split(";")[0] for coding in accept_encoding().split(", ")]
+    assert "gzip" in offered
+    assert "deflate" not in offered
+
+
+def test_small_or_incompressible_bodies_are_sent_as_is():
+    """Test that compression is skipped below the threshold or when it does not pay off."""
+    assert compress_body(b"x" * 100, 1024) is None
+    assert compress_body(b"x" * 2000, None) is None
+    assert gzip.decompress(compress_body(b"x" * 2000, 1024)) == b"x" * 2000
+
+
+def test_compressed_responses_record_wire_and_decoded_sizes(make_client):
+    """Test that spans show the saving of a gzipped list response."""
+    server = CompressingServer()
+    recorder = SpanRecorder()
+    with make_client(server.handler, hooks=[recorder]) as client:
+        listing = client.list_skills(limit=200)
+
+    assert listing["total"] == 200
+    (span,) = recorder.spans
+    assert span.attributes["content_encoding"] == "gzip"
+    assert span.response_decoded_bytes == len(json.dumps(listing))
+    assert 0 < span.response_bytes < span.response_decoded_bytes
+
+
+def test_large_request_bodies_are_gzipped_when_enabled(monkeypatch, make_client):
+    """Test that request compression is opt-in and bodies are encoded only once."""
+    server = CompressingServer()
+    recorder = SpanRecorder()
+    files = {"skill.py": "print('hello')\n" * 200}
+    encodes = 0
+    real_dumps = _json.dumps
+
+    def counting_dumps(value):
+        nonlocal encodes
+        encodes += 1
+        return real_dumps(value)
+
+    monkeypatch.setattr(_json, "dumps", counting_dumps)
+    with make_client(server.handler, hooks=[recorder], compression_threshold=1024) as client:
+        large = client.create_skill("big", files)
+        small = client.create_skill("small", {"skill.py": "pass"})
+    with make_client(server.handler) as client:
+        client.create_skill("big", files)
+
+    assert large["files"] == files and small["name"] == "small"
+    assert encodes == 2
+    encodings = [request.headers.get("Content-Encoding") for request in server.requests]
+    assert encodings == ["gzip", None, None]
+    assert all(r.headers["Content-Type"] == "application/json" for r in server.requests)
+    big_span = recorder.spans[0]
+    assert big_span.request_bytes < big_span.request_decoded_bytes
+
+
+def test_compression_can_be_enabled_for_the_cli(monkeypatch):
+    """Test that DAVYBOT_COMPRESS_REQUESTS sets the client's threshold."""
+    from davybot_market_cli.utils import get_api_client
+
+    monkeypatch.setenv("DAVYBOT_NO_DAEMON", "1")
+    assert get_api_client().compression_threshold is None
+    monkeypatch.setenv("DAVYBOT_COMPRESS_REQUESTS", "2048")
+    assert get_api_client().compression_threshold == 2048
@@ -0,0 +1,82 @@
+"""Tests for the warm-up daemon and its client."""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from davybot_market_cli.daemon import DaemonClient, MarketDaemon, _absolute_paths
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def market():
+    """Serve a single skill over HTTP and count the requests."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            body = json.dumps({"id": "s1", "name": "web-scraper", "version": "1.0.0"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/api/v1", hits
+    server.shutdown()
+
+
+def test_calls_go_through_daemon_cache(market, tmp_path):
+    """Test that repeated metadata calls are served from the daemon's cache."""
+    base_url, hits = market
+    sock_path = tmp_path / "d.sock"
+    daemon = MarketDaemon(socket_path=sock_path, base_url=base_url, refresh_interval=3600)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if sock_path.exists():
+            break
+        time.sleep(0.01)
+
+    try:
+        with DaemonClient(socket_path=sock_path, base_url=base_url) as client:
+            first = client.get_resource("skill", "s1")
+            second = client.get_resource("skill", "s1")
+        assert first == second
+        assert hits.count("/api/v1/skills/s1") == 1
+        assert daemon.stats["cache_hits"] == 1
+    finally:
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+
+def test_falls_back_to_direct_without_daemon(market, tmp_path):
+    """Test that the client talks to the market directly if no daemon listens."""
+    base_url, hits = market
+    with DaemonClient(socket_path=tmp_path / "missing.sock", base_url=base_url) as client:
+        assert client.get_resource("skill", "s1")["name"] == "web-scraper"
+    assert hits == ["/api/v1/skills/s1"]
+
+
+def test_relative_paths_are_sent_absolute(tmp_path, monkeypatch):
+    """Test that output paths are resolved against the caller's working directory."""
+    monkeypatch.chdir(tmp_path)
+    args, kwargs = _absolute_paths("download", ("skill", "s1", "out.zip"), {})
+    assert args == ["skill", "s1", str(tmp_path / "out.zip")]
+    args, kwargs = _absolute_paths(
+        "download_resource", ("skill", "s1"), {"output_dir": Path("out"), "format": "zip"}
+    )
+    assert kwargs == {"output_dir": str(tmp_path / "out"), "format": "zip"}
+    assert _absolute_paths("get_resource", ("skill", "s1"), {}) == (["skill", "s1"], {})
@@ -0,0 +1,169 @@
+"""Tests for feedback submission."""
+
+import base64
+import gzip
+import json
+import logging
+
+import httpx
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import APIError, ValidationError
+from davybot_market_cli.feedback import FeedbackSubmitter, LogBuffer
+from davybot_market_cli.tracing import SpanRecorder
+from davybot_market_cli.types import Feedback, FeedbackType
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+BITMAP = b"BM" + b"\x07" * 10_000
+
+
+def make_feedback(**kwargs) -> Feedback:
+    return Feedback(
+        id="fb_1",
+        type=FeedbackType.PERFORMANCE,
+        title="Slow search",
+        description="Search takes seconds",
+        timestamp="2025-01-22T10:00:00Z",
+        **kwargs,
+    )
+
+
+def parse_multipart(request: httpx.Request) -> dict[str, list[tuple[dict[str, str], bytes]]]:
+    """Split a multipart body into parts by field name."""
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    parts: dict[str, list[tuple[dict[str, str], bytes]]] = {}
+    for chunk in request.read().split(b"--" + boundary)[1:-1]:
+        head, body = chunk[2:-2].split(b"\r\n\r\n", 1)
+        headers = dict(
+            line.decode().split(": ", 1) for line in head.split(b"\r\n") if b": " in line
+        )
+        name = headers["Content-Disposition"].split('name="')[1].split('"')[0]
+        parts.setdefault(name, []).append((headers, body))
+    return parts
+
+
+def test_log_buffer_caps_lines_and_bytes():
+    """Test that the ring buffer keeps the newest lines within both caps."""
+    buffer = LogBuffer(max_bytes=100, max_lines=5)
+    buffer.extend(f"line {i}" for i in range(20))
+    assert buffer.lines() == [f"line {i}" for i in range(15, 20)]
+    buffer.append("x" * 95)
+    assert buffer.lines() == ["x" * 95] and buffer.size == 95
+    buffer.append("y" * 500)
+    assert buffer.lines() == ["y" * 100]
+
+    logger = logging.getLogger("test_feedback")
+    logger.addHandler(buffer.handler())
+    logger.warning("disk full")
+    assert buffer.lines()[-1].endswith("WARNING test_feedback: disk full")
+
+
+def test_screenshots_sent_as_binary_parts(tmp_path):
+    """Test the multipart layout: small JSON report plus binary, gzipped-if-useful parts."""
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/feedback"
+        received.append(parse_multipart(request))
+        return httpx.Response(200, json={"success": True, "feedbackId": "fb_1"})
+
+    screenshot = tmp_path / "screen.bmp"
+    screenshot.write_bytes(BITMAP)
+    logs = LogBuffer(max_lines=2)
+    logs.extend(["a", "b", "c"])
+    feedback = make_feedback(screenshots=[base64.b64encode(PNG).decode()], appLogs=["x"] * 10)
+
+    with (
+        DavybotMarketClient(
+            base_url="http://market/api/v1", transport=httpx.MockTransport(handler)
+        ) as client,
+        FeedbackSubmitter(client, logs=logs) as submitter,
+    ):
+        result = submitter.submit(feedback, screenshots=[screenshot]).result(5)
+
+    assert result["feedbackId"] == "fb_1"
+    parts = received[0]
+    report = json.loads(parts["feedback"][0][1])
+    assert report["appLogs"] == ["b", "c"] and report["screenshots"] == []
+    assert report["type"] == "performance"
+    (png_headers, png), (bmp_headers, bmp) = parts["screenshots"]
+    assert png == PNG and png_headers["Content-Type"] == "image/png"
+    assert bmp_headers["Content-Encoding"] == "gzip" and len(bmp) < len(BITMAP)
+    assert gzip.decompress(bmp) == BITMAP
+
+
+def test_text_only_report_is_multipart():
+    """Test that a report without screenshots is still sent as multipart."""
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        received.append(parse_multipart(request))
+        return httpx.Response(200, json={"success": True, "feedbackId": "fb_1"})
+
+    with DavybotMarketClient(
+        base_url="http://market/api/v1", transport=httpx.MockTransport(handler)
+    ) as client:
+        client.submit_feedback(make_feedback().model_dump(exclude_none=True))
+
+    ((headers, body),) = received[0]["feedback"]
+    assert headers["Content-Type"] == "application/json"
+    assert json.loads(body)["title"] == "Slow search"
+    assert "screenshots" not in received[0]
+
+
+class WireTransport(httpx.BaseTransport):
+    """Send request bodies chunk by chunk, as a network transport does, without reading them."""
+
+    def __init__(self) -> None:
+        self.bodies: list[bytes] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.SyncByteStream)
+        self.bodies.append(b"".join(request.stream))
+        return httpx.Response(200, json={"success": True, "feedbackId": "fb_1"})
+
+
+def test_reports_can_be_sent_through_a_traced_client():
+    """Test that multipart reports, which cannot be read back, are traced."""
+    transport = WireTransport()
+    recorder = SpanRecorder()
+    with DavybotMarketClient(
+        base_url="http://market/api/v1", transport=transport, hooks=[recorder]
+    ) as client:
+        result = client.submit_feedback(make_feedback().model_dump(exclude_none=True))
+
+    assert result["feedbackId"] == "fb_1"
+    (span,) = recorder.spans
+    assert span.status == 200
+    assert span.request_bytes == len(transport.bodies[0])
+
+
+def test_submission_retries_transient_errors():
+    """Test that server errors are retried and validation errors are not."""
+    statuses = [503, 502, 200]
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(parse_multipart(request))
+        status = statuses.pop(0)
+        return httpx.Response(status, json={"success": True, "feedbackId": "fb_1"})
+
+    with DavybotMarketClient(
+        base_url="http://market/api/v1", transport=httpx.MockTransport(handler)
+    ) as client:
+        submitter = FeedbackSubmitter(client, retry_delay=0.01)
+        feedback = make_feedback(screenshots=[base64.b64encode(BITMAP).decode()])
+        assert submitter.submit(feedback).result(5)["success"]
+        # Every attempt re-sends the full screenshot
+        assert all(len(a["screenshots"]) == 1 for a in attempts) and len(attempts) == 3
+
+        statuses[:] = [503, 422]
+        with pytest.raises(ValidationError):
+            submitter.submit(feedback).result(5)
+        statuses[:] = [500] * 5
+        with pytest.raises(APIError):
+            submitter.submit(feedback).result(5)
+        submitter.close()
+    assert len(attempts) == 3 + 2 + 5
@@ -0,0 +1,56 @@
+"""Tests that keep package and CLI startup free of heavy imports."""
+
+import subprocess
+import sys
+
+import click
+
+import davybot_market_cli
+
+HEAVY_MODULES = ("httpx", "pydantic")
+
+
+def _loaded_after(code):
+    probe = (
+        f"import sys\n{code}\n"
+        f"print('loaded=' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip().splitlines()[-1].removeprefix("loaded=")
+
+
+def test_package_import_is_light():
+    """Test that importing the package does not load httpx or pydantic."""
+    assert _loaded_after("import davybot_market_cli") == ""
+
+
+def test_cli_version_is_light():
+    """Test that `davy --version` does not load command modules or the SDK."""
+    code = (
+        "from davybot_market_cli.cli import cli\n"
+        "try:\n"
+        "    cli(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert _loaded_after(code) == ""
+
+
+def test_lazy_exports_resolve():
+    """Test that every public name is still importable from the package."""
+    for name in davybot_market_cli.__all__:
+        assert getattr(davybot_market_cli, name) is not None
+
+
+def test_lazy_command_help_matches_commands():
+    """Test that the short help listed without imports matches each command's own."""
+    from davybot_market_cli.cli import LAZY_COMMANDS, cli
+
+    ctx = click.Context(cli)
+    for name, (_, short_help) in LAZY_COMMANDS.items():
+        command = cli.get_command(ctx, name)
+        assert command is not None
+        assert command.get_short_help_str(limit=200) == short_help, name
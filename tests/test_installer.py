@@ -0,0 +1,67 @@
+"""Tests for atomic install and rollback."""
+
+import zipfile
+
+import pytest
+
+from davybot_market_cli import installer
+from davybot_market_cli.exceptions import InstallError
+
+
+def _stage(target, version):
+    staging = installer.create_staging_dir(target)
+    (staging / "skill.py").write_text(f"VERSION = {version!r}\n")
+    installer.write_manifest(staging, {"name": target.name, "version": version})
+    return staging
+
+
+def test_commit_keeps_previous_version(tmp_path):
+    """Test that an upgrade swaps in the new version and keeps the old one."""
+    target = installer.target_dir_for(tmp_path, "web-scraper")
+    assert installer.commit_staging(_stage(target, "1.0.0"), target) is None
+
+    previous = installer.commit_staging(_stage(target, "2.0.0"), target)
+
+    assert installer.read_manifest(target)["version"] == "2.0.0"
+    assert previous is not None
+    assert installer.read_manifest(previous)["version"] == "1.0.0"
+    assert not list(tmp_path.glob(".web-scraper.staging-*"))
+
+
+def test_rollback_swaps_versions(tmp_path):
+    """Test that rollback restores the previous version and can roll forward."""
+    target = installer.target_dir_for(tmp_path, "web-scraper")
+    installer.commit_staging(_stage(target, "1.0.0"), target)
+    installer.commit_staging(_stage(target, "2.0.0"), target)
+
+    installer.rollback(target)
+    assert installer.read_manifest(target)["version"] == "1.0.0"
+
+    installer.rollback(target)
+    assert installer.read_manifest(target)["version"] == "2.0.0"
+
+
+def test_rollback_without_previous_fails(tmp_path):
+    """Test that rollback refuses when nothing was replaced."""
+    target = installer.target_dir_for(tmp_path, "web-scraper")
+    installer.commit_staging(_stage(target, "1.0.0"), target)
+
+    with pytest.raises(InstallError):
+        installer.rollback(target)
+
+
+def test_resources_sharing_a_name_cannot_share_a_directory(tmp_path):
+    """Test that a plan mapping two resources to one directory is rejected."""
+    installer.check_targets(tmp_path, [("skill", "foo"), ("agent", "bar")])
+    with pytest.raises(InstallError, match="skill://foo and mcp://foo"):
+        installer.check_targets(tmp_path, [("skill", "foo"), ("mcp", "foo")])
+
+
+def test_extract_rejects_path_traversal(tmp_path):
+    """Test that archives cannot write outside the staging directory."""
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../escape.txt", "nope")
+
+    with pytest.raises(InstallError):
+        installer.extract_archive(archive, tmp_path / "dest")
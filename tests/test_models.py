@@ -0,0 +1,52 @@
+"""Tests for data models."""
+
+from datetime import datetime
+
+from davybot_market_cli.models import Resource, ResourceListView, ResourceView, SearchResultView
+
+
+def _item(**overrides):
+    item = {
+        "id": "s1",
+        "name": "web-scraper",
+        "type": "skill",
+        "metadata": {"license": "MIT"},
+        "created_at": "2025-01-22T10:00:00Z",
+    }
+    item.update(overrides)
+    return item
+
+
+def test_from_dict_does_not_mutate_input():
+    """Test that decoding leaves the API dictionary untouched."""
+    data = _item()
+    resource = Resource.from_dict(data)
+
+    assert resource.created_at == datetime.fromisoformat("2025-01-22T10:00:00+00:00")
+    assert resource.extra_metadata == {"license": "MIT"}
+    assert data == _item()
+
+
+def test_resource_view_parses_lazily():
+    """Test that views read fields on demand and match the dataclass."""
+    view = ResourceView(_item())
+
+    assert view.name == "web-scraper"
+    assert not isinstance(view._created_at, datetime)
+    assert view.created_at == Resource.from_dict(_item()).created_at
+    assert view.extra_metadata == {"license": "MIT"}
+    assert view.to_resource().id == "s1"
+
+
+def test_list_and_search_views():
+    """Test decoding list and search bodies into lazy views."""
+    listing = ResourceListView.from_json(
+        b'{"items": [{"id": "a", "name": "a"}, {"id": "b", "name": "b"}], "total": "2"}'
+    )
+    assert listing.total == 2 and listing.page == 1
+    assert [item.id for item in listing.items] == ["a", "b"]
+    assert [item.id for item in listing.items[1:]] == ["b"]
+
+    search = SearchResultView({"results": [_item()], "total": 1, "query": "web"})
+    assert search.results[0].type == "skill"
+    assert search.query == "web"
@@ -0,0 +1,129 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import RateLimitError
+from davybot_market_cli.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    parse_rates,
+    retry_after,
+    route_group,
+)
+from davybot_market_cli.tracing import SpanRecorder
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_reserve_and_pause():
+    """Test refills, queued reservations and pauses."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert bucket.tokens == pytest.approx(0.0)
+
+    bucket.pause(3)
+    assert bucket.reserve() == pytest.approx(3.5)
+    clock.now += 10
+    assert bucket.tokens == pytest.approx(2.0)
+
+
+def test_groups_and_parsing():
+    """Test route grouping, rate specs and Retry-After parsing."""
+    assert route_group("POST", "/search") == "search"
+    assert route_group("GET", "/{resource_type}s/{resource_id}/download") == "download"
+    assert route_group("GET", "/resources/{resource_id}/ratings") == "metadata"
+    assert parse_rates("search=5, download=0.5") == {"search": 5.0, "download": 0.5}
+    with pytest.raises(ValueError):
+        parse_rates("upload=1")
+    assert retry_after("7") == 7.0
+    assert retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=10) == pytest.approx(20)
+    assert retry_after("soon") is None
+
+
+def test_limiter_adapts_to_headers():
+    """Test that 429s slow a group down and successes recover it."""
+    clock = FakeClock()
+    limiter = RateLimiter({"search": 10}, clock=clock)
+    request = httpx.Request("POST", "http://market/api/v1/search")
+    bucket = limiter.buckets["search"]
+
+    limiter.observe("search", httpx.Response(429, headers={"Retry-After": "2"}, request=request))
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(2.2)
+
+    headers = {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "10"}
+    limiter.observe("search", httpx.Response(200, headers=headers, request=request))
+    assert bucket.rate == 3
+
+    for _ in range(100):
+        limiter.observe("search", httpx.Response(200, request=request))
+    assert bucket.rate == 10
+    assert limiter.buckets["metadata"].rate == 25
+
+
+def test_client_retries_throttled_requests():
+    """Test that the client waits out 429s and reports retries on the span."""
+    statuses = iter([429, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"}, json={"id": "s1"})
+
+    recorder = SpanRecorder()
+    limiter = RateLimiter(max_retries=3)
+    with DavybotMarketClient(
+        base_url="http://market/api/v1",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=limiter,
+        hooks=[recorder],
+    ) as client:
+        assert client.get_skill("s1") == {"id": "s1"}
+    assert recorder.spans[0].retries == 2
+
+    throttled = httpx.MockTransport(lambda request: httpx.Response(429, json={}))
+    with (
+        DavybotMarketClient(
+            base_url="http://market/api/v1",
+            transport=throttled,
+            rate_limiter=RateLimiter(max_retries=0),
+        ) as client,
+        pytest.raises(RateLimitError),
+    ):
+        client.get_skill("s1")
+
+
+def test_limiter_shared_by_async_tasks():
+    """Test that concurrent tasks together stay within the configured rate."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [], "total": 0})
+
+    async def run() -> float:
+        limiter = RateLimiter({"search": 50}, burst=0.1)
+        async with DavybotMarketClient(
+            base_url="http://market/api/v1",
+            async_transport=httpx.MockTransport(handler),
+            rate_limiter=limiter,
+        ) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(client.asearch("web") for _ in range(20)))
+            return time.perf_counter() - started
+
+    # 20 requests at 50/s with a burst of 5 take at least 0.3 s
+    assert asyncio.run(run()) >= 0.28
@@ -0,0 +1,74 @@
+"""Tests for rating iteration and cached summaries."""
+
+import httpx
+
+from davybot_market_cli.ratings import RatingAggregator, RatingsCache
+
+
+class RatingsServer:
+    """Ratings endpoint serving a newest-first list in pages."""
+
+    def __init__(self, ratings: list[dict]):
+        self.ratings = ratings
+        self.pages: list[int] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/resources/res-1/ratings"
+        skip, limit = int(request.url.params["skip"]), int(request.url.params["limit"])
+        self.pages.append(skip)
+        return httpx.Response(200, json=self.ratings[skip : skip + limit])
+
+
+def rating(i: int, score: int) -> dict:
+    return {"id": f"r{i}", "score": score, "created_at": f"2025-01-{i + 1:02d}T10:00:00Z"}
+
+
+def newest_first(ratings: list[dict]) -> list[dict]:
+    return sorted(ratings, key=lambda r: r["created_at"], reverse=True)
+
+
+def test_iterator_walks_all_pages(make_client):
+    """Test that the prefetching iterator yields every rating exactly once, in order."""
+    server = RatingsServer(newest_first([rating(i, i % 5 + 1) for i in range(23)]))
+    with make_client(server.handler) as client:
+        ratings = list(client.iter_resource_ratings("res-1", page_size=5))
+        assert ratings == server.ratings
+        assert sorted(server.pages) == [0, 5, 10, 15, 20]
+
+        server.pages.clear()
+        iterator = client.iter_resource_ratings("res-1", page_size=5, prefetch=False)
+        assert next(iterator) == server.ratings[0]
+        assert server.pages == [0]
+
+
+def test_aggregator_builds_distribution():
+    """Test distribution, average and that re-scored ratings replace their old score."""
+    aggregator = RatingAggregator("res-1")
+    for i, score in enumerate([5, 5, 4, 1]):
+        aggregator.add(rating(i, score))
+    aggregator.add({**rating(3, 5), "updated_at": "2025-02-01T00:00:00Z"})
+    summary = aggregator.result()
+    assert summary.total_ratings == 4
+    assert summary.rating_distribution == {4: 1, 5: 3}
+    assert summary.average_rating == 4.75
+    restored = RatingAggregator.from_dict(aggregator.to_dict())
+    assert restored.result() == summary and restored.last_rated == aggregator.last_rated
+
+
+def test_cache_reads_only_new_ratings(tmp_path, make_client):
+    """Test that a cached summary is refreshed by reading only newer ratings."""
+    server = RatingsServer(newest_first([rating(i, 5) for i in range(12)]))
+    with make_client(server.handler) as client, RatingsCache(tmp_path / "ratings.db") as cache:
+        first = cache.summary(client, "res-1", page_size=5)
+        assert first.total_ratings == 12 and first.rating_distribution == {5: 12}
+
+        server.pages.clear()
+        assert cache.summary(client, "res-1", page_size=5) == first
+        assert server.pages == [0]
+
+        server.ratings = newest_first(server.ratings + [rating(20, 1), rating(21, 2)])
+        server.pages.clear()
+        updated = cache.summary(client, "res-1", page_size=5)
+        assert server.pages == [0]
+        assert updated.total_ratings == 14
+        assert updated.rating_distribution == {1: 1, 2: 1, 5: 12}
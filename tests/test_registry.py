@@ -0,0 +1,51 @@
+"""Tests for the installed-resource registry."""
+
+from davybot_market_cli.registry import InstalledResource, Registry, find_outdated
+
+
+class FakeClient:
+    """Stand-in for DavybotMarketClient.check_updates with ETag support."""
+
+    def __init__(self, latest):
+        self.latest = latest
+        self.requests = []
+
+    def check_updates(self, resources, etag=None):
+        self.requests.append(etag)
+        if etag == "v1":
+            return None
+        items = [
+            {"type": r["type"], "id": r["id"], "version": self.latest[r["id"]]} for r in resources
+        ]
+        return {"items": items, "etag": "v1"}
+
+
+def _entry(resource_id, version):
+    return InstalledResource(
+        "skill", resource_id, f"{resource_id}-name", version, f"/x/{resource_id}"
+    )
+
+
+def test_lookup_by_id_and_name(tmp_path):
+    """Test that entries are found by ID or by name."""
+    with Registry(tmp_path / "registry.db") as registry:
+        registry.record(_entry("s1", "1.0.0"))
+
+        assert registry.get("skill", "s1").version == "1.0.0"
+        assert registry.get("skill", "s1-name").resource_id == "s1"
+        assert registry.get("agent", "s1") is None
+
+
+def test_find_outdated_uses_conditional_request(tmp_path):
+    """Test that a repeat check sends the stored ETag and reuses the result."""
+    client = FakeClient({"s1": "1.1.0", "s2": "2.0.0"})
+    with Registry(tmp_path / "registry.db") as registry:
+        registry.record(_entry("s1", "1.0.0"))
+        registry.record(_entry("s2", "2.0"))
+
+        first = find_outdated(client, registry)
+        second = find_outdated(client, registry)
+
+    assert client.requests == [None, "v1"]
+    assert [(entry.resource_id, latest) for entry, latest in first] == [("s1", "1.1.0")]
+    assert [(entry.resource_id, latest) for entry, latest in second] == [("s1", "1.1.0")]
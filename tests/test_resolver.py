@@ -0,0 +1,100 @@
+"""Tests for dependency resolution."""
+
+import pytest
+
+from davybot_market_cli.exceptions import ResolutionError
+from davybot_market_cli.resolver import DependencyResolver, satisfies
+
+
+class FakeClient:
+    """Minimal stand-in for DavybotMarketClient.get_resource."""
+
+    base_url = "http://market.test/api/v1"
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.calls = 0
+
+    def get_resource(self, resource_type, resource_id):
+        self.calls += 1
+        return dict(self.resources[f"{resource_type}://{resource_id}"])
+
+
+def _resource(resource_id, version="1.0.0", deps=None):
+    return {
+        "id": resource_id,
+        "name": resource_id,
+        "version": version,
+        "extra_metadata": {"dependencies": deps or []},
+    }
+
+
+def test_satisfies():
+    """Test version constraint matching."""
+    assert satisfies("1.2.0", ">=1.2,<2.0")
+    assert not satisfies("2.0", ">=1.2,<2.0")
+    assert satisfies("1.4.2", "~=1.4")
+    assert not satisfies("2.0.0", "~=1.4")
+    assert satisfies("1.0", "==1.0.0")
+
+
+def test_diamond_is_deduplicated_and_ordered():
+    """Test that a shared dependency appears once, before its dependents."""
+    client = FakeClient(
+        {
+            "agent://analyst": _resource("analyst", deps=["skill://fetch", "mcp://fs"]),
+            "skill://fetch": _resource("fetch", deps=["mcp://fs@>=0.3"]),
+            "mcp://fs": _resource("fs", version="0.3.1"),
+        }
+    )
+
+    resolution = DependencyResolver(client).resolve("agent", "analyst")
+    order = [node.key for node in resolution.install_order()]
+
+    assert order == ["mcp://fs", "skill://fetch", "agent://analyst"]
+    assert client.calls == 3
+
+
+def test_conflicting_constraints_pin_or_fail():
+    """Test that an exact pin is used when the latest version does not fit."""
+    resources = {
+        "agent://a": _resource("a", deps=["skill://s@==1.1"]),
+        "skill://s": _resource("s", version="2.0.0"),
+    }
+    resolution = DependencyResolver(FakeClient(resources)).resolve("agent", "a")
+    assert resolution.nodes["skill://s"].pinned
+    assert resolution.nodes["skill://s"].version == "1.1"
+
+    resources["agent://a"] = _resource("a", deps=["skill://s@<2"])
+    with pytest.raises(ResolutionError):
+        DependencyResolver(FakeClient(resources)).resolve("agent", "a")
+
+
+def test_cycle_is_rejected():
+    """Test that dependency cycles are reported."""
+    client = FakeClient(
+        {
+            "skill://a": _resource("a", deps=["skill://b"]),
+            "skill://b": _resource("b", deps=["skill://a"]),
+        }
+    )
+    with pytest.raises(ResolutionError, match="cycle"):
+        DependencyResolver(client).resolve("skill", "a")
+
+
+def test_resolution_is_cached(tmp_path):
+    """Test that a repeat resolve skips the metadata requests."""
+    client = FakeClient(
+        {
+            "agent://a": _resource("a", deps=["skill://s"]),
+            "skill://s": _resource("s"),
+        }
+    )
+    DependencyResolver(client, cache_dir=tmp_path).resolve("agent", "a")
+    calls = client.calls
+
+    cached = DependencyResolver(client, cache_dir=tmp_path).resolve("agent", "a")
+
+    assert cached.from_cache
+    assert client.calls == calls
+    assert [node.key for node in cached.install_order()] == ["skill://s", "agent://a"]
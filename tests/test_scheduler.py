@@ -0,0 +1,74 @@
+"""Tests for the download scheduler."""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.scheduler import DownloadScheduler, parse_rate
+
+
+def test_parse_rate():
+    """Test bandwidth parsing."""
+    assert parse_rate("500") == 500
+    assert parse_rate("2M") == 2 * 2**20
+    assert parse_rate("1.5KB/s") == 1536
+    with pytest.raises(ValueError):
+        parse_rate("fast")
+
+
+def test_better_ranked_transfers_preempt():
+    """Test that background and large transfers pause for urgent and small ones."""
+    scheduler = DownloadScheduler()
+    background = scheduler.transfer("kb", "background")
+    with background:
+        with scheduler.transfer("skill", "urgent"):
+            waiter = threading.Thread(target=background.throttle, args=(1024,))
+            waiter.start()
+            waiter.join(0.1)
+            assert waiter.is_alive()
+        waiter.join(1)
+        assert not waiter.is_alive()
+
+    large = scheduler.transfer("kb", size=scheduler.large_transfer + 1)
+    small = scheduler.transfer("skill", size=1024)
+    assert small.rank < large.rank < scheduler.transfer("sync", "background").rank
+
+
+def test_admission_order():
+    """Test that queued transfers wait for a slot unless they outrank the running ones."""
+    scheduler = DownloadScheduler(max_active=1)
+    admitted: list[str] = []
+
+    def run(name: str) -> None:
+        with scheduler.transfer(name):
+            admitted.append(name)
+
+    with scheduler.transfer("first"):
+        queued = threading.Thread(target=run, args=("queued",))
+        queued.start()
+        queued.join(0.1)
+        assert queued.is_alive()
+        with scheduler.transfer("urgent", "urgent"):
+            assert len(scheduler.active) == 2
+    queued.join(1)
+    assert admitted == ["queued"]
+    assert scheduler.status() == {"active": [], "waiting": 0}
+
+
+def test_client_download_is_shaped(tmp_path):
+    """Test that client downloads respect the global bandwidth budget."""
+    archive = b"x" * (512 * 1024)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=archive))
+    scheduler = DownloadScheduler(bandwidth=2**20)
+    with DavybotMarketClient(
+        base_url="http://market/api/v1", transport=transport, scheduler=scheduler
+    ) as client:
+        started = time.perf_counter()
+        path = client.download("knowledge", "kb1", tmp_path / "kb.zip", priority="background")
+        elapsed = time.perf_counter() - started
+    assert path.read_bytes() == archive
+    # 512 KiB at 1 MiB/s with a 256 KiB burst
+    assert elapsed >= 0.2
@@ -0,0 +1,103 @@
+"""Tests for the stale-while-revalidate search cache."""
+
+import json
+import threading
+import time
+
+import httpx
+from click.testing import CliRunner
+
+from davybot_market_cli.cli import cli
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.search_cache import SearchCache, cache_key
+from davybot_market_cli.tracing import SpanRecorder
+
+
+class SearchServer:
+    """Search endpoint numbering its responses."""
+
+    def __init__(self, delay: float = 0.0):
+        self.queries: list[str] = []
+        self.delay = delay
+        self.answered = threading.Event()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        self.queries.append(json.loads(request.content)["query"])
+        self.answered.set()
+        return httpx.Response(200, json={"results": [], "total": len(self.queries)})
+
+
+def test_hits_are_served_and_keys_normalized(tmp_path, make_client):
+    """Test that repeated (normalized) queries are answered from the cache."""
+    server = SearchServer()
+    recorder = SpanRecorder()
+    with (
+        make_client(server.handler, hooks=[recorder]) as client,
+        SearchCache(tmp_path / "s.db") as cache,
+    ):
+        assert cache.search(client, "Web  Scraping")["total"] == 1
+        assert cache.search(client, "web scraping ")["total"] == 1
+        assert cache.search(client, "web scraping", limit=5)["total"] == 2
+        assert cache.search(client, "web scraping", fresh=True)["total"] == 3
+        assert cache.search(client, "web scraping")["total"] == 3
+    assert len(server.queries) == 3
+    assert cache.stats["hits"] == 2 and cache.stats["misses"] == 3
+    assert [s.cache_hit for s in recorder.spans if s.kind == "cache"] == [True, True]
+    assert cache_key("u", None, "a", None, ["y", "x"], 1, 0) == cache_key(
+        "u", None, "A", None, ["x", "y"], 1, 0
+    )
+    assert len({cache_key("u", key, "a", None, None, 1, 0) for key in (None, "k1", "k2")}) == 3
+
+
+def test_stale_hit_refreshes_in_background(tmp_path, make_client):
+    """Test soft TTL (serve, then refresh) and hard TTL (wait for the API)."""
+    server = SearchServer(delay=0.2)
+    with make_client(server.handler) as client:
+        with SearchCache(tmp_path / "s.db", soft_ttl=0, hard_ttl=60) as cache:
+            cache.search(client, "agents")
+            server.answered.clear()
+            started = time.perf_counter()
+            assert cache.search(client, "agents")["total"] == 1
+            assert time.perf_counter() - started < 0.1
+            assert server.answered.wait(5)
+        assert cache.stats["stale_hits"] == 1 and cache.stats["refreshes"] == 1
+
+        with SearchCache(tmp_path / "s.db", soft_ttl=60, hard_ttl=60) as cache:
+            assert cache.search(client, "agents")["total"] == 2
+        with SearchCache(tmp_path / "s.db", soft_ttl=0, hard_ttl=0) as cache:
+            assert cache.search(client, "agents")["total"] == 3
+
+
+def test_lru_eviction(tmp_path, make_client):
+    """Test that the least recently used responses are evicted first."""
+    server = SearchServer()
+    with (
+        make_client(server.handler) as client,
+        SearchCache(tmp_path / "s.db", max_entries=2) as cache,
+    ):
+        cache.search(client, "a")
+        cache.search(client, "b")
+        cache.search(client, "a")
+        cache.search(client, "c")
+        cache.search(client, "a")
+        cache.search(client, "b")
+    assert server.queries == ["a", "b", "c", "b"]
+
+
+def test_search_command_fresh_flag(tmp_path, monkeypatch):
+    """Test that `davy search --fresh` bypasses the cache."""
+    server = SearchServer()
+    monkeypatch.setenv("DAVYBOT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("DAVYBOT_NO_DAEMON", "1")
+    monkeypatch.setattr(
+        "davybot_market_cli.utils.DavybotMarketClient",
+        lambda **kwargs: DavybotMarketClient(
+            **kwargs, transport=httpx.MockTransport(server.handler)
+        ),
+    )
+    runner = CliRunner()
+    for args in (["search", "x"], ["search", "x"], ["search", "x", "--fresh"]):
+        result = runner.invoke(cli, [*args, "--output", "json"])
+        assert result.exit_code == 0, result.output
+    assert server.queries == ["x", "x"]
@@ -0,0 +1,54 @@
+"""Tests for binary catalog snapshots."""
+
+import pytest
+
+from davybot_market_cli.exceptions import SnapshotError
+from davybot_market_cli.snapshot import CatalogSnapshot, write_snapshot
+
+ITEMS = [
+    {"id": "1", "name": "scraper", "type": "skill", "downloads": 10, "tags": ["web"]},
+    {"id": "2", "name": "analyst", "type": "agent", "downloads": 50, "rating": 3.5},
+    {"id": "3", "name": "crawler", "type": "skill", "downloads": 30, "tags": ["web", "ai"]},
+    {"id": "4", "name": "scraper", "type": "agent", "author": "jo", "tags": ["ai"]},
+]
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test that records, bitmaps and the name index survive a round trip."""
+    path = write_snapshot(ITEMS, tmp_path / "catalog.snap")
+
+    with CatalogSnapshot.open(path) as snapshot:
+        assert len(snapshot) == 4
+        assert snapshot.record(1).rating == 3.5
+        assert [r.id for r in snapshot.query(tags=["web"], sort_by="downloads")] == ["3", "1"]
+        assert [r.id for r in snapshot.query(resource_type="agent", tags=["ai"])] == ["4"]
+        assert snapshot.query(tags=["missing"]) == []
+        assert snapshot.find("scraper", "agent").author == "jo"
+        assert snapshot.find("scraper").tags == ["web"]
+        assert [r.tags for r in snapshot] == [["web"], [], ["web", "ai"], ["ai"]]
+        assert snapshot.find("nothing") is None
+
+
+def test_min_rating_keeps_records_at_the_threshold(tmp_path):
+    """Test that a rating equal to min_rating passes despite float32 storage."""
+    items = [
+        {"id": "1", "name": "a", "type": "skill", "rating": 4.7},
+        {"id": "2", "name": "b", "type": "skill", "rating": 4.8},
+        {"id": "3", "name": "c", "type": "skill", "rating": 4.6},
+    ]
+    path = write_snapshot(items, tmp_path / "catalog.snap")
+
+    with CatalogSnapshot.open(path) as snapshot:
+        assert [r.id for r in snapshot.query(min_rating=4.7)] == ["1", "2"]
+        assert [r.id for r in snapshot.query(min_rating=4.8, sort_by="rating")] == ["2"]
+
+
+def test_rejects_foreign_files(tmp_path):
+    """Test that non-snapshot files raise SnapshotError."""
+    path = tmp_path / "catalog.snap"
+    path.write_bytes(b"{}" * 100)
+
+    with pytest.raises(SnapshotError):
+        CatalogSnapshot.open(path)
+    with pytest.raises(SnapshotError):
+        CatalogSnapshot.open(tmp_path / "missing.snap")
@@ -0,0 +1,82 @@
+"""Tests for incremental decoding of JSON item arrays."""
+
+import json
+
+import httpx
+import pytest
+
+from davybot_market_cli._stream_json import ArrayItemParser, iter_items
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import NotFoundError
+
+ITEMS = [
+    {"id": "a", "name": 'x,]}"\\', "tags": ["é", "漢"], "metadata": {"k": [1, [2]]}},
+    15000000000.0,
+    "s",
+    None,
+    [],
+    True,
+    -0.25e-3,
+]
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+def test_items_match_json_loads_for_any_chunking(size):
+    """Test that elements and other fields decode the same however the body is split."""
+    document = {"meta": {"items": [9]}, "total": 7, "items": ITEMS, "page": 1}
+    parser = ArrayItemParser()
+    data = json.dumps(document, ensure_ascii=False).encode()
+
+    assert list(iter_items(chunked(data, size), parser)) == ITEMS
+    assert parser.fields == {"meta": {"items": [9]}, "total": 7, "page": 1}
+
+    bare = json.dumps(ITEMS).encode()
+    assert list(iter_items(chunked(bare, size))) == ITEMS
+
+
+def test_items_are_returned_as_they_arrive():
+    """Test that an element is available before the rest of the body."""
+    parser = ArrayItemParser()
+    assert parser.feed(b'{"total": 2, "results": [{"id": 1}, {"i') == [{"id": 1}]
+    assert parser.feed(b'd": 2}]}') == [{"id": 2}]
+    assert parser.close() == []
+    assert parser.fields == {"total": 2}
+
+
+@pytest.mark.parametrize(
+    "data", [b'{"items": [1, 2', b"[1,", b'{"a": "x', b"[1] x", b'{"items": [1, }]}', b"[1.]"]
+)
+def test_malformed_bodies_raise(data):
+    """Test that truncated or malformed bodies are reported."""
+    with pytest.raises(ValueError):
+        list(iter_items([data]))
+
+
+def test_client_streams_resources():
+    """Test that list and search iterators yield models from streamed responses."""
+    resources = [{"id": str(i), "name": f"r{i}", "type": "skill"} for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            assert json.loads(request.content)["limit"] == 5
+            body = {"results": resources, "total": 5}
+        elif request.url.path.endswith("/skills"):
+            body = {"items": resources, "total": 5}
+        else:
+            return httpx.Response(404)
+        return httpx.Response(200, json=body)
+
+    with DavybotMarketClient(
+        base_url="http://test/api/v1", transport=httpx.MockTransport(handler)
+    ) as client:
+        listed = list(client.iter_resources("skill", limit=5))
+        found = list(client.iter_search("r", limit=5))
+        with pytest.raises(NotFoundError):
+            list(client.iter_resources("agent"))
+
+    assert [r.id for r in listed] == [r.id for r in found] == [str(i) for i in range(5)]
+    assert listed[0].name == "r0"
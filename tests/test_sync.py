@@ -0,0 +1,99 @@
+"""Tests for delta configuration sync."""
+
+import json
+
+import httpx
+
+from davybot_market_cli.sync import SyncEngine, apply_patch, flatten
+from davybot_market_cli.types import SyncConfiguration
+
+
+class FakeServer:
+    """Sync endpoint that records requests and answers with canned remote changes."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.remote: list[dict] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.method == "PATCH" and request.url.path == "/api/v1/sync/configuration"
+        self.requests.append(json.loads(request.content))
+        remote, self.remote = self.remote, []
+        return httpx.Response(
+            200, json={"patch": remote, "lastSyncTime": f"2025-01-22T10:00:0{len(self.requests)}Z"}
+        )
+
+
+def test_sends_only_changed_keys(tmp_path, make_client):
+    """Test that the first sync sends everything, then only changed key paths."""
+    server = FakeServer()
+    config = SyncConfiguration(
+        preferences={"theme": "dark", "fontSize": 14}, agentSettings={"model": "a"}
+    )
+    with make_client(server.handler) as client:
+        engine = SyncEngine(client, state_path=tmp_path / "state.json")
+        result = engine.sync(config)
+        assert {op["path"] for op in server.requests[0]["patch"]} == set(flatten(config))
+        assert server.requests[0]["since"] is None
+
+        config = result.configuration
+        assert config.lastSyncTime == "2025-01-22T10:00:01Z"
+        assert engine.sync(config).skipped and len(server.requests) == 1
+
+        config.preferences["theme"] = "light"
+        del config.agentSettings["model"]
+        # A fresh engine reads the same state file
+        engine = SyncEngine(client, state_path=tmp_path / "state.json")
+        engine.sync(config)
+
+    patch = server.requests[1]["patch"]
+    assert server.requests[1]["since"] == "2025-01-22T10:00:01Z"
+    assert [(op["op"], op["path"]) for op in patch] == [
+        ("add", "/agentSettings"),
+        ("remove", "/agentSettings/model"),
+        ("replace", "/preferences/theme"),
+    ]
+    assert patch[2]["value"] == "light" and "timestamp" in patch[2]
+
+
+def test_conflicts_resolved_by_timestamp(tmp_path, make_client):
+    """Test that the later of two changes to the same key wins."""
+    server = FakeServer()
+    config = SyncConfiguration(preferences={"theme": "dark", "language": "en"})
+    with make_client(server.handler) as client:
+        engine = SyncEngine(client, state_path=tmp_path / "state.json")
+        config = engine.sync(config).configuration
+        config.preferences.update(theme="light", language="fr")
+        server.remote = [
+            {"op": "replace", "path": "/preferences/theme", "value": "solarized",
+             "timestamp": "2999-01-01T00:00:00Z"},
+            {"op": "replace", "path": "/preferences/language", "value": "de",
+             "timestamp": "2000-01-01T00:00:00Z"},
+            {"op": "add", "path": "/keybindings/save", "value": "ctrl+s",
+             "timestamp": "2000-01-01T00:00:00Z"},
+        ]  # fmt: skip
+        result = engine.sync(config)
+        assert engine.sync(result.configuration).skipped
+
+    assert result.configuration.preferences == {"theme": "solarized", "language": "fr"}
+    assert result.configuration.keybindings == {"save": "ctrl+s"}
+    assert {c.key: (c.localValue, c.remoteValue) for c in result.conflicts} == {
+        "preferences.theme": ("light", "solarized"),
+        "preferences.language": ("fr", "de"),
+    }
+    assert engine.status().status == "synced"
+
+
+def test_apply_patch_nested():
+    """Test patch application on nested settings."""
+    config = SyncConfiguration(toolSettings={"shell": {"timeout": 5}})
+    patched = apply_patch(
+        config,
+        [
+            {"op": "replace", "path": "/toolSettings/shell/timeout", "value": 10},
+            {"op": "add", "path": "/toolSettings/a~1b", "value": True},
+            {"op": "remove", "path": "/toolSettings/missing"},
+        ],
+    )
+    assert patched.toolSettings == {"shell": {"timeout": 10}, "a/b": True}
+    assert config.toolSettings == {"shell": {"timeout": 5}}
@@ -0,0 +1,101 @@
+"""Tests for request spans and trace hooks."""
+
+import asyncio
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import NotFoundError
+from davybot_market_cli.tracing import SpanRecorder, format_waterfall
+
+ARCHIVE = b"PK" * 200_000
+
+
+@pytest.fixture
+def base_url():
+    """Serve one skill and accept feedback over HTTP; every other path is a 404."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            found = self.path == "/api/v1/skills/web%2Fscraper"
+            body = json.dumps({"id": "s1", "name": "web-scraper"} if found else {}).encode()
+            if self.path.startswith("/api/v1/skills/s1/download"):
+                found, body = True, ARCHIVE
+            self.send_response(200 if found else 404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"feedbackId": "fb_1"}).encode()
+            self.send_response(201)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/api/v1"
+    server.shutdown()
+
+
+def test_requests_produce_spans(base_url):
+    """Test that spans carry the route template, status, size and phases."""
+    recorder = SpanRecorder()
+    with DavybotMarketClient(base_url=base_url, hooks=[recorder]) as client:
+        client.get_skill("web/scraper")
+        with pytest.raises(NotFoundError):
+            client.get_agent("missing")
+
+    ok, missing = recorder.spans
+    assert ok.name == "GET /{resource_type}s/{resource_id}"
+    assert ok.url.endswith("/skills/web%2Fscraper")
+    assert (ok.status, missing.status) == (200, 404)
+    assert ok.response_bytes == len(json.dumps({"id": "s1", "name": "web-scraper"}))
+    assert {"connect", "send", "wait"} <= set(ok.phases)
+    assert "connect" not in missing.phases  # connection reused
+
+    waterfall = format_waterfall(recorder.spans)
+    assert waterfall.count("GET /{resource_type}s/{resource_id}") == 2
+    assert waterfall.splitlines()[-1].startswith("total")
+
+
+def test_download_spans_cover_the_body(base_url, tmp_path):
+    """Test that streamed download spans end only after the body has been read."""
+    recorder = SpanRecorder()
+    with DavybotMarketClient(base_url=base_url, hooks=[recorder]) as client:
+        client.download("skill", "s1", tmp_path / "sync.zip")
+
+    async def adownload():
+        async with DavybotMarketClient(base_url=base_url, hooks=[recorder]) as client:
+            await client.adownload("skill", "s1", tmp_path / "async.zip")
+
+    asyncio.run(adownload())
+
+    assert (tmp_path / "sync.zip").read_bytes() == (tmp_path / "async.zip").read_bytes() == ARCHIVE
+    for span in recorder.spans:
+        assert span.response_bytes == len(ARCHIVE)
+        assert "transfer" in span.phases
+
+
+def test_streamed_request_bodies_are_traced(base_url):
+    """Test that multipart requests, which cannot be read back, get a span with their size."""
+    recorder = SpanRecorder()
+    screenshot = ("s.png", io.BytesIO(b"abc"), "image/png", {})
+    with DavybotMarketClient(base_url=base_url, hooks=[recorder]) as client:
+        result = client.submit_feedback({"type": "bug"}, [screenshot])
+
+    assert result == {"feedbackId": "fb_1"}
+    (span,) = recorder.spans
+    assert span.status == 201
+    assert span.request_bytes == span.request_decoded_bytes > len(b"abc")
@@ -0,0 +1,62 @@
+"""Tests for the record and replay transports."""
+
+import asyncio
+
+import pytest
+
+from davybot_market_cli.client import DavybotMarketClient
+from davybot_market_cli.exceptions import CassetteError
+from davybot_market_cli.testing import FakeMarketServer
+from davybot_market_cli.transport import (
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+    cassette_transport,
+)
+
+
+def test_record_then_replay(tmp_path):
+    """Test that recorded exchanges replay without a server, sync and async."""
+    path = tmp_path / "market.jsonl.gz"
+    with FakeMarketServer(resources=5, archive_size=2048) as server:
+        transport = cassette_transport(path)
+        assert isinstance(transport, RecordingTransport)
+        with DavybotMarketClient(base_url=server.base_url, transport=transport) as client:
+            found = client.search("resource", limit=3)
+            skill = client.get_skill("skill-00001")
+            client.download("skill", "skill-00001", tmp_path / "recorded.zip")
+        hits = sum(server.hits.values())
+
+    cassette = Cassette.load(path)
+    assert len(cassette.interactions) == hits == 3
+
+    replay = cassette_transport(path)
+    assert isinstance(replay, ReplayTransport)
+    with DavybotMarketClient(base_url="http://offline/api/v1", transport=replay) as client:
+        assert client.search("resource", limit=3) == found
+        assert client.get_skill("skill-00001") == skill
+        client.download("skill", "skill-00001", tmp_path / "replayed.zip")
+        # Recordings run out: the last response is repeated
+        assert client.get_skill("skill-00001") == skill
+        with pytest.raises(CassetteError):
+            client.get_skill("skill-00002")
+    assert (tmp_path / "replayed.zip").read_bytes() == (tmp_path / "recorded.zip").read_bytes()
+
+    async def fetch() -> dict:
+        async with DavybotMarketClient(
+            base_url="http://offline/api/v1", async_transport=ReplayTransport(cassette)
+        ) as client:
+            return await client.aget_resource("skill", "skill-00001")
+
+    assert asyncio.run(fetch()) == skill
+
+
+def test_bad_cassettes(tmp_path):
+    """Test that unreadable cassettes and unknown modes are reported."""
+    with pytest.raises(CassetteError):
+        ReplayTransport(tmp_path / "missing.jsonl.gz")
+    (tmp_path / "plain.txt").write_text("not a cassette")
+    with pytest.raises(CassetteError):
+        Cassette.load(tmp_path / "plain.txt")
+    with pytest.raises(ValueError):
+        cassette_transport(tmp_path / "x.jsonl.gz", mode="stream")